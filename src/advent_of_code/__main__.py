@@ -0,0 +1,291 @@
+import argparse
+import csv
+import dataclasses
+import functools
+import json
+import sys
+from pathlib import Path
+
+from advent_of_code.common.benchmark import (
+    BenchmarkHistory,
+    BenchmarkResult,
+    ScalingResult,
+    benchmark_scaling,
+    benchmark_solvers,
+    current_git_sha,
+)
+from advent_of_code.common.profiling import PROFILERS
+from advent_of_code.common.runners import (
+    SolverResult,
+    discover_solvers,
+    load_timings,
+    parse_range_spec,
+    run_solvers,
+    run_solvers_parallel,
+    save_timings,
+)
+from advent_of_code.generators import find_generator
+
+CACHE_DIR = Path.home() / ".cache" / "advent_of_code"
+DEFAULT_TIMINGS_PATH = CACHE_DIR / "timings.json"
+DEFAULT_PROFILE_DIR = CACHE_DIR / "profiles"
+DEFAULT_HISTORY_PATH = CACHE_DIR / "benchmarks.sqlite"
+FAILED_STATUSES = {"error", "timeout", "memory limit", "crashed"}
+
+
+def _format_memory(peak_memory: int | None) -> str:
+    if peak_memory is None:
+        return "-"
+    return f"{peak_memory / 2**20:.1f} MiB"
+
+
+def _print_result(result: SolverResult) -> None:
+    print(
+        f"{result.solver.id:<28} {result.status:<14} "
+        f"{result.wall_time:>9.3f}s {_format_memory(result.peak_memory):>12}"
+    )
+    for part in result.parts:
+        print(
+            f"    part {part.part}: {part.answer} "
+            f"({part.wall_time:.3f}s, {_format_memory(part.peak_memory)})"
+        )
+    if result.error is not None:
+        print(f"    {result.error}")
+    for name, calls in result.call_counts.items():
+        print(f"    {calls:>12,} calls to {name}")
+    for name, info in result.cache_stats.items():
+        print(
+            f"    {info.hits:>12,} hits, {info.misses:,} misses, "
+            f"{info.evictions:,} evictions in {name} cache"
+        )
+    if result.profile_summary:
+        for line in result.profile_summary.splitlines():
+            print(f"    {line}")
+    if result.profile_path is not None:
+        print(f"    profile written to {result.profile_path}")
+
+
+def _print_benchmark(result: BenchmarkResult) -> None:
+    if result.median is None or result.p95 is None:
+        print(f"{result.solver.id:<28} {result.status:<14} {result.error or ''}")
+        return
+    print(
+        f"{result.solver.id:<28} median {result.median:>9.4f}s "
+        f"p95 {result.p95:>9.4f}s {_format_memory(result.peak_memory):>12}"
+    )
+
+
+def _print_scaling_point(solver_id: str, size: int, result: BenchmarkResult) -> None:
+    if result.median is None:
+        print(f"{solver_id:<28} {size:>10} {result.status:<14} {result.error or ''}")
+        return
+    print(
+        f"{solver_id:<28} {size:>10} median {result.median:>9.4f}s "
+        f"{_format_memory(result.peak_memory):>12}"
+    )
+
+
+def _print_scaling(result: ScalingResult) -> None:
+    exponent = result.exponent
+    if exponent is not None:
+        print(f"{result.solver.id:<28} time ~ size^{exponent:.2f}")
+
+
+def _write_scaling_csv(path: Path, results: list[ScalingResult]) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["solver", "size", "status", "median", "p95", "peak_memory"])
+        for result in results:
+            for size, point in result.points:
+                writer.writerow(
+                    [
+                        result.solver.id,
+                        size,
+                        point.status,
+                        point.median,
+                        point.p95,
+                        point.peak_memory,
+                    ]
+                )
+
+
+def _parse_sizes(spec: str) -> list[int]:
+    return [int(size) for size in spec.split(",")]
+
+
+def _add_selection_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--years", type=parse_range_spec, help="e.g. 2019-2023")
+    parser.add_argument("--days", type=parse_range_spec, help="e.g. 1-25")
+
+
+def run_command(args: argparse.Namespace) -> int:
+    solvers = discover_solvers(args.years, args.days)
+    if args.jobs > 1:
+        results = run_solvers_parallel(
+            solvers,
+            jobs=args.jobs,
+            timings=load_timings(args.timings),
+            track_memory=not args.no_memory,
+            timeout=args.timeout,
+            memory_limit=args.memory_limit and args.memory_limit * 2**20,
+            on_result=_print_result,
+            profile=args.profile,
+            profile_dir=args.profile_dir,
+        )
+    else:
+        results = run_solvers(
+            solvers,
+            track_memory=not args.no_memory,
+            timeout=args.timeout,
+            on_result=_print_result,
+            profile=args.profile,
+            profile_dir=args.profile_dir,
+        )
+    if args.profile is None:
+        # profiling slows solvers down, so their times would skew scheduling
+        save_timings(args.timings, results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([dataclasses.asdict(result) for result in results], f, indent=2)
+    return int(any(result.status in FAILED_STATUSES for result in results))
+
+
+def bench_command(args: argparse.Namespace) -> int:
+    solvers = discover_solvers(args.years, args.days)
+    results = benchmark_solvers(
+        solvers,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        timeout=args.timeout,
+        on_result=_print_benchmark,
+    )
+    git_sha = current_git_sha()
+    history = BenchmarkHistory(args.history)
+    try:
+        regressions = history.find_regressions(git_sha, results, args.threshold)
+        history.record(git_sha, results)
+    finally:
+        history.close()
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.solver_id}: {regression.median:.4f}s vs "
+            f"{regression.baseline_median:.4f}s at {regression.baseline_sha[:12]} "
+            f"(+{regression.slowdown:.0%})"
+        )
+    return int(bool(regressions))
+
+
+def scale_command(args: argparse.Namespace) -> int:
+    results = []
+    for solver in discover_solvers(args.years, args.days):
+        input_generator = find_generator(solver)
+        if input_generator is None:
+            continue
+        result = benchmark_scaling(
+            solver,
+            functools.partial(input_generator.generate, seed=args.seed),
+            [size for size in args.sizes if size >= input_generator.min_size],
+            repeat=args.repeat,
+            warmup=args.warmup,
+            timeout=args.timeout,
+            on_point=functools.partial(_print_scaling_point, solver.id),
+        )
+        _print_scaling(result)
+        results.append(result)
+    if args.csv:
+        _write_scaling_csv(args.csv, results)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m advent_of_code")
+    subparsers = parser.add_subparsers(required=True)
+
+    run_parser = subparsers.add_parser("run", help="run solvers in-process")
+    _add_selection_args(run_parser)
+    run_parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip tracemalloc peak memory tracking",
+    )
+    run_parser.add_argument("--json", help="write structured results to this path")
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes; slowest solvers are scheduled first",
+    )
+    run_parser.add_argument(
+        "--timeout", type=float, help="per-solver time limit in seconds"
+    )
+    run_parser.add_argument(
+        "--memory-limit",
+        type=int,
+        help="per-solver address space limit in MiB (only with --jobs > 1)",
+    )
+    run_parser.add_argument(
+        "--timings",
+        type=Path,
+        default=DEFAULT_TIMINGS_PATH,
+        help="file of previous run times used for scheduling",
+    )
+    run_parser.add_argument(
+        "--profile",
+        choices=sorted(PROFILERS),
+        help="run under a profiler, also counting calls to @counted functions",
+    )
+    run_parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=DEFAULT_PROFILE_DIR,
+        help="where to write profiles: pstats for cprofile, otherwise "
+        "flamegraph collapsed stacks",
+    )
+    run_parser.set_defaults(command=run_command)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="benchmark solvers and track regressions"
+    )
+    _add_selection_args(bench_parser)
+    bench_parser.add_argument("--repeat", type=int, default=5)
+    bench_parser.add_argument("--warmup", type=int, default=1)
+    bench_parser.add_argument(
+        "--timeout", type=float, help="per-run time limit in seconds"
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="flag medians slower than the previous commit's by this fraction",
+    )
+    bench_parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY_PATH)
+    bench_parser.set_defaults(command=bench_command)
+
+    scale_parser = subparsers.add_parser(
+        "scale", help="benchmark solvers on generated inputs of increasing size"
+    )
+    _add_selection_args(scale_parser)
+    scale_parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        required=True,
+        help="comma-separated input sizes, e.g. 1000,10000,100000",
+    )
+    scale_parser.add_argument("--repeat", type=int, default=3)
+    scale_parser.add_argument("--warmup", type=int, default=0)
+    scale_parser.add_argument(
+        "--timeout", type=float, help="per-run time limit in seconds"
+    )
+    scale_parser.add_argument("--seed", type=int, default=0)
+    scale_parser.add_argument(
+        "--csv", type=Path, help="write (solver, size, time) rows for plotting"
+    )
+    scale_parser.set_defaults(command=scale_command)
+
+    args = parser.parse_args(argv)
+    return args.command(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,15 @@
+from advent_of_code.common.automata import *  # noqa: F403
+from advent_of_code.common.benchmark import *  # noqa: F403
 from advent_of_code.common.bits import *  # noqa: F403
+from advent_of_code.common.cycles import *  # noqa: F403
+from advent_of_code.common.disjoint_set import *  # noqa: F403
+from advent_of_code.common.hashing import *  # noqa: F403
 from advent_of_code.common.intervals import *  # noqa: F403
 from advent_of_code.common.io import *  # noqa: F403
 from advent_of_code.common.math import *  # noqa: F403
+from advent_of_code.common.memo import *  # noqa: F403
 from advent_of_code.common.nd import *  # noqa: F403
 from advent_of_code.common.parse import *  # noqa: F403
+from advent_of_code.common.profiling import *  # noqa: F403
 from advent_of_code.common.runners import *  # noqa: F403
+from advent_of_code.common.search import *  # noqa: F403
@@ -0,0 +1,235 @@
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from enum import Enum, auto
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+
+from advent_of_code.common.nd import (
+    EIGHT_POINT_DIRECTION_COORDS,
+    BaseCoords,
+    Coords,
+)
+
+__all__ = [
+    "Topology",
+    "GridAutomaton",
+    "Rule",
+    "life_rule",
+    "parse_cells",
+    "format_cells",
+]
+
+MOORE_NEIGHBOURHOOD = set(EIGHT_POINT_DIRECTION_COORDS)
+
+type Cells = npt.NDArray[np.uint8]
+# computes the next generation's cells from the current ones
+type Rule = Callable[["GridAutomaton", Cells], Cells]
+
+
+class Topology(Enum):
+    # cells beyond the edge are always 0
+    BOUNDED = auto()
+    # the edges wrap around
+    TOROIDAL = auto()
+    # unbounded: the grid grows whenever a non-zero cell comes near the edge
+    INFINITE = auto()
+
+
+def parse_cells(text: str, states: Mapping[str, int]) -> Cells:
+    """
+    A grid of text as a (rows, columns) uint8 array, with each character mapped
+    to its state.
+    """
+    lookup = np.zeros(256, dtype=np.uint8)
+    for char, state in states.items():
+        lookup[ord(char)] = state
+    rows = text.splitlines()
+    raw = np.frombuffer("".join(rows).encode(), dtype=np.uint8)
+    return lookup[raw].reshape(len(rows), len(rows[0]))
+
+
+def format_cells(cells: Cells, states: Mapping[str, int]) -> str:
+    chars = np.zeros(max(states.values()) + 1, dtype="<U1")
+    for char, state in states.items():
+        chars[state] = char
+    return "\n".join("".join(row) for row in chars[cells].tolist())
+
+
+class GridAutomaton:
+    """
+    A cellular automaton over a 2D uint8 array of cell states, indexed
+    [y, x], stepped by a pluggable rule that works on the whole grid at once.
+
+    Rules get neighbourhood information through `count_neighbours` and
+    `shifted`, which respect the topology, so a rule works unchanged on
+    bounded, toroidal or infinite grids.
+
+    Under the INFINITE topology the array is padded with empty cells before a
+    step if any non-zero cell is within `margin` of its edge; `origin` tracks
+    the coordinates of cells[0, 0] as the grid grows.
+    """
+
+    def __init__(
+        self,
+        cells: npt.ArrayLike,
+        rule: Rule,
+        topology: Topology = Topology.BOUNDED,
+        neighbourhood: Sequence[BaseCoords] = EIGHT_POINT_DIRECTION_COORDS,
+        margin: int = 1,
+    ) -> None:
+        self.cells: Cells = np.array(cells, dtype=np.uint8)
+        self.rule = rule
+        self.topology = topology
+        self.neighbourhood = neighbourhood
+        self.margin = margin
+        self.origin = Coords(0, 0)
+        self.generation = 0
+
+    @classmethod
+    def from_text(
+        cls, text: str, states: Mapping[str, int], rule: Rule, **kwargs
+    ) -> Self:
+        return cls(parse_cells(text, states), rule, **kwargs)
+
+    def to_text(self, states: Mapping[str, int]) -> str:
+        return format_cells(self.cells, states)
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def shifted[T: np.generic](
+        self, values: npt.NDArray[T], offset: BaseCoords
+    ) -> npt.NDArray[T]:
+        """
+        For every cell, the value at cell + offset, with 0 beyond a bounded edge.
+        """
+        if self.topology == Topology.TOROIDAL:
+            return np.roll(values, (-offset.y, -offset.x), axis=(0, 1))
+        height, width = values.shape
+        result = np.zeros_like(values)
+        dx, dy = offset.x, offset.y
+        if abs(dx) >= width or abs(dy) >= height:
+            return result
+        result[max(0, -dy) : height - max(0, dy), max(0, -dx) : width - max(0, dx)] = (
+            values[max(0, dy) : height + min(0, dy), max(0, dx) : width + min(0, dx)]
+        )
+        return result
+
+    def _padded(self, values: Cells, reach: int) -> Cells:
+        if self.topology == Topology.TOROIDAL:
+            return np.pad(values, reach, mode="wrap")
+        return np.pad(values, reach)
+
+    def count_neighbours(
+        self,
+        mask: npt.NDArray[np.bool_],
+        neighbourhood: Sequence[BaseCoords] | None = None,
+    ) -> Cells:
+        """
+        For every cell, how many of its neighbours are set in `mask`.
+        """
+        neighbourhood = self.neighbourhood if neighbourhood is None else neighbourhood
+        cells: Cells = (
+            mask.view(np.uint8) if mask.dtype == np.bool_ else mask.astype(np.uint8)
+        )
+        height, width = cells.shape
+        if set(neighbourhood) == MOORE_NEIGHBOURHOOD:
+            # the 3x3 box sum is separable into a vertical then a horizontal
+            # sum, which takes 4 additions rather than 8
+            padded = self._padded(cells, 1)
+            columns = padded[:-2] + padded[1:-1] + padded[2:]
+            counts = columns[:, :-2] + columns[:, 1:-1] + columns[:, 2:]
+            counts -= cells
+            return counts
+        reach = max(max(abs(offset.x), abs(offset.y)) for offset in neighbourhood)
+        padded = self._padded(cells, reach)
+        counts = np.zeros(cells.shape, dtype=np.uint8)
+        for offset in neighbourhood:
+            y, x = reach + offset.y, reach + offset.x
+            counts += padded[y : y + height, x : x + width]
+        return counts
+
+    def _grow(self) -> None:
+        margin = self.margin
+        cells = self.cells
+        if not cells.any():
+            return
+        if (
+            cells[:margin].any()
+            or cells[-margin:].any()
+            or cells[:, :margin].any()
+            or cells[:, -margin:].any()
+        ):
+            # grow by more than needed so that padding is only occasional
+            pad = max(margin, min(cells.shape) // 4)
+            self.cells = np.pad(cells, pad)
+            self.origin = Coords(self.origin.x - pad, self.origin.y - pad)
+
+    def step(self) -> Cells:
+        if self.topology == Topology.INFINITE:
+            self._grow()
+        self.cells = self.rule(self, self.cells)
+        self.generation += 1
+        return self.cells
+
+    def __iter__(self) -> Iterator[Cells]:
+        while True:
+            yield self.step()
+
+    def run(self, generations: int) -> Cells:
+        for _ in range(generations):
+            self.step()
+        return self.cells
+
+    def run_until_stable(self) -> int:
+        """
+        Step until a generation leaves every cell unchanged, returning the
+        number of that generation.
+        """
+        while True:
+            if self.topology == Topology.INFINITE:
+                # grow first so that growth is not mistaken for a change
+                self._grow()
+            previous = self.cells
+            if np.array_equal(self.step(), previous):
+                return self.generation
+
+    def bounding_box(self, state: int | None = None) -> tuple[slice, slice]:
+        """
+        The (rows, columns) slices of the smallest box holding every non-zero
+        cell, or every cell of the given state.
+        """
+        mask = self.cells != 0 if state is None else self.cells == state
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        if not len(rows):
+            return slice(0, 0), slice(0, 0)
+        return slice(rows[0], rows[-1] + 1), slice(cols[0], cols[-1] + 1)
+
+
+def life_rule(born: set[int], survive: set[int]) -> Rule:
+    """
+    A Life-like rule on 0/1 cells, e.g. Conway's Game of Life is born {3},
+    survive {2, 3}.
+    """
+
+    def any_of(counts: Cells, values: set[int]) -> npt.NDArray[np.bool_]:
+        # a few comparisons are much faster than a lookup table indexed by count
+        matches = np.zeros(counts.shape, dtype=np.bool_)
+        for value in values:
+            matches |= counts == value
+        return matches
+
+    def rule(automaton: GridAutomaton, cells: Cells) -> Cells:
+        alive = cells.astype(np.bool_)
+        counts = automaton.count_neighbours(alive)
+        next_alive = (alive & any_of(counts, survive)) | (~alive & any_of(counts, born))
+        return next_alive.view(np.uint8)
+
+    return rule
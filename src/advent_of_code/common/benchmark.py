@@ -0,0 +1,273 @@
+import math
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from advent_of_code.common.runners import INPUT_FILENAME, Solver, run_solver
+
+__all__ = [
+    "BenchmarkResult",
+    "BenchmarkHistory",
+    "Regression",
+    "ScalingResult",
+    "benchmark_scaling",
+    "benchmark_solver",
+    "benchmark_solvers",
+    "current_git_sha",
+    "memory_per_object",
+]
+
+
+@dataclass
+class BenchmarkResult:
+    solver: Solver
+    status: str = "ok"
+    samples: list[float] = field(default_factory=list)
+    peak_memory: int | None = None
+    error: str | None = None
+
+    @property
+    def median(self) -> float | None:
+        return statistics.median(self.samples) if self.samples else None
+
+    @property
+    def p95(self) -> float | None:
+        if len(self.samples) < 2:
+            return self.median
+        return statistics.quantiles(self.samples, n=20, method="inclusive")[18]
+
+
+@dataclass(frozen=True)
+class Regression:
+    solver_id: str
+    baseline_sha: str
+    baseline_median: float
+    median: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.median / self.baseline_median - 1
+
+
+@dataclass
+class ScalingResult:
+    solver: Solver
+    points: list[tuple[int, BenchmarkResult]] = field(default_factory=list)
+
+    @property
+    def exponent(self) -> float | None:
+        """
+        The fitted k in time ~ size**k: about 1 for a linear solver, 2 for a
+        quadratic one.
+        """
+        timed = [
+            (math.log(size), math.log(result.median))
+            for size, result in self.points
+            if result.median
+        ]
+        if len({log_size for log_size, _ in timed}) < 2:
+            return None
+        log_sizes, log_times = zip(*timed)
+        return statistics.linear_regression(log_sizes, log_times).slope
+
+
+def current_git_sha(cwd: str | Path | None = None) -> str:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--abbrev=40"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def benchmark_solver(
+    solver: Solver,
+    repeat: int = 5,
+    warmup: int = 1,
+    timeout: float | None = None,
+    input_dir: str | Path | None = None,
+) -> BenchmarkResult:
+    """
+    Time `repeat` runs of a solver after `warmup` discarded runs, then make one
+    extra run under tracemalloc for the peak memory, which is kept separate so
+    tracing overhead does not skew the timings.
+    """
+    result = BenchmarkResult(solver)
+    for run_no in range(warmup + repeat):
+        run_result = run_solver(
+            solver, track_memory=False, timeout=timeout, input_dir=input_dir
+        )
+        if run_result.status != "ok":
+            result.status = run_result.status
+            result.error = run_result.error
+            return result
+        if run_no >= warmup:
+            result.samples.append(run_result.wall_time)
+    result.peak_memory = run_solver(
+        solver, track_memory=True, timeout=timeout, input_dir=input_dir
+    ).peak_memory
+    return result
+
+
+def benchmark_scaling(
+    solver: Solver,
+    generate: Callable[[int], str],
+    sizes: Iterable[int],
+    repeat: int = 3,
+    warmup: int = 0,
+    timeout: float | None = None,
+    on_point: Callable[[int, BenchmarkResult], None] | None = None,
+) -> ScalingResult:
+    """
+    Benchmark a solver on generated inputs of increasing size. Sizes after the
+    first that fails (typically a timeout) are skipped, as they would only fail
+    more slowly.
+    """
+    scaling = ScalingResult(solver)
+    for size in sorted(sizes):
+        with tempfile.TemporaryDirectory() as input_dir:
+            (Path(input_dir) / INPUT_FILENAME).write_text(generate(size))
+            result = benchmark_solver(
+                solver,
+                repeat=repeat,
+                warmup=warmup,
+                timeout=timeout,
+                input_dir=input_dir,
+            )
+        scaling.points.append((size, result))
+        if on_point is not None:
+            on_point(size, result)
+        if result.status != "ok":
+            break
+    return scaling
+
+
+def memory_per_object(make: Callable[[int], object], count: int = 100_000) -> float:
+    """
+    The average bytes allocated for each of `count` objects made by
+    `make(0)`, `make(1)`... and held in a list, including the list's pointer to
+    it. Values stored in the objects are counted too, unless cached by Python
+    as small ints are.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [make(n) for n in range(count)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def benchmark_solvers(
+    solvers: Iterable[Solver],
+    repeat: int = 5,
+    warmup: int = 1,
+    timeout: float | None = None,
+    on_result: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    results = []
+    for solver in solvers:
+        result = benchmark_solver(solver, repeat=repeat, warmup=warmup, timeout=timeout)
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
+    return results
+
+
+class BenchmarkHistory:
+    """
+    SQLite store of benchmark runs, one row per solver per recorded run.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS benchmarks (
+            id INTEGER PRIMARY KEY,
+            git_sha TEXT NOT NULL,
+            recorded_at REAL NOT NULL,
+            solver_id TEXT NOT NULL,
+            median REAL NOT NULL,
+            p95 REAL NOT NULL,
+            peak_memory INTEGER,
+            samples INTEGER NOT NULL
+        )
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(self.SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def record(self, git_sha: str, results: Iterable[BenchmarkResult]) -> None:
+        recorded_at = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO benchmarks "
+                "(git_sha, recorded_at, solver_id, median, p95, peak_memory, samples) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        git_sha,
+                        recorded_at,
+                        result.solver.id,
+                        result.median,
+                        result.p95,
+                        result.peak_memory,
+                        len(result.samples),
+                    )
+                    for result in results
+                    if result.status == "ok"
+                ],
+            )
+
+    def baseline(self, solver_id: str, exclude_sha: str) -> tuple[str, float] | None:
+        """
+        The most recent (git sha, median) recorded for the solver at another commit.
+        """
+        return self.conn.execute(
+            "SELECT git_sha, median FROM benchmarks "
+            "WHERE solver_id = ? AND git_sha != ? "
+            "ORDER BY recorded_at DESC, id DESC LIMIT 1",
+            (solver_id, exclude_sha),
+        ).fetchone()
+
+    def find_regressions(
+        self, git_sha: str, results: Iterable[BenchmarkResult], threshold: float
+    ) -> list[Regression]:
+        """
+        Solvers whose median is more than `threshold` (a fraction, e.g. 0.1 for
+        10%) slower than their baseline from a different commit.
+        """
+        regressions = []
+        for result in results:
+            if result.median is None:
+                continue
+            baseline = self.baseline(result.solver.id, git_sha)
+            if baseline is None:
+                continue
+            baseline_sha, baseline_median = baseline
+            if result.median > baseline_median * (1 + threshold):
+                regressions.append(
+                    Regression(
+                        result.solver.id, baseline_sha, baseline_median, result.median
+                    )
+                )
+        return regressions
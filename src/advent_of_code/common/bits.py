@@ -1,4 +1,14 @@
-__all__ = ["int_to_binary", "int_to_hex", "binary_to_int", "iter_bits", "ones_mask"]
+from collections.abc import Sequence
+
+__all__ = [
+    "int_to_binary",
+    "int_to_hex",
+    "binary_to_int",
+    "iter_bits",
+    "ones_mask",
+    "gf2_solve",
+    "gf2_min_weight_solution",
+]
 
 
 def int_to_binary(int_: int, padding: int = 0) -> str:
@@ -23,3 +33,54 @@ def iter_bits(bitmask: int):
 
 def ones_mask(no_of_ones: int) -> int:
     return 2**no_of_ones - 1
+
+
+def gf2_solve(vectors: Sequence[int], target: int) -> tuple[int, list[int]] | None:
+    """
+    Solve for which of the bit vectors XOR to the target, by elimination over
+    GF(2). Solutions are bitmasks of vector indices: one solution, and a basis
+    of the null space, any combination of which XORed onto it is another.
+    None if no combination of the vectors makes the target.
+    """
+    # reduced vectors by their highest bit, with the vectors combined for each
+    basis: dict[int, tuple[int, int]] = {}
+    null_space = []
+    for idx, vector in enumerate(vectors):
+        combination = 1 << idx
+        while vector:
+            high_bit = vector.bit_length() - 1
+            if high_bit not in basis:
+                basis[high_bit] = (vector, combination)
+                break
+            basis_vector, basis_combination = basis[high_bit]
+            vector ^= basis_vector
+            combination ^= basis_combination
+        else:
+            null_space.append(combination)
+    solution = 0
+    while target:
+        high_bit = target.bit_length() - 1
+        if high_bit not in basis:
+            return None
+        basis_vector, basis_combination = basis[high_bit]
+        target ^= basis_vector
+        solution ^= basis_combination
+    return solution, null_space
+
+
+def gf2_min_weight_solution(vectors: Sequence[int], target: int) -> int | None:
+    """
+    The solution to `gf2_solve` using the fewest vectors, found by trying
+    every combination of the null space in Gray code order, so each differs
+    from the last by one null space vector.
+    """
+    solved = gf2_solve(vectors, target)
+    if solved is None:
+        return None
+    solution, null_space = solved
+    best = solution
+    for step in range(1, 1 << len(null_space)):
+        solution ^= null_space[(step & -step).bit_length() - 1]
+        if solution.bit_count() < best.bit_count():
+            best = solution
+    return best
@@ -0,0 +1,164 @@
+import hashlib
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Literal
+
+__all__ = [
+    "Cycle",
+    "CycleDetector",
+    "fingerprint",
+    "find_cycle",
+    "fast_forward",
+]
+
+
+def fingerprint(data: str | bytes) -> bytes:
+    """
+    A 128-bit digest of a state's text, to record in place of the state itself.
+    Collisions are negligible at any number of steps a puzzle could run for.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+@dataclass(frozen=True)
+class Cycle:
+    """
+    The state after `start` steps recurs every `length` steps from then on.
+    """
+
+    start: int
+    length: int
+
+    def equivalent_step(self, step_no: int) -> int:
+        """
+        The earliest step whose state is the same as after `step_no` steps.
+        """
+        if step_no < self.start:
+            return step_no
+        return self.start + (step_no - self.start) % self.length
+
+    def extrapolate(self, step_no: int, value_at: Callable[[int], int]) -> int:
+        """
+        A quantity after `step_no` steps, for quantities that grow by the same
+        amount every time round the cycle (e.g. the height of a growing tower).
+        `value_at` is only called with steps up to `start + length`.
+        """
+        equivalent = self.equivalent_step(step_no)
+        if equivalent == step_no:
+            return value_at(step_no)
+        growth = value_at(self.start + self.length) - value_at(self.start)
+        return value_at(equivalent) + growth * ((step_no - equivalent) // self.length)
+
+
+@dataclass
+class CycleDetector[K: Hashable]:
+    """
+    Incremental cycle detection for simulations stepped by the caller: add the
+    key of each state in turn, starting with the initial state, until a
+    repeated key returns the cycle.
+
+    Only keys are kept, so for large states use a compact key such as
+    `fingerprint` of the state's text.
+    """
+
+    _seen: dict[K, int] = field(default_factory=dict)
+
+    @property
+    def steps(self) -> int:
+        return len(self._seen)
+
+    def add(self, key: K) -> Cycle | None:
+        step_no = len(self._seen)
+        if (start := self._seen.get(key)) is not None:
+            return Cycle(start, step_no - start)
+        self._seen[key] = step_no
+        return None
+
+
+def _hash_cycle[S](
+    initial: S, step: Callable[[S], S], key: Callable[[S], Hashable]
+) -> Cycle:
+    detector: CycleDetector = CycleDetector()
+    state = initial
+    while (cycle := detector.add(key(state))) is None:
+        state = step(state)
+    return cycle
+
+
+def _brent_cycle[S](
+    initial: S, step: Callable[[S], S], key: Callable[[S], Hashable]
+) -> Cycle:
+    # find the length with a hare racing ahead of a tortoise that teleports to
+    # it at each power of two, holding only two states at a time
+    power = length = 1
+    tortoise = key(initial)
+    hare_state = step(initial)
+    while tortoise != (hare := key(hare_state)):
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare_state = step(hare_state)
+        length += 1
+
+    # then with the hare `length` steps ahead, walk both until they meet
+    tortoise_state = hare_state = initial
+    for _ in range(length):
+        hare_state = step(hare_state)
+    start = 0
+    while key(tortoise_state) != key(hare_state):
+        tortoise_state = step(tortoise_state)
+        hare_state = step(hare_state)
+        start += 1
+    return Cycle(start, length)
+
+
+def find_cycle[S](
+    initial: S,
+    step: Callable[[S], S],
+    key: Callable[[S], Hashable] = lambda state: state,
+    method: Literal["hash", "brent"] = "hash",
+) -> Cycle:
+    """
+    The cycle reached by repeatedly applying `step` from `initial`.
+
+    "hash" steps through the sequence once, remembering every state's key.
+    "brent" keeps only two states but steps through the sequence about three
+    times, and needs `step` to return new states rather than modify them.
+    """
+    if method == "brent":
+        return _brent_cycle(initial, step, key)
+    return _hash_cycle(initial, step, key)
+
+
+def fast_forward[S](
+    initial: S,
+    step: Callable[[S], S],
+    steps: int,
+    key: Callable[[S], Hashable] = lambda state: state,
+    method: Literal["hash", "brent"] = "hash",
+) -> S:
+    """
+    The state after `steps` applications of `step`, skipping whole cycles once
+    the sequence starts repeating, so e.g. a billion steps costs no more than
+    the steps until the first repeat plus one cycle.
+    """
+    if method == "brent":
+        cycle = _brent_cycle(initial, step, key)
+        state = initial
+        for _ in range(cycle.equivalent_step(steps)):
+            state = step(state)
+        return state
+
+    detector: CycleDetector = CycleDetector()
+    state = initial
+    for step_no in range(steps):
+        if (cycle := detector.add(key(state))) is not None:
+            # the current state recurs, so only the remainder needs stepping
+            for _ in range((steps - step_no) % cycle.length):
+                state = step(state)
+            return state
+        state = step(state)
+    return state
@@ -0,0 +1,60 @@
+__all__ = ["DisjointSet"]
+
+
+class DisjointSet:
+    """
+    Union-find over the items 0 to size - 1, each starting in its own set.
+    Finding an item's set compresses its path to the root, and unions attach
+    the smaller set to the larger, so both take near constant time. Set sizes
+    and the number of sets are kept as they change.
+    """
+
+    __slots__ = ("_parents", "_sizes", "sets")
+
+    def __init__(self, size: int) -> None:
+        self._parents = list(range(size))
+        # only meaningful for roots
+        self._sizes = [1] * size
+        self.sets = size
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def find(self, item: int) -> int:
+        parents = self._parents
+        root = item
+        while (parent := parents[root]) != root:
+            root = parent
+        while (parent := parents[item]) != root:
+            parents[item] = root
+            item = parent
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets of `a` and `b`, returning whether they were separate.
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        sizes = self._sizes
+        if sizes[root_a] < sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parents[root_b] = root_a
+        sizes[root_a] += sizes[root_b]
+        self.sets -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def size(self, item: int) -> int:
+        return self._sizes[self.find(item)]
+
+    def set_sizes(self) -> list[int]:
+        return [
+            size
+            for item, (parent, size) in enumerate(zip(self._parents, self._sizes))
+            if parent == item
+        ]
@@ -0,0 +1,180 @@
+import concurrent.futures
+import hashlib
+import itertools
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterator
+from dataclasses import dataclass
+
+__all__ = [
+    "HashStats",
+    "leading_zeros",
+    "md5_nonce_search",
+    "md5_hexdigests",
+]
+
+SEARCH_CHUNK_SIZE = 100_000
+HEXDIGEST_CHUNK_SIZE = 1_000
+
+
+@dataclass
+class HashStats:
+    hashes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        # hashes per second
+        return self.hashes / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.hashes:,} hashes in {self.elapsed:.2f}s ({self.rate:,.0f}/s)"
+
+
+class _LeadingZeros:
+    # picklable, to be sent to worker processes
+    def __init__(self, count: int) -> None:
+        self.count = count
+        whole_bytes, self._half_byte = divmod(count, 2)
+        # digests must start with this to match, which is checked first
+        self.prefix = bytes(whole_bytes)
+
+    def __call__(self, digest: bytes) -> bool:
+        return digest.startswith(self.prefix) and (
+            not self._half_byte or digest[len(self.prefix)] < 0x10
+        )
+
+
+def leading_zeros(count: int) -> Callable[[bytes], bool]:
+    """
+    Whether a raw digest's hex form starts with `count` zeros, checked on
+    the bytes without converting to hex.
+    """
+    return _LeadingZeros(count)
+
+
+def _search_chunk(
+    salt: bytes, match: Callable[[bytes], bool], start: int, stop: int
+) -> list[tuple[int, bytes]]:
+    # the salt is hashed once, and its state copied for each nonce
+    salted = hashlib.md5(salt)
+    prefix = getattr(match, "prefix", b"")
+    matches = []
+    for nonce in range(start, stop):
+        hasher = salted.copy()
+        hasher.update(b"%d" % nonce)
+        digest = hasher.digest()
+        if digest.startswith(prefix) and match(digest):
+            matches.append((nonce, digest))
+    return matches
+
+
+def _ordered_chunks[T](
+    task: Callable[..., list[T]],
+    args: tuple,
+    start: int,
+    chunk_size: int,
+    jobs: int | None,
+    stats: HashStats | None,
+    hashes_per_nonce: int = 1,
+) -> Iterator[list[T]]:
+    # task(*args, chunk_start, chunk_stop) for each chunk of nonces from
+    # start, in order, run ahead across a pool of processes unless there's
+    # only one job
+    chunk_starts = itertools.count(start, chunk_size)
+    last_recorded = time.perf_counter()
+
+    def record() -> None:
+        nonlocal last_recorded
+        if stats is not None:
+            now = time.perf_counter()
+            stats.hashes += chunk_size * hashes_per_nonce
+            stats.elapsed += now - last_recorded
+            last_recorded = now
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for chunk_start in chunk_starts:
+            chunk = task(*args, chunk_start, chunk_start + chunk_size)
+            record()
+            yield chunk
+        return
+    pool = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+    try:
+        # enough chunks in flight to keep every worker busy
+        pending: deque[concurrent.futures.Future[list[T]]] = deque()
+        while True:
+            while len(pending) < 2 * jobs:
+                chunk_start = next(chunk_starts)
+                pending.append(
+                    pool.submit(task, *args, chunk_start, chunk_start + chunk_size)
+                )
+            chunk = pending.popleft().result()
+            record()
+            yield chunk
+    finally:
+        # only waits for the chunks already being hashed
+        pool.shutdown(cancel_futures=True)
+
+
+def md5_nonce_search(
+    salt: str,
+    match: Callable[[bytes], bool],
+    start: int = 0,
+    jobs: int | None = 1,
+    stats: HashStats | None = None,
+    chunk_size: int = SEARCH_CHUNK_SIZE,
+) -> Generator[tuple[int, bytes]]:
+    """
+    Every nonce from `start` up whose MD5 digest of the salt then the nonce
+    (in decimal) satisfies `match`, with the raw digest, in nonce order.
+
+    With jobs other than 1, chunks of nonces are hashed ahead across a pool
+    of processes (None for one per CPU), so `match` must be picklable, as
+    `leading_zeros` is. Hashes counted in `stats` are those of every chunk
+    consumed, the last in full, but not of chunks hashed ahead and unused.
+    """
+    for chunk in _ordered_chunks(
+        _search_chunk, (salt.encode(), match), start, chunk_size, jobs, stats
+    ):
+        yield from chunk
+
+
+def _hexdigest_chunk(salt: bytes, stretch: int, start: int, stop: int) -> list[str]:
+    salted = hashlib.md5(salt)
+    hexdigests = []
+    for nonce in range(start, stop):
+        hasher = salted.copy()
+        hasher.update(b"%d" % nonce)
+        hexdigest = hasher.hexdigest()
+        for _ in range(stretch):
+            hexdigest = hashlib.md5(hexdigest.encode()).hexdigest()
+        hexdigests.append(hexdigest)
+    return hexdigests
+
+
+def md5_hexdigests(
+    salt: str,
+    start: int = 0,
+    stretch: int = 0,
+    jobs: int | None = 1,
+    stats: HashStats | None = None,
+    chunk_size: int = HEXDIGEST_CHUNK_SIZE,
+) -> Generator[str]:
+    """
+    The hex MD5 digest of the salt then each nonce from `start` up, in order,
+    each hashed again (as hex) `stretch` more times. With jobs other than 1,
+    chunks of nonces are hashed ahead across a pool of processes (None for
+    one per CPU).
+    """
+    for chunk in _ordered_chunks(
+        _hexdigest_chunk,
+        (salt.encode(), stretch),
+        start,
+        chunk_size,
+        jobs,
+        stats,
+        hashes_per_nonce=stretch + 1,
+    ):
+        yield from chunk
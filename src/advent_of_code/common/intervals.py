@@ -1,4 +1,11 @@
-__all__ = ["merge_intervals"]
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = ["merge_intervals", "IntervalIndex"]
 
 
 def merge_intervals(
@@ -17,3 +24,116 @@ def merge_intervals(
         else:
             left.extend((last_i, next_i))
     return left
+
+
+class IntervalIndex:
+    """
+    An immutable set of integers, held as the sorted, merged, inclusive
+    intervals `merge_intervals` gives, with their starts and ends kept apart
+    for bisecting, as lists and as arrays. Points are looked up in O(log n),
+    and many at once as arrays. Sets combine a pass over both sets' intervals
+    at a time.
+    """
+
+    __slots__ = ("intervals", "_starts", "_ends", "_start_array", "_end_array")
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()) -> None:
+        self._set_intervals(merge_intervals(list(intervals)))
+
+    @classmethod
+    def _from_merged(cls, intervals: list[tuple[int, int]]) -> Self:
+        index = cls.__new__(cls)
+        index._set_intervals(intervals)
+        return index
+
+    def _set_intervals(self, intervals: list[tuple[int, int]]) -> None:
+        self.intervals: list[tuple[int, int]] = intervals
+        self._starts = [start for start, _ in intervals]
+        self._ends = [end for _, end in intervals]
+        self._start_array = np.array(self._starts, dtype=np.int64)
+        # led by an end no point is at or below, for points before every start
+        self._end_array = np.array(
+            [np.iinfo(np.int64).min, *self._ends], dtype=np.int64
+        )
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self.intervals)
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalIndex):
+            return NotImplemented
+        return self.intervals == other.intervals
+
+    def __repr__(self) -> str:
+        return f"IntervalIndex({self.intervals!r})"
+
+    def __contains__(self, point: int) -> bool:
+        idx = bisect_right(self._starts, point) - 1
+        return idx >= 0 and point <= self._ends[idx]
+
+    def contains(self, points: npt.ArrayLike) -> npt.NDArray[np.bool_]:
+        """
+        Whether each of an array of points is in the set.
+
+        Each point is bisected for separately rather than found in one merge
+        pass with the intervals, as that would need the points sorted first,
+        costing more than the bisecting when there are far more points than
+        intervals.
+        """
+        points = np.asarray(points, dtype=np.int64)
+        idxs = np.searchsorted(self._start_array, points, "right")
+        return points <= self._end_array[idxs]
+
+    def count(self, points: npt.ArrayLike) -> int:
+        """
+        How many of an array of points are in the set.
+        """
+        return int(np.count_nonzero(self.contains(points)))
+
+    def total_length(self) -> int:
+        return sum(end - start + 1 for start, end in self.intervals)
+
+    def union(self, other: "IntervalIndex") -> "IntervalIndex":
+        return IntervalIndex(self.intervals + other.intervals)
+
+    def intersection(self, other: "IntervalIndex") -> "IntervalIndex":
+        intervals = []
+        ours, theirs = iter(self.intervals), iter(other.intervals)
+        our_interval, their_interval = next(ours, None), next(theirs, None)
+        while our_interval is not None and their_interval is not None:
+            start = max(our_interval[0], their_interval[0])
+            end = min(our_interval[1], their_interval[1])
+            if start <= end:
+                intervals.append((start, end))
+            # whichever ends first can't overlap anything further
+            if our_interval[1] < their_interval[1]:
+                our_interval = next(ours, None)
+            else:
+                their_interval = next(theirs, None)
+        return IntervalIndex._from_merged(intervals)
+
+    def difference(self, other: "IntervalIndex") -> "IntervalIndex":
+        intervals = []
+        theirs = iter(other.intervals)
+        their_interval = next(theirs, None)
+        for start, end in self.intervals:
+            # skip those entirely before this interval
+            while their_interval is not None and their_interval[1] < start:
+                their_interval = next(theirs, None)
+            while their_interval is not None and their_interval[0] <= end:
+                if their_interval[0] > start:
+                    intervals.append((start, their_interval[0] - 1))
+                start = their_interval[1] + 1
+                if their_interval[1] > end:
+                    break
+                their_interval = next(theirs, None)
+            if start <= end:
+                intervals.append((start, end))
+        return IntervalIndex._from_merged(intervals)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
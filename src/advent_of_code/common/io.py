@@ -1,6 +1,136 @@
-__all__ = ["read_file"]
+import mmap
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
 
+__all__ = [
+    "input_path",
+    "load_input",
+    "read_text",
+    "read_file",
+    "iter_lines",
+    "stream_lines",
+    "clear_input_cache",
+]
 
-def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read().rstrip("\n")
+INPUT_FILENAME = "input.txt"
+CR = ord("\r")
+PUZZLES_DIR = Path(__file__).parent.parent / "puzzles"
+# number of most recently loaded input files kept mapped
+INPUT_CACHE_SIZE = 8
+
+_cache: OrderedDict[tuple[Path, int, int], tuple[mmap.mmap | None, memoryview]] = (
+    OrderedDict()
+)
+
+
+def input_path(
+    year: int | None = None, day: int | None = None, path: str | Path | None = None
+) -> Path:
+    """
+    The input file for a puzzle: an explicit path, the input.txt in the given
+    year/day's puzzle directory, or by default input.txt in the current directory.
+    """
+    if path is not None:
+        return Path(path)
+    if year is not None and day is not None:
+        return PUZZLES_DIR / f"year_{year}" / f"day_{day:02}" / INPUT_FILENAME
+    if year is not None or day is not None:
+        raise ValueError("Both year and day are needed to locate an input")
+    return Path(INPUT_FILENAME)
+
+
+def _load(path: Path) -> tuple[mmap.mmap | None, memoryview]:
+    path = path.resolve()
+    stat = path.stat()
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    with open(path, "rb") as f:
+        if stat.st_size:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            entry = (mapped, memoryview(mapped))
+        else:
+            # empty files cannot be mapped
+            entry = (None, memoryview(b""))
+    _cache[key] = entry
+    if len(_cache) > INPUT_CACHE_SIZE:
+        # views may still be held by callers, so the map is left for the
+        # garbage collector to close rather than closed here
+        _cache.popitem(last=False)
+    return entry
+
+
+def load_input(
+    year: int | None = None, day: int | None = None, path: str | Path | None = None
+) -> memoryview:
+    """
+    The raw bytes of a puzzle input as a read-only view of a memory-mapped file.
+
+    Repeated loads of an unchanged file (e.g. for parts 1 and 2) reuse the same
+    mapping rather than reading the file again.
+    """
+    _, view = _load(input_path(year, day, path))
+    return view
+
+
+def read_text(
+    year: int | None = None, day: int | None = None, path: str | Path | None = None
+) -> str:
+    """
+    A puzzle input decoded as text, with line endings translated to "\\n" as
+    a file opened in text mode would.
+    """
+    text = str(load_input(year, day, path), "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_file(
+    year: int | None = None, day: int | None = None, path: str | Path | None = None
+) -> str:
+    return read_text(year, day, path).rstrip("\n")
+
+
+def iter_lines(
+    year: int | None = None, day: int | None = None, path: str | Path | None = None
+) -> Iterator[memoryview]:
+    """
+    Lines of a puzzle input, without line endings ("\\n" or "\\r\\n"), as
+    zero-copy views of the mapped file. Use bytes(line) or str(line, "utf-8")
+    to keep a line.
+    """
+    mapped, view = _load(input_path(year, day, path))
+    if mapped is None:
+        return
+    start = 0
+    end = len(view)
+    while start < end:
+        newline = mapped.find(b"\n", start)
+        if newline == -1:
+            newline = end
+        next_start = newline + 1
+        if newline > start and view[newline - 1] == CR:
+            newline -= 1
+        yield view[start:newline]
+        start = next_start
+
+
+def stream_lines(
+    year: int | None = None, day: int | None = None, path: str | Path | None = None
+) -> Iterator[str]:
+    """
+    Lines of a puzzle input, without line endings, read incrementally so that
+    inputs too large to hold in memory at once can be processed.
+    Nothing is cached.
+    """
+    with open(input_path(year, day, path)) as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def clear_input_cache() -> None:
+    _cache.clear()
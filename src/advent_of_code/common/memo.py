@@ -0,0 +1,544 @@
+import contextlib
+import functools
+import gc
+import pickle
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Hashable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, Protocol
+
+__all__ = [
+    "CacheInfo",
+    "Memoized",
+    "memoize",
+    "memo_scope",
+    "clear_caches",
+    "cache_stats",
+]
+
+_MISSING = object()
+# separates positional from keyword arguments in keys, as functools does
+_KWD_MARK = object()
+
+# every memoized function, so caches can be cleared between runs
+_MEMOIZED: "weakref.WeakSet[Memoized | _CachedFunction | _CachedMethod]" = (
+    weakref.WeakSet()
+)
+
+
+class _Function(Protocol):
+    # a function or method to memoize
+    __module__: str
+    __name__: str
+    __qualname__: str
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int | None
+
+
+class _UnboundedCache(dict[Hashable, Any]):
+    def set(self, key: Hashable, value: Any) -> int:
+        self[key] = value
+        return 0
+
+
+class _LRUCache:
+    """
+    Evicts the least recently used entry once `maxsize` entries are cached.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> int:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            return 1
+        return 0
+
+    def items(self) -> Iterator[tuple[Hashable, Any]]:
+        return iter(self._data.items())
+
+
+class _ARCCache:
+    """
+    Adaptive replacement (Megiddo and Modha): entries seen once and entries
+    seen again are kept in separate LRU lists, and the keys recently evicted
+    from each steer how much of `maxsize` goes to the first. A scan through
+    many keys used once then can't flush the entries that keep being reused,
+    as it would from an LRU cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        # target size of the recent list
+        self._target = 0
+        self._recent: OrderedDict[Hashable, Any] = OrderedDict()
+        self._frequent: OrderedDict[Hashable, Any] = OrderedDict()
+        # keys recently evicted from each list
+        self._recent_ghosts: OrderedDict[Hashable, None] = OrderedDict()
+        self._frequent_ghosts: OrderedDict[Hashable, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._recent) + len(self._frequent)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._recent.pop(key, _MISSING)
+        if value is not _MISSING:
+            self._frequent[key] = value
+            return value
+        value = self._frequent.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._frequent.move_to_end(key)
+        return value
+
+    def _replace(self, key: Hashable) -> int:
+        if len(self) < self.maxsize:
+            return 0
+        if self._recent and (
+            len(self._recent) > self._target
+            or (key in self._frequent_ghosts and len(self._recent) == self._target)
+            or not self._frequent
+        ):
+            evicted, _ = self._recent.popitem(last=False)
+            self._recent_ghosts[evicted] = None
+        else:
+            evicted, _ = self._frequent.popitem(last=False)
+            self._frequent_ghosts[evicted] = None
+        return 1
+
+    def set(self, key: Hashable, value: Any) -> int:
+        if key in self._recent or key in self._frequent:
+            self._recent.pop(key, None)
+            self._frequent[key] = value
+            self._frequent.move_to_end(key)
+            return 0
+        maxsize = self.maxsize
+        if key in self._recent_ghosts:
+            step = max(len(self._frequent_ghosts) // len(self._recent_ghosts), 1)
+            self._target = min(self._target + step, maxsize)
+            evictions = self._replace(key)
+            del self._recent_ghosts[key]
+            self._frequent[key] = value
+            return evictions
+        if key in self._frequent_ghosts:
+            step = max(len(self._recent_ghosts) // len(self._frequent_ghosts), 1)
+            self._target = max(self._target - step, 0)
+            evictions = self._replace(key)
+            del self._frequent_ghosts[key]
+            self._frequent[key] = value
+            return evictions
+        evictions = 0
+        recent_history = len(self._recent) + len(self._recent_ghosts)
+        if recent_history >= maxsize:
+            if len(self._recent) < maxsize:
+                self._recent_ghosts.popitem(last=False)
+                evictions = self._replace(key)
+            else:
+                self._recent.popitem(last=False)
+                evictions = 1
+        else:
+            history = recent_history + len(self._frequent) + len(self._frequent_ghosts)
+            if history >= maxsize:
+                if history >= 2 * maxsize:
+                    self._frequent_ghosts.popitem(last=False)
+                evictions = self._replace(key)
+        self._recent[key] = value
+        return evictions
+
+    def items(self) -> Iterator[tuple[Hashable, Any]]:
+        yield from self._recent.items()
+        yield from self._frequent.items()
+
+
+type _Cache = _UnboundedCache | _LRUCache | _ARCCache
+
+
+def _check_instance_dict(owner: type, name: str) -> None:
+    # per-instance caches are kept in the instance's __dict__
+    if not any("__dict__" in vars(cls) for cls in owner.__mro__):
+        raise TypeError(
+            f"cannot memoize {owner.__qualname__}.{name} per instance, "
+            "as its instances have no __dict__ (it is slotted)"
+        )
+
+
+class Memoized:
+    """
+    A function or method memoized with options that functools.lru_cache
+    lacks, made by `memoize`.
+
+    Methods get a cache per instance, kept in the instance's __dict__, so the
+    cache goes when the instance does. Slotted classes, whose instances have no
+    __dict__, are refused.
+    """
+
+    __qualname__: str
+    __wrapped__: _Function
+
+    def __init__(
+        self,
+        fn: _Function,
+        maxsize: int | None = None,
+        policy: Literal["lru", "arc"] = "lru",
+        key: Callable[..., Hashable] | None = None,
+        persist: str | Path | None = None,
+    ) -> None:
+        functools.update_wrapper(self, fn)
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+        self.persist = Path(persist) if persist is not None else None
+        self._cache: _Cache | None = None
+        self._instance_caches: weakref.WeakSet[_InstanceCache] = weakref.WeakSet()
+        self._attr = f"_memo_{fn.__name__}"
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        _MEMOIZED.add(self)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if self.persist is not None:
+            raise TypeError(f"cannot persist the per-instance caches of {name}")
+        _check_instance_dict(owner, name)
+        self._attr = f"_memo_{name}"
+
+    def _new_cache(self) -> _Cache:
+        if self.maxsize is None:
+            return _UnboundedCache()
+        if self.policy == "arc":
+            return _ARCCache(self.maxsize)
+        return _LRUCache(self.maxsize)
+
+    def _make_key(self, args: tuple, kwargs: dict[str, Any]) -> Hashable:
+        if self.key is not None:
+            return self.key(*args, **kwargs)
+        if kwargs:
+            return args + (_KWD_MARK,) + tuple(kwargs.items())
+        return args
+
+    def _miss(self, cache: _Cache, key: Hashable, args: tuple, kwargs: dict) -> Any:
+        self._misses += 1
+        value = self.__wrapped__(*args, **kwargs)
+        self._evictions += cache.set(key, value)
+        return value
+
+    # __call__ and _call_method look up hits inline, as another call would be
+    # a large part of their cost
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = self._new_cache()
+            self._load(cache)
+        key = self._make_key(args, kwargs)
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            return self._miss(cache, key, args, kwargs)
+        self._hits += 1
+        return value
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return functools.partial(self._call_method, instance)
+
+    def _call_method(self, instance: object, *args: Any, **kwargs: Any) -> Any:
+        # the instance is left out of the key, as each has its own cache
+        instance_cache = instance.__dict__.get(self._attr)
+        if instance_cache is None or instance_cache.instance is not instance:
+            # not yet cached, or a copy of another instance's cache
+            instance_cache = _InstanceCache(self, instance, self._new_cache())
+            instance.__dict__[self._attr] = instance_cache
+            self._instance_caches.add(instance_cache)
+        cache = instance_cache.cache
+        key = self._make_key(args, kwargs)
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            return self._miss(cache, key, (instance, *args), kwargs)
+        self._hits += 1
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        size = sum(len(cache.cache) for cache in self._instance_caches)
+        if self._cache is not None:
+            size += len(self._cache)
+        return CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=size,
+            maxsize=self.maxsize,
+        )
+
+    def cache_clear(self) -> None:
+        """
+        Empty every cache, saving a persisted one first, and reset the stats.
+        """
+        self.save()
+        self._cache = None
+        for instance_cache in list(self._instance_caches):
+            instance_cache.cache = self._new_cache()
+        self._hits = self._misses = self._evictions = 0
+
+    def _retire(self, instance_cache: "_InstanceCache") -> None:
+        # hits and misses are counted as they happen
+        pass
+
+    def _load(self, cache: _Cache) -> None:
+        if self.persist is None or not self.persist.exists():
+            return
+        with self.persist.open("rb") as f:
+            for key, value in pickle.load(f).items():
+                cache.set(key, value)
+
+    def save(self) -> None:
+        """
+        Write a persisted cache to disk, to be loaded on the first call in a
+        later run.
+        """
+        if self.persist is None or self._cache is None:
+            return
+        self.persist.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.persist.with_name(self.persist.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(dict(self._cache.items()), f)
+        tmp_path.replace(self.persist)
+
+
+def _lru_cache_info(info: Any) -> CacheInfo:
+    return CacheInfo(
+        hits=info.hits,
+        misses=info.misses,
+        evictions=info.misses - info.currsize,
+        size=info.currsize,
+        maxsize=info.maxsize,
+    )
+
+
+class _CachedFunction:
+    """
+    Gives a functools.lru_cache wrapper the stats and registration of a
+    Memoized function. Hits are then as cheap as with functools.cache, where
+    a Python-level wrapper would double the cost of each call.
+    """
+
+    def __init__(self, wrapper: Any) -> None:
+        self.__module__ = wrapper.__module__
+        self.__qualname__ = wrapper.__qualname__
+        self._cache_info = wrapper.cache_info
+        self._cache_clear = wrapper.cache_clear
+        wrapper.cache_info = self.cache_info
+        wrapper.cache_clear = self.cache_clear
+        _MEMOIZED.add(self)
+
+    def cache_info(self) -> CacheInfo:
+        return _lru_cache_info(self._cache_info())
+
+    def cache_clear(self) -> None:
+        self._cache_clear()
+
+    def save(self) -> None:
+        pass
+
+
+class _CachedMethod:
+    """
+    A method memoized with a functools.lru_cache per instance, kept in the
+    instance's __dict__ (so not of a slotted class), so hits cost little more
+    than with functools.cache and the cache goes when the instance does.
+
+    An instance and its cache refer to each other, so are freed by the cycle
+    collector rather than straight away; `memo_scope` runs it.
+    """
+
+    def __init__(self, fn: _Function, maxsize: int | None) -> None:
+        # as functools.update_wrapper would, which wants a callable wrapper
+        self.__module__ = fn.__module__
+        self.__name__ = fn.__name__
+        self.__qualname__ = fn.__qualname__
+        self.__doc__ = fn.__doc__
+        self.__wrapped__ = fn
+        self.maxsize = maxsize
+        self._attr = f"_memo_{fn.__name__}"
+        self._instance_caches: weakref.WeakSet[_InstanceCache] = weakref.WeakSet()
+        # stats of the caches of instances since freed
+        self._retired = CacheInfo(0, 0, 0, 0, maxsize)
+        _MEMOIZED.add(self)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        _check_instance_dict(owner, name)
+        self._attr = f"_memo_{name}"
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        instance_cache = instance.__dict__.get(self._attr)
+        if instance_cache is None or instance_cache.instance is not instance:
+            # not yet cached, or a copy of another instance's cache
+            cache = functools.lru_cache(self.maxsize)(
+                functools.partial(self.__wrapped__, instance)
+            )
+            instance_cache = _InstanceCache(self, instance, cache)
+            instance.__dict__[self._attr] = instance_cache
+            self._instance_caches.add(instance_cache)
+        return instance_cache.cache
+
+    def cache_info(self) -> CacheInfo:
+        hits, misses, evictions, size = 0, 0, 0, 0
+        for info in [
+            self._retired,
+            *(
+                _lru_cache_info(cache.cache.cache_info())
+                for cache in self._instance_caches
+            ),
+        ]:
+            hits += info.hits
+            misses += info.misses
+            evictions += info.evictions
+            size += info.size
+        return CacheInfo(hits, misses, evictions, size, self.maxsize)
+
+    def cache_clear(self) -> None:
+        for instance_cache in list(self._instance_caches):
+            instance_cache.cache.cache_clear()
+        self._retired = CacheInfo(0, 0, 0, 0, self.maxsize)
+
+    def _retire(self, instance_cache: "_InstanceCache") -> None:
+        info = _lru_cache_info(instance_cache.cache.cache_info())
+        retired = self._retired
+        self._retired = CacheInfo(
+            hits=retired.hits + info.hits,
+            misses=retired.misses + info.misses,
+            evictions=retired.evictions + info.evictions,
+            size=0,
+            maxsize=self.maxsize,
+        )
+
+    def save(self) -> None:
+        pass
+
+
+class _InstanceCache:
+    # an instance's cache for a memoized method, which hands its stats on to
+    # the method when the instance is freed
+    __slots__ = ("method", "instance", "cache", "__weakref__")
+
+    def __init__(
+        self, method: Memoized | _CachedMethod, instance: object, cache: Any
+    ) -> None:
+        self.method = method
+        self.instance = instance
+        self.cache = cache
+
+    def __del__(self) -> None:
+        self.method._retire(self)
+
+
+def _is_method(fn: _Function) -> bool:
+    # defined directly in a class body
+    scope, _, _ = fn.__qualname__.rpartition(".")
+    return bool(scope) and not scope.endswith("<locals>")
+
+
+def memoize(
+    fn: _Function | None = None,
+    *,
+    maxsize: int | None = None,
+    policy: Literal["lru", "arc"] = "lru",
+    key: Callable[..., Hashable] | None = None,
+    persist: str | Path | None = None,
+) -> Any:
+    """
+    Cache a function's results, as functools.cache does, but scoped to a run
+    and optionally bounded, for use as `@memoize` or `@memoize(...)`. Methods
+    are cached per instance, and never keep their instance alive.
+
+    Given a `maxsize`, the cache evicts entries by the "lru" or "arc" policy.
+    A `key` function is called with the same arguments (without `self`, for
+    methods) to give the key to cache on, which can be much cheaper to hash
+    than the arguments themselves, or leave out arguments that don't affect
+    the result. A function's cache can be `persist`ed to a pickle file between
+    runs, which is only valid if its results don't depend on the input.
+
+    Without a `key`, ARC or persistence, functools.lru_cache does the caching.
+    """
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    if policy not in ("lru", "arc"):
+        raise ValueError(f"unknown eviction policy {policy!r}")
+
+    def decorator(fn: _Function) -> Any:
+        if key is not None or persist is not None or (maxsize and policy == "arc"):
+            return Memoized(
+                fn, maxsize=maxsize, policy=policy, key=key, persist=persist
+            )
+        if _is_method(fn):
+            return _CachedMethod(fn, maxsize)
+        wrapper = functools.lru_cache(maxsize)(fn)
+        _CachedFunction(wrapper)
+        return wrapper
+
+    if fn is None:
+        return decorator
+    return decorator(fn)
+
+
+def clear_caches() -> None:
+    for memoized in list(_MEMOIZED):
+        memoized.cache_clear()
+
+
+def cache_stats() -> dict[str, CacheInfo]:
+    """
+    Stats for every memoized function used since its cache was last cleared,
+    by module and qualified name.
+    """
+    stats = {}
+    for memoized in list(_MEMOIZED):
+        info = memoized.cache_info()
+        if info.hits or info.misses:
+            stats[f"{memoized.__module__}.{memoized.__qualname__}"] = info
+    return dict(sorted(stats.items()))
+
+
+@contextlib.contextmanager
+def memo_scope() -> Generator[dict[str, CacheInfo]]:
+    """
+    Empty every cache before and after the block, so no results are carried
+    over between runs. The stats of the caches used within, including those
+    of instances since freed, are filled in on leaving.
+    """
+    clear_caches()
+    stats: dict[str, CacheInfo] = {}
+    try:
+        yield stats
+    finally:
+        # free the instances the block left behind, along with their caches
+        gc.collect()
+        stats.update(cache_stats())
+        clear_caches()
@@ -1,7 +1,12 @@
-from typing import Self
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Self, overload
 from enum import Enum, auto
 from dataclasses import dataclass
-from math import sqrt
+import itertools
+from math import isqrt, pi, prod, sqrt
+
+import numpy as np
+import numpy.typing as npt
 
 __all__ = [
     "BaseCoords",
@@ -18,11 +23,30 @@ __all__ = [
     "FOUR_POINT_CARDINAL_DIRECTION_TO_COORDS",
     "EIGHT_POINT_DIRECTION_COORDS",
     "turn_cardinal_direction",
+    "CoordsPool",
+    "CoordsArray",
+]
+
+# bound on the scratch memory used per chunk of a pairwise distance computation
+DISTANCE_CHUNK_BYTES = 64 * 2**20
+# candidate pairs compared at once when finding pairs by distance, each taking
+# about 64 bytes of scratch memory
+PAIR_CHUNK_SIZE = DISTANCE_CHUNK_BYTES // 64
+# pairs per point aimed for in each batch of pairs by distance
+PAIRS_PER_POINT = 4
+# cell offsets to compare a cell against so each neighbouring pair of cells is
+# compared once, those after the cell in (z, y, x) order
+HALF_NEIGHBOUR_CELLS = [
+    (dx, dy, dz)
+    for dz, dy, dx in itertools.product((-1, 0, 1), repeat=3)
+    if (dz, dy, dx) > (0, 0, 0)
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseCoords:
+    # slotted, as puzzles keep millions of these in sets and dicts: each takes
+    # about 40% less memory than one with an instance __dict__
     x: int
     y: int
     z: int = 0
@@ -30,6 +54,9 @@ class BaseCoords:
     def __add__(self, other: Self) -> Self:
         return type(self)(self.x + other.x, self.y + other.y, self.z + other.z)
 
+    def __sub__(self, other: Self) -> Self:
+        return type(self)(self.x - other.x, self.y - other.y, self.z - other.z)
+
     def __mul__(self, other: int) -> Self:
         return type(self)(self.x * other, self.y * other, self.z * other)
 
@@ -42,7 +69,7 @@ class BaseCoords:
         )
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Coords(BaseCoords):
     pass
 
@@ -50,6 +77,38 @@ class Coords(BaseCoords):
 START_COORDS = Coords(0, 0)
 
 
+class CoordsPool:
+    """
+    Interns the Coords of a width x height grid whose top left is `origin`, so
+    that however many sets and dicts hold a location they share one instance
+    of it. Instances are only created when first asked for. Locations outside
+    the grid are not interned.
+    """
+
+    def __init__(self, width: int, height: int, origin: Coords = START_COORDS):
+        self.width = width
+        self.height = height
+        self.origin = origin
+        self._pool: list[Coords | None] = [None] * (width * height)
+
+    def __len__(self) -> int:
+        return sum(coords is not None for coords in self._pool)
+
+    def get(self, x: int, y: int) -> Coords:
+        col = x - self.origin.x
+        row = y - self.origin.y
+        if not (0 <= col < self.width and 0 <= row < self.height):
+            return Coords(x, y)
+        index = row * self.width + col
+        coords = self._pool[index]
+        if coords is None:
+            coords = self._pool[index] = Coords(x, y)
+        return coords
+
+    def intern(self, coords: Coords) -> Coords:
+        return self.get(coords.x, coords.y)
+
+
 class Direction(Enum):
     UP = auto()
     RIGHT = auto()
@@ -128,3 +187,232 @@ def turn_cardinal_direction(
     dir_pos = FOUR_POINT_CARDINAL_DIRECTIONS.index(dir_)
     new_dir_pos = dir_pos + (offset * no_of_turns)
     return FOUR_POINT_CARDINAL_DIRECTIONS[new_dir_pos % 4]
+
+
+class CoordsArray:
+    """
+    A batch of coords stored structure-of-arrays style as an (N, 3) int64 array
+    of x, y, z columns, for vectorised arithmetic and distances over many points.
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, array: npt.ArrayLike) -> None:
+        array = np.asarray(array, dtype=np.int64)
+        if array.size == 0:
+            array = array.reshape(0, 3)
+        if array.ndim != 2 or array.shape[1] not in (2, 3):
+            raise ValueError(f"Expected an (N, 2) or (N, 3) array, got {array.shape}")
+        if array.shape[1] == 2:
+            array = np.column_stack([array, np.zeros(len(array), dtype=np.int64)])
+        self.array: npt.NDArray[np.int64] = array
+
+    @classmethod
+    def from_coords(cls, coords: Iterable[BaseCoords]) -> Self:
+        return cls([(c.x, c.y, c.z) for c in coords])
+
+    def to_coords(self, coords_cls: type[BaseCoords] = Coords) -> list[BaseCoords]:
+        return [coords_cls(x, y, z) for x, y, z in self.array.tolist()]
+
+    def to_set(self, coords_cls: type[BaseCoords] = Coords) -> set[BaseCoords]:
+        return set(self.to_coords(coords_cls))
+
+    @property
+    def x(self) -> npt.NDArray[np.int64]:
+        return self.array[:, 0]
+
+    @property
+    def y(self) -> npt.NDArray[np.int64]:
+        return self.array[:, 1]
+
+    @property
+    def z(self) -> npt.NDArray[np.int64]:
+        return self.array[:, 2]
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __iter__(self) -> Iterator[BaseCoords]:
+        return iter(self.to_coords())
+
+    @overload
+    def __getitem__(self, index: int) -> BaseCoords: ...
+
+    @overload
+    def __getitem__(self, index: slice | npt.ArrayLike) -> Self: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Coords(*self.array[index].tolist())
+        return type(self)(self.array[index])
+
+    def __repr__(self) -> str:
+        return f"CoordsArray({self.array.tolist()!r})"
+
+    @staticmethod
+    def _as_array(other: "CoordsArray | BaseCoords") -> npt.NDArray[np.int64]:
+        if isinstance(other, BaseCoords):
+            return np.array([other.x, other.y, other.z], dtype=np.int64)
+        return other.array
+
+    def __add__(self, other: "CoordsArray | BaseCoords") -> Self:
+        return type(self)(self.array + self._as_array(other))
+
+    def __sub__(self, other: "CoordsArray | BaseCoords") -> Self:
+        return type(self)(self.array - self._as_array(other))
+
+    def __mul__(self, other: int) -> Self:
+        return type(self)(self.array * other)
+
+    def unique(self) -> Self:
+        return type(self)(np.unique(self.array, axis=0))
+
+    def neighbours(
+        self, directions: Sequence[BaseCoords] = FOUR_POINT_DIRECTION_COORDS
+    ) -> Self:
+        """
+        Every point offset by every direction, ordered by point then direction,
+        so the neighbours of point i are rows i * len(directions) onwards.
+        """
+        offsets = CoordsArray.from_coords(directions).array
+        return type(self)((self.array[:, None, :] + offsets[None, :, :]).reshape(-1, 3))
+
+    def _chunk_rows(self, other: "CoordsArray") -> int:
+        # each chunk broadcasts to a (rows, len(other), 3) int64 array
+        return max(1, DISTANCE_CHUNK_BYTES // (max(len(other), 1) * 3 * 8))
+
+    def iter_difference_chunks(
+        self, other: "CoordsArray | None" = None, chunk_rows: int | None = None
+    ) -> Iterator[tuple[int, npt.NDArray[np.int64]]]:
+        """
+        (row offset, differences) for chunks of rows of this array against every
+        point of `other` (or this array), so pairwise work over many points can
+        be done with bounded memory. Differences have shape (rows, len(other), 3).
+        """
+        other = self if other is None else other
+        chunk_rows = chunk_rows or self._chunk_rows(other)
+        for start in range(0, len(self), chunk_rows):
+            chunk = self.array[start : start + chunk_rows]
+            yield start, chunk[:, None, :] - other.array[None, :, :]
+
+    def manhattan_distance_matrix(
+        self, other: "CoordsArray | None" = None, chunk_rows: int | None = None
+    ) -> npt.NDArray[np.int64]:
+        other = self if other is None else other
+        distances = np.empty((len(self), len(other)), dtype=np.int64)
+        for start, differences in self.iter_difference_chunks(other, chunk_rows):
+            distances[start : start + len(differences)] = np.abs(differences).sum(
+                axis=2
+            )
+        return distances
+
+    def squared_distance_matrix(
+        self, other: "CoordsArray | None" = None, chunk_rows: int | None = None
+    ) -> npt.NDArray[np.int64]:
+        """
+        Squared euclidean distances, which are exact and order the same as the
+        distances themselves.
+        """
+        other = self if other is None else other
+        distances = np.empty((len(self), len(other)), dtype=np.int64)
+        for start, differences in self.iter_difference_chunks(other, chunk_rows):
+            distances[start : start + len(differences)] = (differences**2).sum(axis=2)
+        return distances
+
+    def distance_matrix(
+        self, other: "CoordsArray | None" = None, chunk_rows: int | None = None
+    ) -> npt.NDArray[np.float64]:
+        return np.sqrt(self.squared_distance_matrix(other, chunk_rows))
+
+    def iter_pairs_by_distance(
+        self, batch_size: int | None = None
+    ) -> Iterator[tuple[npt.NDArray[np.int64], ...]]:
+        """
+        Every pair of points, as (squared distances, first indices, second
+        indices) arrays in batches, nearest first, ties ordered by index with
+        the first index lower. Each batch is found by bucketing points into a
+        grid of cells as wide as its furthest distance, so only neighbouring
+        cells are compared, and batches widen to about `batch_size` pairs
+        each (by default a few per point) until every pair has been given.
+        Pairs further than a batch that's been given are never compared.
+        """
+        if len(self) < 2:
+            return
+        batch_size = batch_size or PAIRS_PER_POINT * len(self)
+        extents = self.array.max(axis=0) - self.array.min(axis=0)
+        furthest = int((extents**2).sum())
+        # the radius that would take in a batch of pairs for points spread
+        # evenly, then grown to take in about as many more each batch
+        volume = prod(max(int(extent), 1) for extent in extents)
+        radius = (2 * batch_size * volume / (len(self) ** 2 * 4 / 3 * pi)) ** (1 / 3)
+        nearest = -1
+        while nearest < furthest:
+            within = min(max(int(radius * radius), nearest + 1), furthest)
+            pairs = self._pairs_by_distance(nearest, within)
+            if len(pairs[0]):
+                yield pairs
+            nearest = within
+            radius *= 2 ** (1 / 3)
+
+    def _pairs_by_distance(
+        self, beyond: int, within: int
+    ) -> tuple[npt.NDArray[np.int64], ...]:
+        # pairs with squared distances in (beyond, within], from a grid of
+        # cells at least as wide as the distance within, padded by a cell on
+        # each side so neighbouring cell numbers don't wrap
+        cells = (self.array - self.array.min(axis=0)) // (isqrt(within) + 1) + 1
+        width, depth, _ = cells.max(axis=0) + 2
+        cell_nos = cells[:, 0] + width * (cells[:, 1] + depth * cells[:, 2])
+        order = np.argsort(cell_nos, kind="stable")
+        cell_nos = cell_nos[order]
+        points = self.array[order]
+        # gathering from each column alone is quicker than from rows
+        columns = [np.ascontiguousarray(column) for column in points.T]
+        occupied, starts, counts = np.unique(
+            cell_nos, return_index=True, return_counts=True
+        )
+        ends = starts + counts
+        point_nos = np.arange(len(points))
+
+        def ranges() -> Iterator[tuple[npt.NDArray[np.int64], ...]]:
+            # the range of points to pair with each point from each cell
+            # compared: those after it in its own cell, then all those in
+            # each neighbouring cell
+            yield point_nos + 1, ends[np.searchsorted(occupied, cell_nos)]
+            for dx, dy, dz in HALF_NEIGHBOUR_CELLS:
+                neighbour_nos = cell_nos + dx + width * (dy + depth * dz)
+                found = np.searchsorted(occupied, neighbour_nos)
+                found = found.clip(max=len(occupied) - 1)
+                is_occupied = occupied[found] == neighbour_nos
+                yield (
+                    np.where(is_occupied, starts[found], 0),
+                    np.where(is_occupied, ends[found], 0),
+                )
+
+        batches = []
+        for seconds_from, seconds_to in ranges():
+            counts = seconds_to - seconds_from
+            totals = np.cumsum(counts)
+            splits = np.searchsorted(
+                totals, np.arange(PAIR_CHUNK_SIZE, totals[-1], PAIR_CHUNK_SIZE)
+            )
+            for start, stop in itertools.pairwise([0, *splits.tolist(), len(points)]):
+                chunk_counts = counts[start:stop]
+                firsts = np.repeat(point_nos[start:stop], chunk_counts)
+                seconds = np.arange(len(firsts)) + np.repeat(
+                    seconds_from[start:stop] - (np.cumsum(chunk_counts) - chunk_counts),
+                    chunk_counts,
+                )
+                distances = sum(
+                    (column[firsts] - column[seconds]) ** 2 for column in columns
+                )
+                kept = (beyond < distances) & (distances <= within)
+                batches.append((distances[kept], firsts[kept], seconds[kept]))
+
+        distances, firsts, seconds = (
+            np.concatenate(arrays) for arrays in zip(*batches)
+        )
+        firsts, seconds = order[firsts], order[seconds]
+        firsts, seconds = np.minimum(firsts, seconds), np.maximum(firsts, seconds)
+        by_distance = np.lexsort((seconds, firsts, distances))
+        return distances[by_distance], firsts[by_distance], seconds[by_distance]
@@ -0,0 +1,341 @@
+import contextlib
+import cProfile
+import functools
+import io
+import pstats
+import sys
+import threading
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable, Generator
+from pathlib import Path
+from types import FrameType
+from typing import Any, Protocol
+
+__all__ = [
+    "PROFILERS",
+    "Profiler",
+    "CProfiler",
+    "TracemallocProfiler",
+    "SamplingProfiler",
+    "counted",
+    "count_calls",
+    "format_collapsed",
+]
+
+_RUNNERS_FILE = str(Path(__file__).with_name("runners.py"))
+
+
+class _Countable(Protocol):
+    # a function, or a decorator's wrapper that binds to instances as one would
+    __module__: str
+    __qualname__: str
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
+
+    def __get__(self, instance: Any, owner: type | None = None, /) -> Any: ...
+
+
+# functions marked with @counted, by module and qualified name
+_COUNTED: dict[str, _Countable] = {}
+
+
+def counted[F: _Countable](fn: F) -> F:
+    """
+    Mark a hot function to have its calls counted in profiled runs.
+
+    The function itself is returned, so outside of `count_calls` this costs
+    nothing. Within it, a counting wrapper replaces the function in its module
+    or class, which also catches recursive calls. It must be the outermost
+    decorator (e.g. above @memoize, counting cache hits too) of a
+    module-level function or method.
+    """
+    _COUNTED[f"{fn.__module__}.{fn.__qualname__}"] = fn
+    return fn
+
+
+class _Counting:
+    # wraps a @counted callable; binds to instances as the callable would,
+    # so that memoized methods keep their per-instance caches
+    def __init__(self, fn: _Countable, name: str, counts: Counter[str]) -> None:
+        functools.update_wrapper(self, fn)
+        self._fn = fn
+        self._name = name
+        self._counts = counts
+
+    def __call__(self, *args, **kwargs):
+        self._counts[self._name] += 1
+        return self._fn(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return _Counting(self._fn.__get__(instance, owner), self._name, self._counts)
+
+
+@contextlib.contextmanager
+def count_calls() -> Generator[Counter[str]]:
+    """
+    Count calls to every @counted function while the block runs, by module
+    and qualified name.
+    """
+    counts: Counter[str] = Counter()
+    patched = []
+    try:
+        for name, fn in _COUNTED.items():
+            owner = sys.modules.get(fn.__module__)
+            *path, attr = fn.__qualname__.split(".")
+            for part in path:
+                owner = getattr(owner, part, None)
+            if owner is None or vars(owner).get(attr) is not fn:
+                raise ValueError(
+                    f"cannot count calls to {name}: @counted must be the "
+                    "outermost decorator of a module-level function or method"
+                )
+            setattr(owner, attr, _Counting(fn, name, counts))
+            patched.append((owner, attr, fn))
+        yield counts
+    finally:
+        for owner, attr, fn in patched:
+            setattr(owner, attr, fn)
+
+
+def format_collapsed(stacks: Counter[tuple[str, ...]]) -> str:
+    """
+    Stacks in the collapsed format read by flamegraph.pl, speedscope and
+    similar: each line is the frames from the root down, joined by ";", then
+    a space and the stack's weight.
+    """
+    return "".join(
+        f"{';'.join(stack)} {weight}\n"
+        for stack, weight in sorted(stacks.items())
+        if weight
+    )
+
+
+class Profiler(ABC):
+    """
+    Profiles a block of code run between `start` and `stop`. Runners call
+    `checkpoint` as each part's answer is printed.
+    """
+
+    suffix = ".txt"
+
+    @abstractmethod
+    def start(self) -> None: ...
+
+    @abstractmethod
+    def stop(self) -> None: ...
+
+    def checkpoint(self) -> None:
+        pass
+
+    @abstractmethod
+    def summary(self, limit: int = 10) -> str: ...
+
+    @abstractmethod
+    def write(self, path: Path) -> None: ...
+
+    @contextlib.contextmanager
+    def profiling(self) -> Generator[None]:
+        self.start()
+        try:
+            yield
+        finally:
+            self.stop()
+
+
+class CProfiler(Profiler):
+    """
+    Deterministic profiling of every call, written as pstats data for
+    snakeviz, gprof2dot or `python -m pstats`.
+    """
+
+    suffix = ".prof"
+
+    def __init__(self) -> None:
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+
+    def summary(self, limit: int = 10) -> str:
+        out = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=out)
+        stats.strip_dirs().sort_stats("tottime").print_stats(limit)
+        return out.getvalue()
+
+    def write(self, path: Path) -> None:
+        self._profile.dump_stats(path)
+
+
+def _frame_label(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}"
+
+
+class SamplingProfiler(Profiler):
+    """
+    Samples the profiled thread's stack every `interval` seconds from a
+    background thread, for collapsed stacks weighted by sample count. Only
+    frames below the one that called `start` are kept.
+
+    Samples can only be taken when the profiled thread releases the GIL, so
+    the thread switch interval is lowered to match while profiling.
+    """
+
+    suffix = ".collapsed"
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target = 0
+        self._root: FrameType | None = None
+        self._switch_interval = sys.getswitchinterval()
+
+    def start(self) -> None:
+        self._target = threading.get_ident()
+        # the frame that started profiling, past any context managers
+        root = sys._getframe(1)
+        while root.f_back is not None and root.f_globals.get("__name__") in (
+            __name__,
+            "contextlib",
+        ):
+            root = root.f_back
+        self._root = root
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+        self._root = None
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None and frame is not self._root:
+                if frame.f_globals.get("__name__") not in (__name__, "contextlib"):
+                    stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if self._stopped.is_set():
+                # the profiled block may have ended while sampling
+                break
+            if frame is not None and stack:
+                # within the profiled block
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def summary(self, limit: int = 10) -> str:
+        leaves: Counter[str] = Counter()
+        for stack, samples in self.stacks.items():
+            if stack:
+                leaves[stack[-1]] += samples
+        total = sum(leaves.values()) or 1
+        return "".join(
+            f"{samples / total:6.1%}  {label}\n"
+            for label, samples in leaves.most_common(limit)
+        )
+
+    def write(self, path: Path) -> None:
+        path.write_text(format_collapsed(self.stacks))
+
+
+class TracemallocProfiler(Profiler):
+    """
+    Where the memory in use was allocated, taken whenever a part's answer is
+    printed and at the end, keeping the snapshot with the most memory in use.
+    Written as collapsed stacks of source lines weighted by bytes, for a
+    memory flame graph.
+    """
+
+    suffix = ".collapsed"
+
+    def __init__(self, frames: int = 64) -> None:
+        self.frames = frames
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._size = 0
+        self._was_tracing = False
+
+    def start(self) -> None:
+        self._was_tracing = tracemalloc.is_tracing()
+        if self._was_tracing and tracemalloc.get_traceback_limit() < self.frames:
+            raise RuntimeError(
+                "tracemalloc is already tracing too few frames to profile"
+            )
+        tracemalloc.start(self.frames)
+
+    def checkpoint(self) -> None:
+        snapshot = tracemalloc.take_snapshot()
+        size = sum(trace.size for trace in snapshot.traces)
+        if self.snapshot is None or size > self._size:
+            self.snapshot = snapshot
+            self._size = size
+
+    def stop(self) -> None:
+        self.checkpoint()
+        if not self._was_tracing:
+            tracemalloc.stop()
+
+    @staticmethod
+    def _label(frame: tracemalloc.Frame) -> str:
+        path = Path(frame.filename)
+        parts = path.parts
+        if "advent_of_code" in parts:
+            path = Path(*parts[parts.index("advent_of_code") :])
+        else:
+            path = Path(path.name)
+        return f"{path.as_posix()}:{frame.lineno}"
+
+    def stacks(self) -> Counter[tuple[str, ...]]:
+        stacks: Counter[tuple[str, ...]] = Counter()
+        if self.snapshot is None:
+            return stacks
+        snapshot = self.snapshot.filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        for trace in snapshot.traces:
+            # oldest frame first; keep those below the runner, other than
+            # the code doing the profiling
+            frames = list(trace.traceback)
+            runner_frames = [
+                no for no, frame in enumerate(frames) if frame.filename == _RUNNERS_FILE
+            ]
+            if runner_frames:
+                frames = frames[runner_frames[-1] + 1 :]
+            stack = tuple(
+                self._label(frame)
+                for frame in frames
+                if frame.filename not in (contextlib.__file__, __file__)
+            )
+            stacks[stack] += trace.size
+        return stacks
+
+    def summary(self, limit: int = 10) -> str:
+        if self.snapshot is None:
+            return ""
+        return "".join(
+            f"{stat.size / 2**20:8.1f} MiB  {self._label(stat.traceback[0])}\n"
+            for stat in self.snapshot.statistics("lineno")[:limit]
+        )
+
+    def write(self, path: Path) -> None:
+        path.write_text(format_collapsed(self.stacks()))
+
+
+PROFILERS: dict[str, Callable[[], Profiler]] = {
+    "cprofile": CProfiler,
+    "tracemalloc": TracemallocProfiler,
+    "sampling": SamplingProfiler,
+}
@@ -1,8 +1,526 @@
+import ast
+import contextlib
+import importlib
+import importlib.util
+import inspect
+import io
+import json
+import math
+import pkgutil
+import re
+import signal
+import sys
+import threading
+import time
 import timeit
-from collections.abc import Callable
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
 
-__all__ = ["timed_run"]
+from advent_of_code.common.memo import CacheInfo, memo_scope
+from advent_of_code.common.profiling import PROFILERS, Profiler, count_calls
+
+__all__ = [
+    "timed_run",
+    "Solver",
+    "PartResult",
+    "SolverResult",
+    "discover_solvers",
+    "run_solver",
+    "run_solvers",
+    "run_solvers_parallel",
+    "parse_range_spec",
+    "load_timings",
+    "save_timings",
+]
+
+PUZZLES_PACKAGE = "advent_of_code.puzzles"
+INPUT_FILENAME = "input.txt"
+ENTRY_POINT_NAMES = ("run", "main")
+SOLVER_MODULE_PATTERN = re.compile(
+    r"advent_of_code\.puzzles\.year_(?P<year>\d{4})\.day_(?P<day>\d{2})\.(?P<variant>process\w*)"
+)
 
 
 def timed_run(fn: Callable) -> None:
-    print(f"Ran in {timeit.timeit(fn, number=1)} seconds.")
+    # to stderr, leaving stdout to the answers
+    print(f"Ran in {timeit.timeit(fn, number=1)} seconds.", file=sys.stderr)
+
+
+class SolverTimeout(Exception):
+    pass
+
+
+@dataclass(frozen=True, order=True)
+class Solver:
+    year: int
+    day: int
+    variant: str
+
+    @property
+    def module_name(self) -> str:
+        return f"{PUZZLES_PACKAGE}.year_{self.year}.day_{self.day:02}.{self.variant}"
+
+    @property
+    def id(self) -> str:
+        return f"{self.year}/{self.day:02}/{self.variant}"
+
+
+@dataclass
+class PartResult:
+    part: int
+    answer: str
+    wall_time: float
+    peak_memory: int | None
+
+
+@dataclass
+class SolverResult:
+    solver: Solver
+    status: str = "ok"
+    parts: list[PartResult] = field(default_factory=list)
+    wall_time: float = 0.0
+    peak_memory: int | None = None
+    error: str | None = None
+    # only filled in by profiled runs
+    call_counts: dict[str, int] = field(default_factory=dict)
+    cache_stats: dict[str, CacheInfo] = field(default_factory=dict)
+    profile_summary: str | None = None
+    profile_path: str | None = None
+
+
+def parse_range_spec(spec: str) -> set[int]:
+    """
+    Parse a range spec such as "2019-2023", "1,3,5" or "1-5,20-25" into a set of ints.
+    """
+    vals = set()
+    for raw_part in spec.split(","):
+        start, sep, end = raw_part.strip().partition("-")
+        vals.update(range(int(start), int(end if sep else start) + 1))
+    return vals
+
+
+def discover_solvers(
+    years: Iterable[int] | None = None, days: Iterable[int] | None = None
+) -> list[Solver]:
+    """
+    Find every process*.py module in the puzzles package, optionally filtered to
+    the given years and days. Modules are not imported here.
+    """
+    years = set(years) if years is not None else None
+    days = set(days) if days is not None else None
+    package = importlib.import_module(PUZZLES_PACKAGE)
+    solvers = []
+    for module_info in pkgutil.walk_packages(package.__path__, f"{PUZZLES_PACKAGE}."):
+        match = SOLVER_MODULE_PATTERN.fullmatch(module_info.name)
+        if match is None:
+            continue
+        solver = Solver(int(match["year"]), int(match["day"]), match["variant"])
+        if years is not None and solver.year not in years:
+            continue
+        if days is not None and solver.day not in days:
+            continue
+        solvers.append(solver)
+    return sorted(solvers)
+
+
+def _entry_point(module: ModuleType) -> Callable[[], object] | None:
+    # 2023+ modules wrap `run` in `main` via timed_run, so prefer calling `run`
+    # directly to leave the timing out of the run.
+    for name in ENTRY_POINT_NAMES:
+        fn = getattr(module, name, None)
+        if not callable(fn):
+            continue
+        params = inspect.signature(fn).parameters.values()
+        if all(param.default is not param.empty for param in params):
+            return fn
+    return None
+
+
+def _is_script(path: str) -> bool:
+    # modules that define no entry point, or call it themselves (as in
+    # `print(main())`), do their work as they are imported; this is told from
+    # the source so as not to run them early
+    tree = ast.parse(Path(path).read_bytes(), path)
+    defined = called = False
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in ENTRY_POINT_NAMES:
+            defined = True
+        elif isinstance(node, ast.Expr):
+            called = called or any(
+                isinstance(call, ast.Call)
+                and isinstance(call.func, ast.Name)
+                and call.func.id in ENTRY_POINT_NAMES
+                for call in ast.walk(node)
+            )
+    return called or not defined
+
+
+class _AnswerRecorder(io.TextIOBase):
+    """
+    Stdout replacement that treats each non-blank printed line as the answer
+    to the next part, timing it (and measuring peak memory) from the previous one.
+    """
+
+    def __init__(
+        self, track_memory: bool, on_part: Callable[[], None] | None = None
+    ) -> None:
+        self.track_memory = track_memory
+        self.on_part = on_part
+        self.parts: list[PartResult] = []
+        self._buffer = ""
+        self._mark = time.perf_counter()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        self._buffer += s
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            if line.strip():
+                self._record(line)
+        return len(s)
+
+    def _record(self, line: str) -> None:
+        now = time.perf_counter()
+        peak_memory = None
+        if self.track_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        self.parts.append(
+            PartResult(
+                part=len(self.parts) + 1,
+                answer=line.strip(),
+                wall_time=now - self._mark,
+                peak_memory=peak_memory,
+            )
+        )
+        self._mark = now
+        if self.on_part is not None:
+            self.on_part()
+
+    def close(self) -> None:
+        if self._buffer.strip():
+            self._record(self._buffer)
+        self._buffer = ""
+        super().close()
+
+
+@contextlib.contextmanager
+def _time_limit(timeout: float | None) -> Generator[None]:
+    # SIGALRM is only available on Unix and only deliverable to the main thread;
+    # elsewhere the solver simply runs unbounded.
+    if (
+        timeout is None
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def _raise_timeout(signum, frame):
+        raise SolverTimeout(f"exceeded {timeout} seconds")
+
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def run_solver(
+    solver: Solver,
+    track_memory: bool = True,
+    timeout: float | None = None,
+    input_dir: str | Path | None = None,
+    profile: str | None = None,
+    profile_dir: str | Path | None = None,
+) -> SolverResult:
+    """
+    Import a solver module and run its entry point in-process, from within the
+    puzzle directory so that its relative `input.txt` read resolves.
+    A different `input_dir` can be given to run against another input.
+    Script-style modules, without an entry point, are run by importing them,
+    or reloading them if already imported.
+
+    `profile` names one of PROFILERS to run the solver under, which also
+    counts calls to @counted functions and records the stats of @memoize
+    caches. The profile is summarised in the result and, given a
+    `profile_dir`, written there in full.
+
+    Memoized caches are emptied after the run, so that neither results nor
+    memory carry over into the next solver.
+    """
+    result = SolverResult(solver)
+    try:
+        spec = importlib.util.find_spec(solver.module_name)
+        if spec is None or spec.origin is None:
+            raise ModuleNotFoundError(f"no module named {solver.module_name!r}")
+        script = _is_script(spec.origin)
+    except Exception as e:
+        result.status = "error"
+        result.error = f"import failed: {e!r}"
+        return result
+
+    if input_dir is None:
+        input_dir = Path(spec.origin).parent
+    if not (Path(input_dir) / INPUT_FILENAME).exists():
+        result.status = "no input"
+        return result
+
+    entry_point = None
+    if not script:
+        try:
+            # as some modules read their input when imported, but anything
+            # they print then isn't an answer
+            with (
+                _time_limit(timeout),
+                contextlib.chdir(input_dir),
+                contextlib.redirect_stdout(io.StringIO()),
+            ):
+                module = importlib.import_module(solver.module_name)
+        except Exception as e:
+            result.status = "error"
+            result.error = f"import failed: {e!r}"
+            return result
+        entry_point = _entry_point(module)
+        if entry_point is None:
+            result.status = "no entry point"
+            return result
+
+    profiler = PROFILERS[profile]() if profile is not None else None
+    recorder = _AnswerRecorder(
+        track_memory, on_part=profiler.checkpoint if profiler is not None else None
+    )
+    peak_memories = []
+    call_counts: Counter[str] = Counter()
+    with contextlib.ExitStack() as profiling:
+        cache_stats = profiling.enter_context(memo_scope())
+        if profiler is not None:
+            try:
+                call_counts = profiling.enter_context(count_calls())
+                profiling.enter_context(profiler.profiling())
+            except (ValueError, RuntimeError) as e:
+                result.status = "error"
+                result.error = f"profiling failed: {e}"
+                return result
+        # the tracemalloc profiler is already tracing, and stops it itself
+        start_tracing = track_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            with (
+                _time_limit(timeout),
+                contextlib.chdir(input_dir),
+                contextlib.redirect_stdout(recorder),
+            ):
+                if entry_point is not None:
+                    entry_point()
+                elif solver.module_name in sys.modules:
+                    importlib.reload(sys.modules[solver.module_name])
+                else:
+                    importlib.import_module(solver.module_name)
+        except SolverTimeout as e:
+            result.status = "timeout"
+            result.error = str(e)
+        except MemoryError:
+            result.status = "memory limit"
+            result.error = "MemoryError"
+        except Exception as e:
+            result.status = "error"
+            result.error = repr(e)
+        finally:
+            result.wall_time = time.perf_counter() - start
+            recorder.close()
+            if track_memory:
+                _, peak_memory = tracemalloc.get_traced_memory()
+                peak_memories.append(peak_memory)
+            if start_tracing:
+                tracemalloc.stop()
+
+    result.parts = recorder.parts
+    if script and result.status == "ok" and not result.parts:
+        # a module with nothing to run
+        result.status = "no entry point"
+    if track_memory:
+        peak_memories.extend(part.peak_memory or 0 for part in result.parts)
+        result.peak_memory = max(peak_memories)
+    if profiler is not None:
+        result.cache_stats = cache_stats
+        _record_profile(result, profiler, call_counts, profile_dir)
+    return result
+
+
+def _record_profile(
+    result: SolverResult,
+    profiler: Profiler,
+    call_counts: Counter[str],
+    profile_dir: str | Path | None,
+) -> None:
+    result.call_counts = dict(call_counts.most_common())
+    result.profile_summary = profiler.summary()
+    if profile_dir is None:
+        return
+    solver = result.solver
+    path = (
+        Path(profile_dir)
+        / f"{solver.year}_{solver.day:02}_{solver.variant}{profiler.suffix}"
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.write(path)
+    result.profile_path = str(path)
+
+
+def run_solvers(
+    solvers: Iterable[Solver],
+    track_memory: bool = True,
+    timeout: float | None = None,
+    on_result: Callable[[SolverResult], None] | None = None,
+    profile: str | None = None,
+    profile_dir: str | Path | None = None,
+) -> list[SolverResult]:
+    """
+    Run the given solvers one after another in this interpreter.
+    """
+    results = []
+    for solver in solvers:
+        result = run_solver(
+            solver,
+            track_memory=track_memory,
+            timeout=timeout,
+            profile=profile,
+            profile_dir=profile_dir,
+        )
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
+    return results
+
+
+def load_timings(path: str | Path) -> dict[str, float]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_timings(path: str | Path, results: Iterable[SolverResult]) -> None:
+    """
+    Merge the wall times of successful runs into the timings file at path.
+    """
+    timings = load_timings(path)
+    for result in results:
+        if result.status == "ok":
+            timings[result.solver.id] = result.wall_time
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(dict(sorted(timings.items())), f, indent=2)
+
+
+def _limit_memory(memory_limit: int | None) -> None:
+    if memory_limit is None:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+
+def _run_solver_in_worker(
+    solver: Solver,
+    track_memory: bool,
+    timeout: float | None,
+    memory_limit: int | None,
+    profile: str | None,
+    profile_dir: str | Path | None,
+) -> SolverResult:
+    # Workers serve a single task each, so the address space cap only ever
+    # applies to the one solver and dies with the worker.
+    _limit_memory(memory_limit)
+    return run_solver(
+        solver,
+        track_memory=track_memory,
+        timeout=timeout,
+        profile=profile,
+        profile_dir=profile_dir,
+    )
+
+
+def _longest_first(
+    solvers: Iterable[Solver], timings: dict[str, float]
+) -> list[Solver]:
+    # Solvers without a recorded time may be arbitrarily slow, so start them first.
+    return sorted(solvers, key=lambda solver: -timings.get(solver.id, math.inf))
+
+
+def _run_pool(
+    solvers: list[Solver],
+    jobs: int,
+    worker_args: tuple,
+    on_result: Callable[[SolverResult], None] | None,
+) -> tuple[dict[Solver, SolverResult], list[Solver]]:
+    results = {}
+    crashed = []
+    with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as pool:
+        futures: dict[Future[SolverResult], Solver] = {
+            pool.submit(_run_solver_in_worker, solver, *worker_args): solver
+            for solver in solvers
+        }
+        for future in as_completed(futures):
+            solver = futures[future]
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                crashed.append(solver)
+                continue
+            results[solver] = result
+            if on_result is not None:
+                on_result(result)
+    return results, crashed
+
+
+def run_solvers_parallel(
+    solvers: Iterable[Solver],
+    jobs: int,
+    timings: dict[str, float] | None = None,
+    track_memory: bool = True,
+    timeout: float | None = None,
+    memory_limit: int | None = None,
+    on_result: Callable[[SolverResult], None] | None = None,
+    profile: str | None = None,
+    profile_dir: str | Path | None = None,
+) -> list[SolverResult]:
+    """
+    Run the given solvers across a pool of worker processes, scheduling the
+    longest-running solvers (per previously recorded timings) first.
+
+    A worker that dies outright (e.g. killed by the OS) breaks the whole pool.
+    Any solvers lost that way are rerun in isolation, one pool each, so only the
+    solver actually responsible is reported as crashed.
+    """
+    solvers = list(solvers)
+    worker_args = (track_memory, timeout, memory_limit, profile, profile_dir)
+    results, crashed = _run_pool(
+        _longest_first(solvers, timings or {}), jobs, worker_args, on_result
+    )
+    for solver in crashed:
+        retry_results, _ = _run_pool([solver], 1, worker_args, on_result)
+        if solver not in retry_results:
+            result = SolverResult(solver, status="crashed", error="worker died")
+            if on_result is not None:
+                on_result(result)
+            retry_results[solver] = result
+        results.update(retry_results)
+    return [results[solver] for solver in solvers]
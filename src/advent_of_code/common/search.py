@@ -0,0 +1,293 @@
+import heapq
+import time
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from math import prod
+from typing import Literal
+
+__all__ = [
+    "SearchStats",
+    "SearchResult",
+    "StatePacker",
+    "BucketQueue",
+    "bfs",
+    "dijkstra",
+    "astar",
+    "bidirectional_bfs",
+]
+
+
+@dataclass
+class SearchStats:
+    nodes_expanded: int = 0
+    peak_frontier: int = 0
+    elapsed: float = 0.0
+
+
+@dataclass
+class SearchResult[S: Hashable]:
+    """
+    The outcome of a search: the first goal state reached and its cost, or
+    None for both if no goal was reachable.
+
+    `distances` holds the cost of every state reached. For Dijkstra and A*
+    these are only final for states that were expanded; the others are the
+    best cost found so far.
+    """
+
+    goal: S | None
+    cost: int | None
+    distances: dict[S, int]
+    stats: SearchStats = field(default_factory=SearchStats)
+
+    @property
+    def found(self) -> bool:
+        return self.goal is not None
+
+
+class StatePacker:
+    """
+    Packs a tuple of small non-negative ints, e.g. (location, direction, steps),
+    into one int in mixed radix. Ints hash and compare much faster than tuples
+    or dataclasses, and make dict and set entries far smaller.
+    """
+
+    def __init__(self, *sizes: int) -> None:
+        self.sizes = sizes
+
+    @property
+    def size(self) -> int:
+        # one more than the largest packed state
+        return prod(self.sizes)
+
+    def pack(self, *values: int) -> int:
+        state = 0
+        for value, size in zip(values, self.sizes, strict=True):
+            state = state * size + value
+        return state
+
+    def unpack(self, state: int) -> tuple[int, ...]:
+        values = []
+        for size in reversed(self.sizes):
+            state, value = divmod(state, size)
+            values.append(value)
+        return tuple(reversed(values))
+
+
+class BucketQueue[T]:
+    """
+    A priority queue for small non-negative integer priorities that never go
+    below the last one popped, as in Dijkstra with integer weights (Dial's
+    algorithm). Pushes and pops are O(1), with one list per priority value.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: list[list[T]] = []
+        self._current = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, priority: int, item: T) -> None:
+        if priority < self._current:
+            raise ValueError(
+                f"priority {priority} is below the last popped priority {self._current}"
+            )
+        if priority >= len(self._buckets):
+            self._buckets.extend([] for _ in range(priority - len(self._buckets) + 1))
+        self._buckets[priority].append(item)
+        self._size += 1
+
+    def pop(self) -> tuple[int, T]:
+        if not self._size:
+            raise IndexError("pop from an empty bucket queue")
+        while not self._buckets[self._current]:
+            self._current += 1
+        self._size -= 1
+        return self._current, self._buckets[self._current].pop()
+
+
+class _HeapQueue[T]:
+    # ties are broken by comparing items, which is cheap for integer states
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, T]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, priority: int, item: T) -> None:
+        heapq.heappush(self._heap, (priority, item))
+
+    def pop(self) -> tuple[int, T]:
+        return heapq.heappop(self._heap)
+
+
+def bfs[S: Hashable](
+    start: S,
+    neighbours: Callable[[S], Iterable[S]],
+    is_goal: Callable[[S], bool] | None = None,
+    max_depth: int | None = None,
+) -> SearchResult[S]:
+    """
+    Breadth-first search from `start`, a level at a time, stopping at the
+    first state satisfying `is_goal`. Without a goal, every state within
+    `max_depth` steps (or every reachable state) is visited, and their
+    distances returned.
+    """
+    started = time.perf_counter()
+    stats = SearchStats()
+    distances = {start: 0}
+    frontier = [start]
+    depth = 0
+    while frontier:
+        stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+        next_frontier = []
+        for state in frontier:
+            if is_goal is not None and is_goal(state):
+                stats.elapsed = time.perf_counter() - started
+                return SearchResult(state, depth, distances, stats)
+            stats.nodes_expanded += 1
+            if depth == max_depth:
+                continue
+            for next_state in neighbours(state):
+                if next_state not in distances:
+                    distances[next_state] = depth + 1
+                    next_frontier.append(next_state)
+        frontier = next_frontier
+        depth += 1
+    stats.elapsed = time.perf_counter() - started
+    return SearchResult(None, None, distances, stats)
+
+
+def dijkstra[S: Hashable](
+    start: S,
+    neighbours: Callable[[S], Iterable[tuple[S, int]]],
+    is_goal: Callable[[S], bool] | None = None,
+    heuristic: Callable[[S], int] | None = None,
+    queue: Literal["heap", "bucket"] = "heap",
+) -> SearchResult[S]:
+    """
+    Cheapest-first search from `start`, where `neighbours` gives each next
+    state with the non-negative cost of moving to it. Stops at the first state
+    satisfying `is_goal`, or else finds the cost of every reachable state.
+
+    With an admissible `heuristic` (one that never overestimates the remaining
+    cost to a goal) this is A*. If the heuristic is not also consistent (never
+    dropping by more than the cost of a step, as the Manhattan distance on a
+    grid does not), a cheaper path may be found to a state already expanded,
+    which is then expanded again. The "bucket" queue is faster for small
+    integer costs, but needs a consistent heuristic so that priorities never
+    decrease. States must be orderable for the "heap" queue, to break ties.
+    """
+    started = time.perf_counter()
+    stats = SearchStats()
+    frontier = BucketQueue[S]() if queue == "bucket" else _HeapQueue[S]()
+    distances = {start: 0}
+    # the cost each state was last expanded at
+    expanded: dict[S, int] = {}
+    frontier.push(heuristic(start) if heuristic else 0, start)
+    while frontier:
+        stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+        _, state = frontier.pop()
+        cost = distances[state]
+        if expanded.get(state) == cost:
+            # a stale entry, superseded by a cheaper one
+            continue
+        if is_goal is not None and is_goal(state):
+            stats.elapsed = time.perf_counter() - started
+            return SearchResult(state, cost, distances, stats)
+        expanded[state] = cost
+        stats.nodes_expanded += 1
+        for next_state, step_cost in neighbours(state):
+            next_cost = cost + step_cost
+            if next_cost < distances.get(next_state, next_cost + 1):
+                distances[next_state] = next_cost
+                if heuristic is not None:
+                    frontier.push(next_cost + heuristic(next_state), next_state)
+                else:
+                    frontier.push(next_cost, next_state)
+    stats.elapsed = time.perf_counter() - started
+    return SearchResult(None, None, distances, stats)
+
+
+def astar[S: Hashable](
+    start: S,
+    neighbours: Callable[[S], Iterable[tuple[S, int]]],
+    is_goal: Callable[[S], bool],
+    heuristic: Callable[[S], int],
+    queue: Literal["heap", "bucket"] = "heap",
+) -> SearchResult[S]:
+    return dijkstra(start, neighbours, is_goal, heuristic, queue)
+
+
+def bidirectional_bfs[S: Hashable](
+    start: S,
+    target: S,
+    neighbours: Callable[[S], Iterable[S]],
+    reverse_neighbours: Callable[[S], Iterable[S]] | None = None,
+) -> SearchResult[S]:
+    """
+    The fewest steps from `start` to `target`, searching forwards from the
+    start and backwards from the target (by `reverse_neighbours`, if moves are
+    not reversible) a level at a time, always growing the smaller frontier.
+    Visits roughly the square root of the states a one-way search would when
+    the number of neighbours is large.
+
+    The goal returned is the state where the two searches met, and the
+    distances are those from the start.
+    """
+    started = time.perf_counter()
+    stats = SearchStats()
+    if reverse_neighbours is None:
+        reverse_neighbours = neighbours
+    forward = {start: 0}
+    backward = {target: 0}
+    if start == target:
+        return SearchResult(start, 0, forward, stats)
+    forward_frontier = [start]
+    backward_frontier = [target]
+    while forward_frontier and backward_frontier:
+        stats.peak_frontier = max(
+            stats.peak_frontier, len(forward_frontier) + len(backward_frontier)
+        )
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, seen, other, expand = (
+                forward_frontier,
+                forward,
+                backward,
+                neighbours,
+            )
+        else:
+            frontier, seen, other, expand = (
+                backward_frontier,
+                backward,
+                forward,
+                reverse_neighbours,
+            )
+        best: tuple[int, S] | None = None
+        next_frontier = []
+        for state in frontier:
+            stats.nodes_expanded += 1
+            next_depth = seen[state] + 1
+            for next_state in expand(state):
+                if next_state in seen:
+                    continue
+                seen[next_state] = next_depth
+                next_frontier.append(next_state)
+                if next_state in other:
+                    total = next_depth + other[next_state]
+                    if best is None or total < best[0]:
+                        best = (total, next_state)
+        if best is not None:
+            # the searches first met in this level, so the cheapest meeting
+            # point within it is the shortest path
+            stats.elapsed = time.perf_counter() - started
+            cost, meeting = best
+            return SearchResult(meeting, cost, forward, stats)
+        if frontier is forward_frontier:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+    stats.elapsed = time.perf_counter() - started
+    return SearchResult(None, None, forward, stats)
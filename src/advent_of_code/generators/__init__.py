@@ -0,0 +1,14 @@
+"""
+Synthetic puzzle inputs for stress-testing solvers at sizes beyond the real
+puzzles. Importing this package registers every generator in GENERATORS.
+"""
+
+from advent_of_code.generators import (  # noqa: F401
+    year_2015,
+    year_2016,
+    year_2020,
+    year_2021,
+    year_2023,
+    year_2025,
+)
+from advent_of_code.generators.base import *  # noqa: F403
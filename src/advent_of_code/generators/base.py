@@ -0,0 +1,67 @@
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from advent_of_code.common.io import INPUT_FILENAME
+from advent_of_code.common.runners import Solver
+
+__all__ = ["GENERATORS", "InputGenerator", "find_generator", "generator"]
+
+
+class GeneratorFunction(Protocol):
+    __name__: str
+
+    def __call__(self, size: int, rng: random.Random, /) -> str: ...
+
+
+@dataclass(frozen=True)
+class InputGenerator:
+    """
+    Produces a synthetic puzzle input of a given size in the puzzle's exact text
+    format. What `size` counts (lines, grid side, template length...) is given
+    by `unit`; inputs smaller than `min_size` would not be valid puzzles.
+    """
+
+    year: int
+    day: int
+    fn: GeneratorFunction
+    unit: str
+    min_size: int = 1
+
+    @property
+    def name(self) -> str:
+        return self.fn.__name__
+
+    def generate(self, size: int, seed: int = 0) -> str:
+        if size < self.min_size:
+            raise ValueError(
+                f"{self.year}/{self.day:02} inputs need at least "
+                f"{self.min_size} {self.unit}, got {size}"
+            )
+        return self.fn(size, random.Random(seed))
+
+    def write(self, directory: str | Path, size: int, seed: int = 0) -> Path:
+        path = Path(directory) / INPUT_FILENAME
+        path.write_text(self.generate(size, seed))
+        return path
+
+
+# keyed by (year, day): every variant of a day's solver shares its input
+GENERATORS: dict[tuple[int, int], InputGenerator] = {}
+
+
+def generator(
+    year: int, day: int, unit: str, min_size: int = 1
+) -> Callable[[GeneratorFunction], InputGenerator]:
+    def register(fn: GeneratorFunction) -> InputGenerator:
+        input_generator = InputGenerator(year, day, fn, unit, min_size)
+        GENERATORS[year, day] = input_generator
+        return input_generator
+
+    return register
+
+
+def find_generator(solver: Solver) -> InputGenerator | None:
+    return GENERATORS.get((solver.year, solver.day))
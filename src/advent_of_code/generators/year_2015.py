@@ -0,0 +1,10 @@
+import random
+
+from advent_of_code.generators.base import generator
+
+
+@generator(2015, 18, unit="grid side", min_size=2)
+def light_grid(size: int, rng: random.Random) -> str:
+    return "\n".join(
+        "".join(rng.choice("#.") for _ in range(size)) for _ in range(size)
+    )
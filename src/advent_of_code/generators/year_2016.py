@@ -0,0 +1,17 @@
+import random
+
+from advent_of_code.generators.base import generator
+
+MAX_IP = 4294967295
+
+
+@generator(2016, 20, unit="blocked ranges")
+def ip_blocklist(size: int, rng: random.Random) -> str:
+    # the solver expects the lowest address to be blocked
+    ranges = [(0, rng.randrange(MAX_IP // size))]
+    for _ in range(size - 1):
+        start = rng.randrange(MAX_IP)
+        end = min(start + rng.randrange(MAX_IP // size), MAX_IP)
+        ranges.append((start, end))
+    rng.shuffle(ranges)
+    return "\n".join(f"{start}-{end}" for start, end in ranges)
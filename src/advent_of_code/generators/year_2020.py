@@ -0,0 +1,11 @@
+import random
+
+from advent_of_code.generators.base import generator
+
+
+@generator(2020, 11, unit="grid side")
+def seat_layout(size: int, rng: random.Random) -> str:
+    return "\n".join(
+        "".join("L" if rng.random() < 0.7 else "." for _ in range(size))
+        for _ in range(size)
+    )
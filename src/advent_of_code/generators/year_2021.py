@@ -0,0 +1,17 @@
+import itertools
+import random
+
+from advent_of_code.generators.base import generator
+
+ELEMENTS = "BCFHKNOPSV"
+
+
+@generator(2021, 14, unit="template length", min_size=2)
+def polymer_formula(size: int, rng: random.Random) -> str:
+    template = "".join(rng.choice(ELEMENTS) for _ in range(size))
+    # every pair needs a rule, as the solver assumes
+    rules = "\n".join(
+        f"{a}{b} -> {rng.choice(ELEMENTS)}"
+        for a, b in itertools.product(ELEMENTS, repeat=2)
+    )
+    return f"{template}\n\n{rules}"
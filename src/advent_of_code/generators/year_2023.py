@@ -0,0 +1,15 @@
+import random
+
+from advent_of_code.generators.base import generator
+
+
+@generator(2023, 14, unit="grid side")
+def rock_platform(size: int, rng: random.Random) -> str:
+    return "\n".join(
+        "".join(rng.choices("O#.", weights=(2, 1, 5), k=size)) for _ in range(size)
+    )
+
+
+@generator(2023, 17, unit="grid side", min_size=5)
+def city_blocks(size: int, rng: random.Random) -> str:
+    return "\n".join("".join(rng.choices("123456789", k=size)) for _ in range(size))
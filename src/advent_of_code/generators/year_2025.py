@@ -0,0 +1,29 @@
+import random
+
+from advent_of_code.generators.base import generator
+
+
+@generator(2025, 1, unit="rotations")
+def dial_rotations(size: int, rng: random.Random) -> str:
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size))
+
+
+@generator(2025, 5, unit="ranges and ingredients")
+def ingredient_database(size: int, rng: random.Random) -> str:
+    ranges = []
+    for _ in range(size):
+        start = rng.randrange(10**15)
+        ranges.append(f"{start}-{start + rng.randrange(10**12)}")
+    ingredients = [str(rng.randrange(10**15)) for _ in range(size)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ingredients)
+
+
+@generator(2025, 8, unit="junction boxes", min_size=50)
+def junction_boxes(size: int, rng: random.Random) -> str:
+    # the solver makes 1000 connections, so needs more than 1000 pairs
+    boxes: set[tuple[int, int, int]] = set()
+    while len(boxes) < size:
+        boxes.add(
+            (rng.randrange(100_000), rng.randrange(100_000), rng.randrange(100_000))
+        )
+    return "\n".join(f"{x},{y},{z}" for x, y, z in boxes)
@@ -9,25 +9,41 @@ Part 2
 Repeat with 6 zeroes.
 """
 
-import hashlib
-from advent_of_code.common import read_file
-
-
-def md5_search(secret_key: str, prefix="00000") -> int:
-    secret_bytes = secret_key.encode()
-    num = 0
-    while True:
-        num += 1
-        hash_input = secret_bytes + str(num).encode()
-        hash_hex = hashlib.md5(hash_input).hexdigest()
-        if hash_hex.startswith(prefix):
-            return num
+import sys
+
+from advent_of_code.common import (
+    HashStats,
+    leading_zeros,
+    md5_nonce_search,
+    read_file,
+)
+
+
+def md5_search(
+    secret_key: str,
+    prefix="00000",
+    start: int = 1,
+    jobs: int | None = 1,
+    stats: HashStats | None = None,
+) -> int:
+    if prefix.strip("0"):
+        raise ValueError(f"Only prefixes of zeros are supported, not {prefix!r}")
+    matches = md5_nonce_search(
+        secret_key, leading_zeros(len(prefix)), start=start, jobs=jobs, stats=stats
+    )
+    num, _ = next(matches)
+    matches.close()
+    return num
 
 
 def main() -> None:
     secret_key = read_file()
-    print(md5_search(secret_key, prefix="00000"))
-    print(md5_search(secret_key, prefix="000000"))
+    stats = HashStats()
+    five_zeros = md5_search(secret_key, prefix="00000", stats=stats)
+    print(five_zeros)
+    # six zeros start with five, so can't come earlier
+    print(md5_search(secret_key, prefix="000000", start=five_zeros, stats=stats))
+    print(stats, file=sys.stderr)
 
 
 if __name__ == "__main__":
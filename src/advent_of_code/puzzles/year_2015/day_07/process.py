@@ -17,9 +17,8 @@ Get the value of wire a and make it wire b, then reset the circuit and calculate
 import operator
 from collections.abc import Callable
 from typing import Literal
-import functools
 
-from advent_of_code.common import read_file, timed_run
+from advent_of_code.common import read_file, timed_run, memoize
 
 
 GATE_OPERATIONS = {
@@ -46,7 +45,7 @@ def resolve_operand(circuit: Circuit, operand: str) -> int:
 
 
 def input_execute_factory(circuit: Circuit, op: str) -> CircuitFn:
-    @functools.cache
+    @memoize
     def execute() -> int:
         return resolve_operand(circuit, op)
 
@@ -54,7 +53,7 @@ def input_execute_factory(circuit: Circuit, op: str) -> CircuitFn:
 
 
 def inverse_execute_factory(circuit: Circuit, op: str) -> CircuitFn:
-    @functools.cache
+    @memoize
     def execute() -> int:
         return not_16(resolve_operand(circuit, op))
 
@@ -67,7 +66,7 @@ def binary_op_execute_factory(
     op_2: str,
     gate: Literal["AND", "OR", "LSHIFT", "RSHIFT"],
 ) -> CircuitFn:
-    @functools.cache
+    @memoize
     def execute() -> int:
         return GATE_OPERATIONS[gate](
             resolve_operand(circuit, op_1), resolve_operand(circuit, op_2)
@@ -92,7 +91,7 @@ def assemble_circuit(circuit_text) -> Circuit:
 
 
 def override_circuit(circuit: Circuit, wire: str, value: int) -> None:
-    @functools.cache
+    @memoize
     def execute() -> int:
         return value
 
@@ -1,46 +1,49 @@
-from itertools import count
-from hashlib import md5
+import sys
 from typing import cast
 
 from tqdm import tqdm
 
 from advent_of_code.common import (
+    HashStats,
+    leading_zeros,
+    md5_nonce_search,
     read_file,
     timed_run,
 )
 
 
 PASSWORD_LENGTH = 8
+INTERESTING_HASH = leading_zeros(5)
 
 
-def generate_pw_door_1(door_id: str) -> str:
+def generate_pw_door_1(
+    door_id: str, jobs: int | None = 1, stats: HashStats | None = None
+) -> str:
     pw = ""
-    for i in count():
-        hash_input = door_id + str(i)
-        hasher = md5()
-        hasher.update(hash_input.encode("utf-8"))
-        hex_ = hasher.hexdigest()
-        if hex_[:5] == "00000":
-            pw += hex_[5]
+    matches = md5_nonce_search(door_id, INTERESTING_HASH, jobs=jobs, stats=stats)
+    for _, digest in matches:
+        pw += digest.hex()[5]
         if len(pw) == PASSWORD_LENGTH:
+            matches.close()
             return pw
     raise Exception("This code is unreachable")
 
 
-def generate_pw_door_2(door_id: str, cinematic_animation: bool = False) -> str:
+def generate_pw_door_2(
+    door_id: str,
+    cinematic_animation: bool = False,
+    jobs: int | None = 1,
+    stats: HashStats | None = None,
+) -> str:
     if cinematic_animation:
         pbar = tqdm(
             total=PASSWORD_LENGTH, bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}"
         )
 
     pw: list[str | None] = [None] * PASSWORD_LENGTH
-    for i in count():
-        hash_input = door_id + str(i)
-        hasher = md5()
-        hasher.update(hash_input.encode("utf-8"))
-        hex_ = hasher.hexdigest()
-        if hex_[:5] != "00000":
-            continue
+    matches = md5_nonce_search(door_id, INTERESTING_HASH, jobs=jobs, stats=stats)
+    for _, digest in matches:
+        hex_ = digest.hex()
         try:
             pos = int(hex_[5])
         except ValueError:
@@ -57,6 +60,7 @@ def generate_pw_door_2(door_id: str, cinematic_animation: bool = False) -> str:
             pbar.update(1)
 
         if all(letter is not None for letter in pw):
+            matches.close()
             completed_pw = cast(list[str], pw)
             if cinematic_animation:
                 pbar.close()
@@ -67,8 +71,10 @@ def generate_pw_door_2(door_id: str, cinematic_animation: bool = False) -> str:
 
 def run():
     door_id = read_file()
-    print(generate_pw_door_1(door_id))
-    print(generate_pw_door_2(door_id, cinematic_animation=True))
+    stats = HashStats()
+    print(generate_pw_door_1(door_id, stats=stats))
+    print(generate_pw_door_2(door_id, cinematic_animation=True, stats=stats))
+    print(stats, file=sys.stderr)
 
 
 def main() -> None:
@@ -1,86 +1,66 @@
-from dataclasses import dataclass
-from functools import cache
-from collections import deque
+from collections.abc import Iterator
 
 from advent_of_code.common import (
     Coords,
     FOUR_POINT_DIRECTION_COORDS,
+    StatePacker,
     timed_run,
     read_file,
+    bfs,
+    memoize,
 )
 
 
-@dataclass(frozen=True)
-class LocationState:
-    location: Coords
-    steps: int
-
-
 START = Coords(1, 1)
 TARGET = Coords(31, 39)
 
 REACHABLE_FROM_STEPS = 50
 
+# locations are packed into ints, so must be bounded; this is far beyond any
+# route, and locations past it are treated as walls
+GRID_SIZE = 1 << 16
+
 
 class BuildingNavigator:
     def __init__(self, fave: int):
         self.fave = fave
+        self.packer = StatePacker(GRID_SIZE, GRID_SIZE)
 
-    @cache
-    def _is_open_space(self, coords: Coords) -> bool:
-        sum_value = (
-            coords.x * coords.x
-            + 3 * coords.x
-            + 2 * coords.x * coords.y
-            + coords.y
-            + coords.y * coords.y
-            + self.fave
-        )
-        bitmask = f"{sum_value:0b}"
-        bit_no = sum([int(bit_) for bit_ in bitmask])
-        return bit_no % 2 == 0
-
-    def simulate(
-        self, start: Coords, target: Coords, reachable_from_steps: int = 0
-    ) -> tuple[int, int]:
-        # bfs
-
-        q = deque([LocationState(start, 0)])
-        states = {start}
-        reachable = set()
-        minimum_steps = None
-
-        while q:
-            ls = q.pop()
+    @memoize
+    def _is_open_space(self, location: int) -> bool:
+        x, y = self.packer.unpack(location)
+        sum_value = x * x + 3 * x + 2 * x * y + y + y * y + self.fave
+        return sum_value.bit_count() % 2 == 0
 
-            if ls.steps <= reachable_from_steps:
-                reachable.add(ls.location)
+    def _adjacent_open_spaces(self, location: int) -> Iterator[int]:
+        x, y = self.packer.unpack(location)
+        for offset in FOUR_POINT_DIRECTION_COORDS:
+            adj_x, adj_y = x + offset.x, y + offset.y
 
-            if ls.location == target:
-                minimum_steps = ls.steps
+            # invalid coordinates - skip
+            if not (0 <= adj_x < GRID_SIZE and 0 <= adj_y < GRID_SIZE):
+                continue
 
-            if ls.steps > reachable_from_steps and minimum_steps is not None:
-                return (minimum_steps, len(reachable))
+            adj_location = self.packer.pack(adj_x, adj_y)
+            if self._is_open_space(adj_location):
+                yield adj_location
 
-            # calculate adjacent locations
-            for offset in FOUR_POINT_DIRECTION_COORDS:
-                adj_location = ls.location + offset
-
-                # invalid coordinates - skip
-                if adj_location.x < 0 or adj_location.y < 0:
-                    continue
-
-                # already visited - skip
-                if adj_location in states:
-                    continue
-
-                if not self._is_open_space(adj_location):
-                    continue
-
-                q.appendleft(LocationState(adj_location, ls.steps + 1))
-                states.add(adj_location)
-
-        raise Exception
+    def simulate(
+        self, start: Coords, target: Coords, reachable_from_steps: int = 0
+    ) -> tuple[int, int]:
+        start_location = self.packer.pack(start.x, start.y)
+        target_location = self.packer.pack(target.x, target.y)
+        route = bfs(
+            start_location,
+            self._adjacent_open_spaces,
+            is_goal=lambda location: location == target_location,
+        )
+        if route.cost is None:
+            raise ValueError("Target is unreachable")
+        reachable = bfs(
+            start_location, self._adjacent_open_spaces, max_depth=reachable_from_steps
+        )
+        return route.cost, len(reachable.distances)
 
 
 def run() -> None:
@@ -1,77 +1,86 @@
-import hashlib
-from itertools import count
-from functools import cache
-
-import more_itertools
+import re
+import sys
+from collections import deque
+from collections.abc import Generator
+from contextlib import closing
 
 from advent_of_code.common import (
+    HashStats,
     timed_run,
     read_file,
+    md5_hexdigests,
 )
 
 
 NO_OF_KEYS = 64
 KEY_STRETCHING_ADDITIONAL_HASHES = 2016
+LOOKAHEAD = 1000
+
+TRIPLET = re.compile(r"(.)\1\1")
+QUINTUPLET = re.compile(r"(.)\1{4}")
 
 
 class MD5KeySearch:
-    def __init__(self, prefix_salt: str, key_stretching: bool = False):
+    def __init__(
+        self,
+        prefix_salt: str,
+        key_stretching: bool = False,
+        jobs: int | None = 1,
+        stats: HashStats | None = None,
+    ):
         self.prefix_salt = prefix_salt
         self.key_stretching = key_stretching
-
-    @cache
-    def _hash(self, idx: int) -> str:
-        val = self.prefix_salt + str(idx)
-        repetitions = KEY_STRETCHING_ADDITIONAL_HASHES + 1 if self.key_stretching else 1
-        for _ in range(repetitions):
-            val = val.encode()
-            val = hashlib.md5(val).hexdigest()
-        return val
-
-    @cache
-    def _check_quintuplet(self, idx: int, char: str) -> bool:
-        hash_val = self._hash(idx)
-        for window in more_itertools.windowed(hash_val, 5):
-            uniq_chars = set(window)
-            if len(uniq_chars) == 1 and next(iter(uniq_chars)) == char:
-                return True
-        return False
-
-    def _check_triplet(self, idx: int) -> str | None:
-        hash_val = self._hash(idx)
-        for window in more_itertools.windowed(hash_val, 3):
-            uniq_chars = set(window)
-            if len(uniq_chars) == 1:
-                return next(iter(uniq_chars))
-        return None
+        self.stretch = KEY_STRETCHING_ADDITIONAL_HASHES if key_stretching else 0
+        self.jobs = jobs
+        self.stats = stats
+
+    def _windows(self) -> Generator[tuple[int, str, dict[str, deque[int]]]]:
+        # each index and its hash, with the positions of the quintuplets of
+        # each character in the next LOOKAHEAD hashes
+        hashes = md5_hexdigests(
+            self.prefix_salt, stretch=self.stretch, jobs=self.jobs, stats=self.stats
+        )
+        window: deque[str] = deque()
+        quintuplets: dict[str, deque[int]] = {
+            char: deque() for char in "0123456789abcdef"
+        }
+        try:
+            for next_idx, hash_val in enumerate(hashes):
+                window.append(hash_val)
+                for char in set(QUINTUPLET.findall(hash_val)):
+                    quintuplets[char].append(next_idx)
+                if len(window) <= LOOKAHEAD:
+                    continue
+                idx = next_idx - LOOKAHEAD
+                hash_val = window.popleft()
+                # positions are in order, so the current index's are first
+                for char in set(QUINTUPLET.findall(hash_val)):
+                    quintuplets[char].popleft()
+                yield idx, hash_val, quintuplets
+        finally:
+            hashes.close()
 
     def search(self) -> int:
         keys_found = 0
-        for idx in count():
-            triplet_char = self._check_triplet(idx)
-            if triplet_char is None:
-                continue
-
-            is_key = False
-            for quint_idx in range(idx + 1, idx + 1 + 1000):
-                is_quintuplet = self._check_quintuplet(quint_idx, triplet_char)
-                if is_quintuplet:
-                    is_key = True
-
-            if is_key:
+        with closing(self._windows()) as windows:
+            for idx, hash_val, quintuplets in windows:
+                triplet = TRIPLET.search(hash_val)
+                if triplet is None or not quintuplets[triplet[1]]:
+                    continue
                 keys_found += 1
-
-            if keys_found == NO_OF_KEYS:
-                return idx
+                if keys_found == NO_OF_KEYS:
+                    return idx
         raise Exception("unreachable code")
 
 
 def run() -> None:
     prefix_salt = read_file()
-    md5_ks = MD5KeySearch(prefix_salt)
+    stats = HashStats()
+    md5_ks = MD5KeySearch(prefix_salt, stats=stats)
     print(md5_ks.search())
-    md5_ks_ks = MD5KeySearch(prefix_salt, key_stretching=True)
+    md5_ks_ks = MD5KeySearch(prefix_salt, key_stretching=True, stats=stats)
     print(md5_ks_ks.search())
+    print(stats, file=sys.stderr)
 
 
 def main() -> None:
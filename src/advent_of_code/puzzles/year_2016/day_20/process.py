@@ -1,6 +1,4 @@
-from itertools import pairwise
-
-from advent_of_code.common import merge_intervals, read_file, timed_run
+from advent_of_code.common import IntervalIndex, merge_intervals, read_file, timed_run
 
 MIN_VAL = 0
 MAX_VAL = 4294967295
@@ -20,18 +18,8 @@ def lowest_valid_ip(intervals: list[tuple[int, int]]) -> int:
 
 
 def allowed_ips(intervals: list[tuple[int, int]]) -> int:
-    allowed = 0
-    # capture allowed below min blocked range
-    if intervals[0][0] > MIN_VAL:
-        allowed += intervals[0][0] - MIN_VAL
-
-    for l_interval, r_interval in pairwise(intervals):
-        allowed += r_interval[0] - l_interval[1] - 1
-
-    if intervals[-1][-1] < MAX_VAL:
-        allowed += MAX_VAL - intervals[-1][-1]
-
-    return allowed
+    all_ips = IntervalIndex([(MIN_VAL, MAX_VAL)])
+    return (all_ips - IntervalIndex(intervals)).total_length()
 
 
 def run():
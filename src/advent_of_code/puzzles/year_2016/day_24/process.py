@@ -1,8 +1,7 @@
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
 from enum import Enum
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
-from itertools import combinations
-from heapq import heappush, heappop
 
 from advent_of_code.common import (
     read_file,
@@ -11,6 +10,9 @@ from advent_of_code.common import (
     FOUR_POINT_DIRECTION_COORDS,
     ones_mask,
     iter_bits,
+    bfs,
+    dijkstra,
+    StatePacker,
 )
 
 START = 0
@@ -28,19 +30,6 @@ class Maze:
     locations: dict[int, Coords]
 
 
-@dataclass(frozen=True)
-class ShortestPairState:
-    steps: int
-    location: Coords
-
-
-@dataclass(frozen=True, order=True)
-class ShortestLocationState:
-    steps: int
-    location: int = field(compare=False)
-    state: int = field(compare=False)
-
-
 def parse_maze(raw_maze: str) -> Maze:
     grid = {}
     locations = {}
@@ -63,38 +52,26 @@ def parse_maze(raw_maze: str) -> Maze:
     return Maze(grid, start, locations)
 
 
-def _calculate_shortest_pair(maze: Maze, start: Coords, target: Coords) -> int:
-    q = deque([ShortestPairState(0, start)])
-    visited = {start}
-    while q:
-        sps = q.pop()
-        next_steps = sps.steps + 1
-        for offset in FOUR_POINT_DIRECTION_COORDS:
-            next_location = sps.location + offset
-            if next_location == target:
-                return next_steps
-            if next_location not in maze.grid:
-                continue
-            next_space = maze.grid[next_location]
-            if next_space == Space.WALL:
-                continue
-            if next_location in visited:
-                continue
-            visited.add(next_location)
-            q.appendleft(ShortestPairState(next_steps, next_location))
-    raise ValueError("Result must be present")
+def _open_neighbours(maze: Maze, location: Coords) -> Iterator[Coords]:
+    for offset in FOUR_POINT_DIRECTION_COORDS:
+        next_location = location + offset
+        if maze.grid.get(next_location, Space.WALL) != Space.WALL:
+            yield next_location
 
 
 def calculate_shortest_pairs(maze: Maze) -> dict[int, dict[int, int]]:
+    # one search from each location finds its distance to every other
     shortest_pairs = defaultdict(dict)
-    for (label_0, location_0), (label_1, location_1) in combinations(
-        maze.locations.items(), 2
-    ):
-        shortest_pair = _calculate_shortest_pair(
-            maze, start=location_0, target=location_1
-        )
-        shortest_pairs[label_0][label_1] = shortest_pair
-        shortest_pairs[label_1][label_0] = shortest_pair
+    for label, location in maze.locations.items():
+        distances = bfs(
+            location, lambda location: _open_neighbours(maze, location)
+        ).distances
+        for other_label, other_location in maze.locations.items():
+            if other_label == label:
+                continue
+            if other_location not in distances:
+                raise ValueError("Result must be present")
+            shortest_pairs[label][other_label] = distances[other_location]
     return shortest_pairs
 
 
@@ -109,36 +86,31 @@ def calculate_shortest_route(
     starting_state = (
         ones_mask(n_locations) - 1 if not return_to_start else ones_mask(n_locations)
     )
+    # search states pack the locations left to visit with the current location
+    packer = StatePacker(2**n_locations, n_locations)
 
-    pq: list[ShortestLocationState] = []
-    seen = {(starting_state, START): 0}
-    heappush(pq, ShortestLocationState(0, START, starting_state))
-    while pq:
-        sls = heappop(pq)
-        if not sls.state:
-            return sls.steps
-        for next_location_bits in iter_bits(sls.state):
+    def next_states(packed: int) -> Iterator[tuple[int, int]]:
+        state, location = packer.unpack(packed)
+        for next_location_bits in iter_bits(state):
             next_location = next_location_bits.bit_length() - 1
-            if next_location == START and sls.state != 2**START:
+            if next_location == START and state != 2**START:
                 # only consider going to start
                 # when it is the last place to visit
                 continue
-            dist = shortest_pairs[sls.location][next_location]
-            total_dist = sls.steps + dist
-            next_state = sls.state & ~next_location_bits
-
-            if (next_state, next_location) in seen and total_dist > seen[
-                (next_state, next_location)
-            ]:
-                continue
-            else:
-                seen[(next_state, next_location)] = total_dist
-                heappush(
-                    pq,
-                    ShortestLocationState(total_dist, next_location, next_state),
-                )
-
-    raise ValueError("Result must be present")
+            yield (
+                packer.pack(state & ~next_location_bits, next_location),
+                shortest_pairs[location][next_location],
+            )
+
+    route = dijkstra(
+        packer.pack(starting_state, START),
+        next_states,
+        is_goal=lambda packed: not packer.unpack(packed)[0],
+        queue="bucket",
+    )
+    if route.cost is None:
+        raise ValueError("Result must be present")
+    return route.cost
 
 
 def run() -> None:
@@ -1,5 +1,9 @@
 import re
 from collections.abc import Iterator
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
 
 from advent_of_code.common import ones_mask, read_file, timed_run
 
@@ -13,6 +17,7 @@ B_IS_MULTIPLE_OF = 8
 LOW_BITS = 16
 COMPARISONS_1 = 40_000_000
 COMPARISONS_2 = 5_000_000
+BLOCK_SIZE = 1 << 20
 
 
 def parse_gen_starts(raw_starts: str) -> tuple[int, int]:
@@ -40,16 +45,91 @@ def _judge(a_gen: Iterator[int], b_gen: Iterator[int], comparisons: int) -> int:
     )
 
 
-def judge_part_1(a_start: int, b_start: int) -> int:
-    a_gen = _seq_gen(a_start, A_FACTOR)
-    b_gen = _seq_gen(b_start, B_FACTOR)
-    return _judge(a_gen, b_gen, COMPARISONS_1)
-
-
-def judge_part_2(a_start: int, b_start: int) -> int:
-    a_gen = _seq_gen(a_start, A_FACTOR, if_multiple_of=A_IS_MULTIPLE_OF)
-    b_gen = _seq_gen(b_start, B_FACTOR, if_multiple_of=B_IS_MULTIPLE_OF)
-    return _judge(a_gen, b_gen, COMPARISONS_2)
+def _factor_powers(factor: int, block_size: int) -> npt.NDArray[np.uint64]:
+    # factor**1 .. factor**block_size, mod the divisor, doubled up from the
+    # first power by jumping each half ahead by the one before it
+    powers = np.empty(block_size, dtype=np.uint64)
+    powers[0] = factor
+    filled = 1
+    while filled < block_size:
+        jump = int(powers[filled - 1])
+        step = min(filled, block_size - filled)
+        powers[filled : filled + step] = powers[:step] * np.uint64(jump) % DIVISOR
+        filled += step
+    return powers
+
+
+def _seq_blocks(
+    start: int, factor: int, if_multiple_of: int = 1, block_size: int = BLOCK_SIZE
+) -> Iterator[npt.NDArray[np.uint16]]:
+    # the same values as _seq_gen, as the low bits only, a block at a time;
+    # every value in a block is the block's start jumped ahead independently
+    powers = _factor_powers(factor, block_size)
+    curr = start
+    while True:
+        block = powers * np.uint64(curr) % DIVISOR
+        curr = int(block[-1])
+        if if_multiple_of != 1:
+            block = block[block % if_multiple_of == 0]
+        yield block.astype(np.uint16)
+
+
+def _judge_blocks(
+    a_blocks: Iterator[npt.NDArray[np.uint16]],
+    b_blocks: Iterator[npt.NDArray[np.uint16]],
+    comparisons: int,
+) -> int:
+    # generators that filter can produce blocks of different lengths, so
+    # each is compared as far as the other has got
+    matches = 0
+    a_block = b_block = np.empty(0, dtype=np.uint16)
+    while comparisons:
+        if not len(a_block):
+            a_block = next(a_blocks)
+        if not len(b_block):
+            b_block = next(b_blocks)
+        compared = min(len(a_block), len(b_block), comparisons)
+        matches += int(np.count_nonzero(a_block[:compared] == b_block[:compared]))
+        a_block, b_block = a_block[compared:], b_block[compared:]
+        comparisons -= compared
+    return matches
+
+
+def _judge_gens(
+    a_start: int,
+    b_start: int,
+    comparisons: int,
+    a_multiple: int,
+    b_multiple: int,
+    mode: Literal["numpy", "generator"],
+) -> int:
+    if mode == "generator":
+        a_gen = _seq_gen(a_start, A_FACTOR, if_multiple_of=a_multiple)
+        b_gen = _seq_gen(b_start, B_FACTOR, if_multiple_of=b_multiple)
+        return _judge(a_gen, b_gen, comparisons)
+    a_blocks = _seq_blocks(a_start, A_FACTOR, if_multiple_of=a_multiple)
+    b_blocks = _seq_blocks(b_start, B_FACTOR, if_multiple_of=b_multiple)
+    return _judge_blocks(a_blocks, b_blocks, comparisons)
+
+
+def judge_part_1(
+    a_start: int,
+    b_start: int,
+    comparisons: int = COMPARISONS_1,
+    mode: Literal["numpy", "generator"] = "numpy",
+) -> int:
+    return _judge_gens(a_start, b_start, comparisons, 1, 1, mode)
+
+
+def judge_part_2(
+    a_start: int,
+    b_start: int,
+    comparisons: int = COMPARISONS_2,
+    mode: Literal["numpy", "generator"] = "numpy",
+) -> int:
+    return _judge_gens(
+        a_start, b_start, comparisons, A_IS_MULTIPLE_OF, B_IS_MULTIPLE_OF, mode
+    )
 
 
 def run():
@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 from advent_of_code.puzzles.year_2017.day_15 import process
 
 
@@ -7,3 +10,20 @@ def test_judge_part_1() -> None:
 
 def test_judge_part_2() -> None:
     assert process.judge_part_2(a_start=65, b_start=8921) == 309
+
+
+@pytest.mark.parametrize("judge", [process.judge_part_1, process.judge_part_2])
+@pytest.mark.parametrize("comparisons", [0, 1, 5, 100_000])
+def test_judge_matches_generators(judge, comparisons) -> None:
+    assert judge(65, 8921, comparisons) == judge(
+        65, 8921, comparisons, mode="generator"
+    )
+
+
+def test_seq_blocks_match_generator() -> None:
+    blocks = process._seq_blocks(
+        65, process.A_FACTOR, if_multiple_of=4, block_size=1000
+    )
+    values = np.concatenate([next(blocks) for _ in range(5)])
+    gen = process._seq_gen(65, process.A_FACTOR, if_multiple_of=4)
+    assert values.tolist() == [next(gen) & 0xFFFF for _ in range(len(values))]
@@ -1,9 +1,9 @@
 import re
-from itertools import count
 from dataclasses import dataclass
+from functools import partial
 from string import ascii_lowercase
 
-from advent_of_code.common import read_file, timed_run
+from advent_of_code.common import fast_forward, read_file, timed_run
 
 SPIN_PATTERN = r"s(?P<no_programs>\d+)"
 EXCHANGE_PATTERN = r"x(?P<pos_a>\d+)/(?P<pos_b>\d+)"
@@ -51,33 +51,26 @@ def parse(raw_moves: str) -> list[Move]:
     return moves
 
 
-def dance(programs: str, moves: list[Move]) -> tuple[str, list[str]]:
+def dance(programs: str, moves: list[Move]) -> str:
     progs = list(programs)
-    dance_cycle = [programs]
-    for cycle in count():
-        for move in moves:
-            match move:
-                case Spin(no_programs):
-                    progs = progs[-no_programs:] + progs[:-no_programs]
-                case Exchange(pos_a, pos_b):
-                    progs[pos_a], progs[pos_b] = progs[pos_b], progs[pos_a]
-                case Partner(prog_a, prog_b):
-                    pos_a = progs.index(prog_a)
-                    pos_b = progs.index(prog_b)
-                    progs[pos_a], progs[pos_b] = progs[pos_b], progs[pos_a]
-        danced_progs = "".join(progs)
-        if cycle == 0:
-            initial_dance = danced_progs
-        if danced_progs in dance_cycle:
-            return initial_dance, dance_cycle
-        dance_cycle.append(danced_progs)
-    raise Exception("unreachable code")
-
-
-def watch_dance(programs: str, moves: list[Move]) -> tuple[str, str]:
-    initial_dance, dance_cycle = dance(programs, moves)
-    final_dance = dance_cycle[ONE_BILLION % len(dance_cycle)]
-    return initial_dance, final_dance
+    for move in moves:
+        match move:
+            case Spin(no_programs):
+                progs = progs[-no_programs:] + progs[:-no_programs]
+            case Exchange(pos_a, pos_b):
+                progs[pos_a], progs[pos_b] = progs[pos_b], progs[pos_a]
+            case Partner(prog_a, prog_b):
+                pos_a = progs.index(prog_a)
+                pos_b = progs.index(prog_b)
+                progs[pos_a], progs[pos_b] = progs[pos_b], progs[pos_a]
+    return "".join(progs)
+
+
+def watch_dance(
+    programs: str, moves: list[Move], dances: int = ONE_BILLION
+) -> tuple[str, str]:
+    perform = partial(dance, moves=moves)
+    return perform(programs), fast_forward(programs, perform, dances)
 
 
 def run():
@@ -40,10 +40,16 @@ import itertools
 import re
 from collections import defaultdict
 from dataclasses import dataclass
-from functools import cache
 from typing import Literal
 
-from advent_of_code.common import BaseCoords, Coords, quad_formula, read_file, timed_run
+from advent_of_code.common import (
+    BaseCoords,
+    Coords,
+    memoize,
+    quad_formula,
+    read_file,
+    timed_run,
+)
 
 
 SIGNED_INT_PATTERN = r"-?\d+"
@@ -82,7 +88,7 @@ class Particle:
     velocity: Velocity
     acceleration: Acceleration
 
-    @cache
+    @memoize
     def to_axis(self, axis: Literal["x", "y", "z"]) -> ParticleAxis:
         return ParticleAxis(
             position=getattr(self.position, axis),
@@ -1,7 +1,8 @@
+from advent_of_code.common import stream_lines
+
 freq_changes = []
 
-with open("input.txt", "r") as f:
-    for freq in f:
-        freq_changes.append(int(freq))
+for freq in stream_lines():
+    freq_changes.append(int(freq))
 
 print(sum(freq_changes))
@@ -1,11 +1,12 @@
 import itertools
 
+from advent_of_code.common import stream_lines
+
 
 def main():
     freqs = []
-    with open("input.txt", "r") as f:
-        for freq_str in f:
-            freqs.append(int(freq_str))
+    for freq_str in stream_lines():
+        freqs.append(int(freq_str))
 
     freq_pool = itertools.cycle(freqs)
     cum_freq_pool = itertools.accumulate(freq_pool)
@@ -1,9 +1,10 @@
 import itertools
 
+from advent_of_code.common import stream_lines
+
 
 def main():
-    with open("input.txt", "r") as f:
-        box_ids = f.readlines()
+    box_ids = list(stream_lines())
 
     for box_id_1, box_id_2 in itertools.combinations(box_ids, 2):
         differences = 0
@@ -1,6 +1,8 @@
 import itertools
 import collections
 
+from advent_of_code.common import stream_lines
+
 Claim = collections.namedtuple("Claim", "left_coord top_coord width height")
 
 
@@ -47,9 +49,8 @@ def main():
     grid = _create_square_grid(1000)
 
     claims = []
-    with open("input.txt", "r") as f:
-        for raw_claim in f:
-            claims.append(_read_claim(raw_claim))
+    for raw_claim in stream_lines():
+        claims.append(_read_claim(raw_claim))
 
     claim_ranges = [_generate_ranges(claim) for claim in claims]
 
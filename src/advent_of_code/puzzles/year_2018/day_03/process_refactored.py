@@ -1,6 +1,8 @@
 import itertools
 import collections
 
+from advent_of_code.common import stream_lines
+
 Claim = collections.namedtuple("Claim", "claim_id left_coord top_coord width height")
 
 
@@ -34,9 +36,8 @@ def _calculate_no_overlap(counts, grouped_coords, claims):
 
 def main():
     claims = []
-    with open("input.txt", "r") as f:
-        for raw_claim in f:
-            claims.append(_read_claim(raw_claim))
+    for raw_claim in stream_lines():
+        claims.append(_read_claim(raw_claim))
 
     grouped_coords = [_calculate_coords(claim) for claim in claims]
     coords = [coord for groups in grouped_coords for coord in groups]
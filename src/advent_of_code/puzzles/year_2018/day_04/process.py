@@ -3,6 +3,8 @@ import operator
 from datetime import datetime
 import re
 
+from advent_of_code.common import stream_lines
+
 SleepyCombo = collections.namedtuple("SleepyCombo", "minute count")
 
 
@@ -89,8 +91,7 @@ def retrieve_guards_and_sleepiest_minutes(log):
 
 
 def main():
-    with open("input.txt", "r") as f:
-        raw_log = process_file(f)
+    raw_log = process_file(stream_lines())
 
     log = process_log(raw_log)
 
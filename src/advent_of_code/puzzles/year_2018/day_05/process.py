@@ -1,5 +1,7 @@
 import string
 
+from advent_of_code.common import read_text
+
 
 def _check_upper_or_lower(char1, char2):
     return char1.swapcase() == char2
@@ -16,8 +18,7 @@ def process_polymer(inpt):
 
 
 def main():
-    with open("input.txt", "r") as f:
-        inpt = f.read().rstrip()
+    inpt = read_text().rstrip()
     output = process_polymer(inpt)
     print(f"Puzzle_1 {len(output)}")
 
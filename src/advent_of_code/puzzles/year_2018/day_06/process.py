@@ -2,6 +2,8 @@ import itertools
 import collections
 import timeit
 
+from advent_of_code.common import stream_lines
+
 
 class ChronalCoods:
     def __init__(self):
@@ -15,11 +17,10 @@ class ChronalCoods:
 
     def read_file(self):
         self.coords = []
-        with open("input.txt") as f:
-            for line in f:
-                coord = line.split(", ")
-                coord = [int(x) for x in coord]
-                self.coords.append(coord)
+        for line in stream_lines():
+            coord = line.split(", ")
+            coord = [int(x) for x in coord]
+            self.coords.append(coord)
 
     def get_min_max(self):
         x_coords = [x for x, _ in self.coords]
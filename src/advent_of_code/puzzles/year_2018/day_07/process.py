@@ -4,6 +4,8 @@ import dataclasses
 import string
 import timeit
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass
 class Worker:
@@ -34,8 +36,7 @@ class Instructions:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     @staticmethod
     def _remove_letter_as_dependency(letter, dependencies):
@@ -3,6 +3,8 @@ import dataclasses
 import timeit
 import typing
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass
 class Node:
@@ -34,8 +36,7 @@ class TreeParser:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def parse(self):
         children_no = self._nodes.popleft()
@@ -4,6 +4,8 @@ import itertools
 import re
 import timeit
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass
 class Marble:
@@ -34,8 +36,7 @@ class MarbleGame:
 
     @classmethod
     def read_file(cls, marble_multiplier=1):
-        with open("input.txt") as f:
-            return cls.from_string(f.read().rstrip(), marble_multiplier)
+        return cls.from_string(read_text().rstrip(), marble_multiplier)
 
     def play(self):
         for marble, elf in enumerate(itertools.cycle(self.elves)):
@@ -2,14 +2,7 @@ import dataclasses
 import re
 import timeit
 
-
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
-
-    def __add__(self, other):
-        return Coords(self.x + other.x, self.y + other.y)
+from advent_of_code.common import Coords, read_text
 
 
 @dataclasses.dataclass
@@ -80,8 +73,7 @@ class Stars:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls.from_string(f.read())
+        return cls.from_string(read_text())
 
     def align(self, yield_image=False):
         iteration = 0
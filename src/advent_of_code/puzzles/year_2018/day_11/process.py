@@ -5,11 +5,7 @@ import typing
 
 import more_itertools
 
-
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
+from advent_of_code.common import Coords, read_text
 
 
 @dataclasses.dataclass(frozen=True)
@@ -54,8 +50,7 @@ class ChronalCharge:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(int(f.read().rstrip()))
+        return cls(int(read_text().rstrip()))
 
     def largest_power_3_by_3(self):
         powers = {}
@@ -3,6 +3,8 @@ import dataclasses
 import timeit
 import typing
 
+from advent_of_code.common import read_text
+
 
 PLANT = "#"
 NO_PLANT = "."
@@ -102,8 +104,7 @@ class SubterraneanSustainability:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().rstrip())
+        return cls(read_text().rstrip())
 
     def _preprocess(self, input_, is_full_input):
         self.initial_state = {}
@@ -5,6 +5,8 @@ import timeit
 import typing
 from typing import cast
 
+from advent_of_code.common import Coords, read_text
+
 
 class Directions(enum.Enum):
     UP = 0
@@ -74,18 +76,6 @@ class CartIntersectionDirections(enum.Enum):
         )
 
 
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
-
-    def __add__(self, other):
-        return Coords(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Coords(self.x - other.x, self.y - other.y)
-
-
 class Cart:
     def __init__(self, cart_direction, previous_location):
         self.cart_direction = cart_direction
@@ -143,8 +133,7 @@ class TrackPiece:
 class MineCartMadness:
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().rstrip())
+        return cls(read_text().rstrip())
 
     def __init__(self, raw_track):
         raw_grid = raw_track.splitlines()
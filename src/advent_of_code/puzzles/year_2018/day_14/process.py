@@ -1,5 +1,7 @@
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class ChocolateCharts:
     def __init__(self):
@@ -48,8 +50,7 @@ class ChocolateCharts:
 
 
 def main():
-    with open("input.txt") as f:
-        number_of_recipes = f.read().rstrip()
+    number_of_recipes = read_text().rstrip()
     chocolate_charts = ChocolateCharts()
     print("Score part 1:", chocolate_charts.score_part_1(int(number_of_recipes)))
     print("Score part 2:", chocolate_charts.score_part_2(number_of_recipes))
@@ -3,14 +3,7 @@ import dataclasses
 import enum
 import timeit
 
-
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
-
-    def __add__(self, other):
-        return Coords(self.x + other.x, self.y + other.y)
+from advent_of_code.common import Coords, read_text
 
 
 @dataclasses.dataclass(frozen=True)
@@ -64,8 +57,7 @@ class ElfGoblinCombat:
 
     @staticmethod
     def read_file():
-        with open("input.txt") as f:
-            return f.read().strip()
+        return read_text().strip()
 
     @classmethod
     def read_input(cls, input_, elf_attack=DEFAULT_ATTACK_POWER):
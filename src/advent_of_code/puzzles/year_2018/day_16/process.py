@@ -6,6 +6,8 @@ import operator
 import timeit
 from typing import Any, cast
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Instructions:
@@ -30,8 +32,7 @@ class DeviceVM:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            input_ = f.read().strip()
+        input_ = read_text().strip()
         raw_samples, raw_test_program = input_.split("\n\n\n\n")
 
         raw_samples = raw_samples.split("\n\n")
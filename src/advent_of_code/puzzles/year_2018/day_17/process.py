@@ -1,13 +1,8 @@
-import dataclasses
 import enum
 import operator
 import timeit
 
-
-@dataclasses.dataclass(frozen=True, eq=True)
-class Coords:
-    x: int
-    y: int
+from advent_of_code.common import Coords, read_text
 
 
 class Ground(enum.Enum):
@@ -46,8 +41,7 @@ class ReservoirResearch:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def _clay_calc(self, input_):
         clay = set()
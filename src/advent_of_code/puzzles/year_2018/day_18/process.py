@@ -1,102 +1,69 @@
-import collections
 import enum
 import timeit
 
+import numpy as np
 
-class Acre(enum.Enum):
-    OPEN_GROUND = "."
-    TREES = "|"
-    LUMBERYARD = "#"
+from advent_of_code.common import (
+    CycleDetector,
+    GridAutomaton,
+    fingerprint,
+    format_cells,
+    parse_cells,
+    read_text,
+)
 
 
-Coords = collections.namedtuple("Coords", "x y")
+class Acre(enum.IntEnum):
+    OPEN_GROUND = 0
+    TREES = 1
+    LUMBERYARD = 2
 
 
-DIRECTIONS = {
-    "up": Coords(0, 1),
-    "right-up": Coords(1, 1),
-    "right": Coords(1, 0),
-    "right-down": Coords(1, -1),
-    "down": Coords(0, -1),
-    "left-down": Coords(-1, -1),
-    "left": Coords(-1, 0),
-    "left-up": Coords(-1, 1),
-}
+ACRE_STATES = {".": Acre.OPEN_GROUND, "|": Acre.TREES, "#": Acre.LUMBERYARD}
 
 
 class LumberCollectionArea:
     def __init__(self, grid_str=None):
         grid_str = grid_str if grid_str is not None else self._read_file()
-        grid = [list(line) for line in grid_str.splitlines()]
-        self.row_no = len(grid[0])
-        self.col_no = len(grid)
-        self.area = {}
-        for y, row in enumerate(grid):
-            for x, acre in enumerate(row):
-                acre_position = Coords(x, y)
-                self.area[acre_position] = Acre(acre)
+        self.area = parse_cells(grid_str, ACRE_STATES)
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read()
+        return read_text()
 
     def output_grid(self, area):
-        grid = [[None for _ in range(self.row_no)] for _ in range(self.col_no)]
-        for acre_coords, acre in area.items():
-            grid[acre_coords.y][acre_coords.x] = acre
-        return LumberCollectionArea._to_str(grid)
+        return format_cells(area, ACRE_STATES)
 
-    @staticmethod
-    def _to_str(input_list):
-        return "\n".join(["".join([acre.value for acre in row]) for row in input_list])
+
+def lumber_rule(automaton, area):
+    trees = automaton.count_neighbours(area == Acre.TREES)
+    lumberyards = automaton.count_neighbours(area == Acre.LUMBERYARD)
+    next_area = area.copy()
+    next_area[(area == Acre.OPEN_GROUND) & (trees >= 3)] = Acre.TREES
+    next_area[(area == Acre.TREES) & (lumberyards >= 3)] = Acre.LUMBERYARD
+    next_area[(area == Acre.LUMBERYARD) & ~((lumberyards >= 1) & (trees >= 1))] = (
+        Acre.OPEN_GROUND
+    )
+    return next_area
 
 
 class LumberCollectionAreaModel:
     def __init__(self, lumber_collection_area):
-        self.area = lumber_collection_area.area
-        self.adj_acres = {
-            acre_coords: self.surrounding_acres(acre_coords)
-            for acre_coords in self.area
-        }
+        self.automaton = GridAutomaton(lumber_collection_area.area, lumber_rule)
+
+    @property
+    def area(self):
+        return self.automaton.cells
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        current_seats = self.area
-        self.area = {}
-        for acre_coords, acre in current_seats.items():
-            adj_acre_coords = self.adj_acres[acre_coords]
-            adj_acres = collections.Counter(
-                current_seats[adj_seat] for adj_seat in adj_acre_coords
-            )
-            if acre == Acre.OPEN_GROUND and adj_acres.get(Acre.TREES, 0) >= 3:
-                self.area[acre_coords] = Acre.TREES
-            elif acre == Acre.TREES and adj_acres.get(Acre.LUMBERYARD, 0) >= 3:
-                self.area[acre_coords] = Acre.LUMBERYARD
-            elif acre == Acre.LUMBERYARD and not (
-                adj_acres.get(Acre.LUMBERYARD, 0) >= 1
-                and adj_acres.get(Acre.TREES, 0) >= 1
-            ):
-                self.area[acre_coords] = Acre.OPEN_GROUND
-            else:
-                self.area[acre_coords] = acre
-        return self.area
-
-    def surrounding_acres(self, acre_coords):
-        next_coords = []
-        for direction in DIRECTIONS.values():
-            next_coord = Coords(
-                acre_coords.x + direction.x, acre_coords.y + direction.y
-            )
-            if next_coord in self.area:
-                next_coords.append(next_coord)
-        return next_coords
+        return self.automaton.step()
 
     def resource_value(self):
-        area_count = collections.Counter(self.area.values())
-        return area_count[Acre.TREES] * area_count[Acre.LUMBERYARD]
+        area_count = np.bincount(self.area.ravel(), minlength=len(Acre))
+        return int(area_count[Acre.TREES]) * int(area_count[Acre.LUMBERYARD])
 
 
 def run_model_part_1():
@@ -107,30 +74,20 @@ def run_model_part_1():
     return primed_model.resource_value()
 
 
-def run_model_part_2():
-    runs = 1_000_000_000
+def run_model_part_2(runs=1_000_000_000):
     lumber_collection_area = LumberCollectionArea()
     lumber_collection_area_model = LumberCollectionAreaModel(lumber_collection_area)
-    areas = set()
-    repeating_group = []
-    for run_no in range(runs):
-        grid = next(lumber_collection_area_model)
-        grid_str = lumber_collection_area.output_grid(grid)
-        if grid_str in areas:
-            if not repeating_group:
-                repeating_group.append(grid_str)
-                first_repetition_start = run_no
-            elif grid_str in repeating_group:
-                break
-            else:
-                repeating_group.append(grid_str)
-        else:
-            areas.add(grid_str)
-    periodicity = len(repeating_group)
-    multiply_factor = (runs - first_repetition_start) // periodicity
-    offset = runs - (first_repetition_start + (multiply_factor * periodicity))
-    area_count = collections.Counter(repeating_group[offset - 1])
-    return area_count[Acre.TREES.value] * area_count[Acre.LUMBERYARD.value]
+    detector = CycleDetector()
+    detector.add(fingerprint(lumber_collection_area.area.tobytes()))
+    for run_no in range(1, runs + 1):
+        area = next(lumber_collection_area_model)
+        area_cycle = detector.add(fingerprint(area.tobytes()))
+        if area_cycle is not None:
+            # the area has been seen before, so skip all the full cycles
+            for _ in range((runs - run_no) % area_cycle.length):
+                next(lumber_collection_area_model)
+            break
+    return lumber_collection_area_model.resource_value()
 
 
 def main():
@@ -3,6 +3,8 @@ import functools
 import operator
 import timeit
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Instructions:
@@ -29,8 +31,7 @@ class DeviceVM:
 
     @classmethod
     def read_file(cls, reg_0=0):
-        with open("input.txt") as f:
-            return cls.read_input(f.read().strip(), reg_0)
+        return cls.read_input(read_text().strip(), reg_0)
 
     @classmethod
     def read_input(cls, program, reg_0=0, debug=False):
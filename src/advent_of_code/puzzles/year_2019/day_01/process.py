@@ -1,3 +1,6 @@
+from advent_of_code.common import stream_lines
+
+
 def mass_to_fuel(mass):
     return (mass // 3) - 2
 
@@ -17,8 +20,7 @@ def total_fuel(initial_fuel):
 
 
 def main():
-    with open("input.txt") as f:
-        masses = [int(mass) for mass in f]
+    masses = [int(mass) for mass in stream_lines()]
     initial_fuels = [mass_to_fuel(mass) for mass in masses]
     print(f"initial fuel = {sum(initial_fuels)}")
     print(f"total fuel = {sum(total_fuel(fuel) for fuel in initial_fuels)}")
@@ -1,14 +1,15 @@
 import itertools
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class OpCode:
     def __init__(self):
         self.instructions = []
 
     def read_file(self):
-        with open("input.txt") as f:
-            self.instructions = [int(opcode) for opcode in f.read().rstrip().split(",")]
+        self.instructions = [int(opcode) for opcode in read_text().rstrip().split(",")]
 
     def process(self, input1=None, input2=None):
         instructions = self.instructions.copy()
@@ -1,6 +1,8 @@
 import collections
 import timeit
 
+from advent_of_code.common import read_text
+
 Direction = collections.namedtuple("Direction", "coordinate change")
 
 
@@ -23,10 +25,9 @@ class CrossedWires:
         self.intersections: set[tuple[int, int]]
 
     def read_file(self):
-        with open("input.txt") as f:
-            text = f.readlines()
-            self.path1 = text[0].split(",")
-            self.path2 = text[1].split(",")
+        text = read_text().splitlines()
+        self.path1 = text[0].split(",")
+        self.path2 = text[1].split(",")
 
     def _find_coordinates(self, path):
         coords = set()
@@ -1,5 +1,7 @@
 import operator
 
+from advent_of_code.common import read_text
+
 
 class OpCode:
     def __init__(self, instructions, input=1):
@@ -67,8 +69,7 @@ class OpCode:
 
 
 def read_file():
-    with open("input.txt") as f:
-        return [int(opcode) for opcode in f.read().rstrip().split(",")]
+    return [int(opcode) for opcode in read_text().rstrip().split(",")]
 
 
 def main():
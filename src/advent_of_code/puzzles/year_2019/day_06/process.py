@@ -1,9 +1,10 @@
 import collections
 
+from advent_of_code.common import read_text
+
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def process_text(text):
@@ -33,3 +33,9 @@ def test_example_5():
     )
     output = process.highest_signal(text, range(5, 10), feedback_loop=True)
     assert output == 18216
+
+
+def test_pool_matches_in_process():
+    text = "3,26,1001,26,-4,26,3,27,1002,27,2,27,1,27,26,27,4,27,1001,28,-1,28,1005,28,6,99,0,0,5"
+    output = process.highest_signal(text, range(5, 10), feedback_loop=True, jobs=2)
+    assert output == 139629729
@@ -5,6 +5,8 @@ import timeit
 import PIL.Image
 import PIL.ImageColor
 
+from advent_of_code.common import read_text
+
 
 def grouper(iterable, n, fillvalue=None):
     "Collect data into fixed-length chunks or blocks"
@@ -14,8 +16,7 @@ def grouper(iterable, n, fillvalue=None):
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read().rstrip()
+    return read_text().rstrip()
 
 
 def process_text(text):
@@ -3,12 +3,13 @@ import decimal
 import math
 import timeit
 
+from advent_of_code.common import read_text
+
 Coords = collections.namedtuple("Coords", "x y")
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def grid(text):
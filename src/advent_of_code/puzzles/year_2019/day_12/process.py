@@ -5,6 +5,8 @@ import dataclasses
 
 import numpy as np
 
+from advent_of_code.common import read_text
+
 Coords = collections.namedtuple("Coords", "x y z")
 
 
@@ -108,8 +110,7 @@ class Moons:
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read().rstrip()
+    return read_text().rstrip()
 
 
 def process_text(text):
@@ -8,6 +8,8 @@ import fractions
 
 import numpy
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass
 class Product:
@@ -27,8 +29,7 @@ class Package:
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read().rstrip()
+    return read_text().rstrip()
 
 
 def _split_package_text(text):
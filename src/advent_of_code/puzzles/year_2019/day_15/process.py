@@ -1,160 +1,14 @@
-import itertools
-import operator
+import collections
 import dataclasses
+import sys
 import timeit
 
-
-def pairwise(iterable):
-    "s -> (s0,s1), (s1,s2), (s2, s3), ..."
-    a, b = itertools.tee(iterable)
-    next(b, None)
-    return zip(a, b)
-
-
-class IntCodeProgram(list):
-    def _fill(self, key):
-        extension = [0] * (key - len(self) + 1)
-        self.extend(extension)
-
-    def __getitem__(self, key):  # ty: ignore[invalid-method-override]
-        try:
-            return super().__getitem__(key)
-        except IndexError:
-            self._fill(key)
-            return super().__getitem__(key)
-
-    def __setitem__(self, key, value):  # ty: ignore[invalid-method-override]
-        try:
-            super().__setitem__(key, value)
-        except IndexError:
-            self._fill(key)
-            super().__setitem__(key, value)
-
-
-class IntCodeVM:
-    def __init__(self, program, initial=None):
-        self.program = IntCodeProgram(
-            int(instruction) for instruction in program.split(",")
-        )
-        self.instruction_pointer = 0
-        self.relative_base = 0
-        self.opcode: str
-        self.input = [initial] if initial is not None else []
-        self.output = []
-
-    def get_next_output(self):
-        next_output = self.output.pop(0)
-        return next_output
-
-    def _read_param(self, offset_index):
-        mode = int(self.opcode[-(offset_index + 2)])
-        address = self.program[self.instruction_pointer + offset_index]
-        if mode == 0:
-            param = self.program[address]
-        elif mode == 1:
-            param = address
-        elif mode == 2:
-            param = self.program[self.relative_base + address]
-        else:
-            raise Exception
-        return param
-
-    def _write_param(self, offset_index, value):
-        mode = int(self.opcode[-(offset_index + 2)])
-        address = self.program[self.instruction_pointer + offset_index]
-        if mode == 0:
-            self.program[address] = value
-        elif mode == 2:
-            self.program[self.relative_base + address] = value
-        else:
-            raise Exception
-
-    def process_three_params(self, operation):
-        param1 = self._read_param(1)
-        param2 = self._read_param(2)
-        value = operation(param1, param2)
-        self._write_param(3, int(value))
-        self.instruction_pointer += 4
-
-    def _write_input(self):
-        if self.input:
-            next_input = self.input.pop(0)
-            self._write_param(1, next_input)
-            self.instruction_pointer += 2
-            return True
-        else:
-            return False
-
-    def _read_output(self):
-        self.output.append(self._read_param(1))
-        self.instruction_pointer += 2
-
-    def _change_relative_base(self):
-        param = self._read_param(1)
-        self.relative_base += param
-        self.instruction_pointer += 2
-
-    def _change_pointer(self, reverse=False):
-        param1 = self._read_param(1)
-        param2 = self._read_param(2)
-        if reverse:
-            param1 = not param1
-        if param1:
-            self.instruction_pointer = param2
-        else:
-            self.instruction_pointer += 3
-
-    def process(self, input_val=None):
-        if input_val is not None:
-            self.input.append(input_val)
-        while True:
-            self.opcode = str(self.program[self.instruction_pointer]).zfill(5)
-            instruction = self.opcode[-2:]
-            if instruction == "99":
-                return "end"
-            if instruction == "01":
-                self.process_three_params(operator.add)
-            if instruction == "02":
-                self.process_three_params(operator.mul)
-            if instruction == "03":
-                written = self._write_input()
-                if not written:
-                    return "waiting for input"
-            if instruction == "04":
-                self._read_output()
-            if instruction == "05":
-                self._change_pointer(reverse=False)
-            if instruction == "06":
-                self._change_pointer(reverse=True)
-            if instruction == "07":
-                self.process_three_params(operator.lt)
-            if instruction == "08":
-                self.process_three_params(operator.eq)
-            if instruction == "09":
-                self._change_relative_base()
+from advent_of_code.common import Coords, read_text
+from advent_of_code.puzzles.year_2019.intcode import CompiledIntCodeVM
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read().rstrip()
-
-
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
-
-    def __add__(self, other):
-        return Coords(
-            self.x + other.x,
-            self.y + other.y,
-        )
-
-    def __sub__(self, other):
-        return Coords(
-            self.x - other.x,
-            self.y - other.y,
-        )
+    return read_text().rstrip()
 
 
 @dataclasses.dataclass
@@ -165,6 +19,12 @@ class Node:
 
 
 class RepairDroid:
+    """
+    Maps the maze by breadth-first search, forking the droid's computer at every
+    open square so each frontier square gets its own droid to probe from,
+    rather than steering one droid back and forth along the explored paths.
+    """
+
     DIRECTIONS = ("N", "S", "W", "E")
 
     DIRECTION_COORDINATES = {
@@ -174,113 +34,48 @@ class RepairDroid:
         "W": Coords(-1, 0),
     }
 
-    COORDINATES_DIRECTIONS = {
-        value: key for key, value in DIRECTION_COORDINATES.items()
-    }
+    MOVEMENT_COMMANDS = {"N": 1, "S": 2, "W": 3, "E": 4}
 
     def __init__(self, program):
-        self.computer = IntCodeVM(program)
+        self.computer = CompiledIntCodeVM(program)
         start = Coords(0, 0)
         self.droid = start
-        self.open_list = []
+        self.open_squares = None
+        self.oxygen_systems = set()
         self.oxygen_system = None
         self.details = {}
-
-    @property
-    def droid_node(self):
-        return self.details[self.droid]
+        self.fork_footprints = []
 
     def _new_location(self, location, direction):
         change = self.DIRECTION_COORDINATES[direction]
         new_location = location + change
         return new_location
 
-    def _attempt_move_droid_in_direction(self, direction):
-        directions = (None, "N", "S", "W", "E")
-        computer_input = directions.index(direction)
-        state = self.computer.process(computer_input)
+    def _attempt_move(self, computer, direction):
+        state = computer.process(self.MOVEMENT_COMMANDS[direction])
         assert state == "waiting for input"
-        output = self.computer.get_next_output()
-        return output
-
-    def _move_droid_in_direction(self, direction, track=False):
-        output = self._attempt_move_droid_in_direction(direction)
-        new_location = self._new_location(self.droid, direction)
-        if output in (1, 2):
-            distance_from_start = self.droid_node.distance_from_start + 1
-            if track and (
-                new_location not in self.details
-                or distance_from_start < self.details[new_location].distance_from_start
-            ):
-                self.details[new_location] = Node(
-                    distance_from_start=distance_from_start,
-                    previous_node=self.droid,
-                    is_oxygen_system=True if output == 2 else False,
-                )
-                self.open_list.append(new_location)
-            self.droid = new_location
-            did_move = True
-        elif output == 0:
-            did_move = False
-        else:
-            raise Exception
-        return did_move
-
-    def _uncover_square(self, direction="N"):
-        opposite_directions = {
-            "N": "S",
-            "S": "N",
-            "E": "W",
-            "W": "E",
-        }
-        movable_to = self._move_droid_in_direction(direction, track=True)
-        if movable_to:
-            self._move_droid_in_direction(opposite_directions[direction], track=True)
-        return movable_to
-
-    def _backtrack_to_start(self, position):
-        path = [position]
-        while True:
-            node = self.details[position]
-            position = node.previous_node
-            if position is None:
-                break
-            path.append(position)
-        return path
-
-    @staticmethod
-    def _path_to_path(path, other_path):
-        path_segment = []
+        return computer.get_next_output()
 
-        for node in path:
-            path_segment.append(node)
-            if node in other_path:
-                common_node = node
-                break
-
-        other_path_segment = []
-        for node in other_path:
-            other_path_segment.append(node)
-            if node == common_node:
-                break
-
-        reversed_other_path_segment = list(reversed(other_path_segment))
-        common_path = path_segment + reversed_other_path_segment[1:]
-        return common_path
-
-    def _move_droid_to_position(self, position):
-        if self.droid == position:
-            return
-        current_path_to_start = self._backtrack_to_start(self.droid)
-        other_path_to_start = self._backtrack_to_start(position)
-        path = self._path_to_path(current_path_to_start, other_path_to_start)
-        coord_directions = [next - previous for previous, next in pairwise(path)]
-        directions = [
-            self.COORDINATES_DIRECTIONS[coords] for coords in coord_directions
-        ]
-        for direction in directions:
-            did_move = self._move_droid_in_direction(direction, track=False)
-            assert did_move
+    def _explore(self):
+        self.open_squares = {self.droid}
+        frontier = collections.deque([(self.droid, self.computer)])
+        while frontier:
+            position, computer = frontier.popleft()
+            for direction in self.DIRECTIONS:
+                new_location = self._new_location(position, direction)
+                if new_location in self.open_squares:
+                    continue
+                droid_computer = computer.fork()
+                self.fork_footprints.append(droid_computer.footprint())
+                output = self._attempt_move(droid_computer, direction)
+                if output == 0:
+                    continue
+                if output not in (1, 2):
+                    raise Exception
+                self.open_squares.add(new_location)
+                if output == 2:
+                    self.oxygen_systems.add(new_location)
+                frontier.append((new_location, droid_computer))
 
     def find_oxygen_system_node(self):
         for coords, node in self.details.items():
@@ -288,18 +83,30 @@ class RepairDroid:
                 self.oxygen_system = coords
 
     def map_maze(self, start=Coords(0, 0), reset=False):
-        if start != self.droid:
-            self._move_droid_to_position(start)
+        if self.open_squares is None:
+            self._explore()
         if reset:
-            self.open_list = []
             self.details = {}
-        self.open_list.append(start)
-        self.details[start] = Node(distance_from_start=0)
-        while self.open_list:
-            next_position = self.open_list.pop(0)
-            self._move_droid_to_position(next_position)
+        self.details[start] = Node(
+            distance_from_start=0, is_oxygen_system=start in self.oxygen_systems
+        )
+        open_list = collections.deque([start])
+        while open_list:
+            position = open_list.popleft()
+            distance_from_start = self.details[position].distance_from_start + 1
             for direction in self.DIRECTIONS:
-                self._uncover_square(direction)
+                new_location = self._new_location(position, direction)
+                if (
+                    new_location not in self.open_squares
+                    or new_location in self.details
+                ):
+                    continue
+                self.details[new_location] = Node(
+                    distance_from_start=distance_from_start,
+                    previous_node=position,
+                    is_oxygen_system=new_location in self.oxygen_systems,
+                )
+                open_list.append(new_location)
 
     def shortest_path_to_oxygen(self):
         oxygen_system_node = self.details[self.oxygen_system]
@@ -311,6 +118,9 @@ class RepairDroid:
         ).distance_from_start
         return furthest_distance
 
+    def mean_fork_footprint(self):
+        return sum(self.fork_footprints) / len(self.fork_footprints)
+
 
 def main():
     program = read_file()
@@ -322,6 +132,10 @@ def main():
     )
     rd.map_maze(start=rd.oxygen_system, reset=True)
     print("Time for oxygen to fill room:", rd.furthest_from_start())
+    print(
+        f"Mean memory per droid fork: {rd.mean_fork_footprint():.0f} bytes",
+        file=sys.stderr,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+import collections
+
+from advent_of_code.puzzles.year_2019.day_15 import process
+
+MAZE = """\
+ ##
+#D.##
+#.#..#
+#.O.#
+ ###"""
+
+
+class MazeComputer:
+    """
+    Stands in for the repair droid's Intcode program, answering movement
+    commands from a text maze.
+    """
+
+    MOVES = {1: (0, -1), 2: (0, 1), 3: (-1, 0), 4: (1, 0)}
+
+    def __init__(self, maze, position=None):
+        self.maze = maze
+        self.rows = maze.splitlines()
+        if position is None:
+            position = next(
+                (x, y)
+                for y, row in enumerate(self.rows)
+                for x, char in enumerate(row)
+                if char == "D"
+            )
+        self.position = position
+        self.output = collections.deque()
+
+    def _at(self, x, y):
+        try:
+            return self.rows[y][x]
+        except IndexError:
+            return " "
+
+    def process(self, input_val):
+        dx, dy = self.MOVES[input_val]
+        x, y = self.position[0] + dx, self.position[1] + dy
+        char = self._at(x, y)
+        if char in "# ":
+            self.output.append(0)
+        else:
+            self.position = (x, y)
+            self.output.append(2 if char == "O" else 1)
+        return "waiting for input"
+
+    def get_next_output(self):
+        return self.output.popleft()
+
+    def fork(self):
+        return MazeComputer(self.maze, self.position)
+
+    def footprint(self):
+        return 0
+
+
+def test_repair_droid(monkeypatch):
+    monkeypatch.setattr(process, "CompiledIntCodeVM", MazeComputer)
+    rd = process.RepairDroid(MAZE)
+    rd.map_maze()
+    rd.find_oxygen_system_node()
+    assert rd.oxygen_system == process.Coords(1, 2)
+    assert rd.shortest_path_to_oxygen() == 3
+    rd.map_maze(start=rd.oxygen_system, reset=True)
+    assert rd.furthest_from_start() == 4
@@ -2,6 +2,8 @@ import collections
 import itertools
 import timeit
 
+from advent_of_code.common import read_text
+
 
 def consume(iterator, n=None):
     "Advance the iterator n-steps ahead. If n is None, consume entirely."
@@ -80,8 +82,7 @@ class FFTXL:
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read().rstrip()
+    return read_text().rstrip()
 
 
 def main_1():
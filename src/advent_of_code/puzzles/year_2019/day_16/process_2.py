@@ -1,6 +1,8 @@
 import itertools
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class FFT:
     def __init__(self, signal, repeat=10000, offset_digits=7, output_digits=8):
@@ -33,8 +35,7 @@ class FFT:
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read().rstrip()
+    return read_text().rstrip()
 
 
 def main():
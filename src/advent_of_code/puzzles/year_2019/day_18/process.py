@@ -1,14 +1,14 @@
 import dataclasses
 import collections
-import functools
 import itertools
 import pprint
 import timeit
 import typing
 import string
+import sys
 
 
-from advent_of_code.common import Coords
+from advent_of_code.common import Coords, memoize, read_text
 
 
 def pairwise(iterable):
@@ -99,22 +99,6 @@ class KeyPair:
     doors: typing.Sequence[str] = ()
 
 
-def cached(func):
-    func.cache = {}
-
-    @functools.wraps(func)
-    def wrapper(*args):
-        try:
-            result = func.cache[args]
-        except KeyError:
-            func.cache[args] = result = func(*args)
-            return result
-        else:
-            return result
-
-    return wrapper
-
-
 class Maze:
     DIRECTION_COORDINATES = {
         "N": Coords(0, -1),
@@ -148,8 +132,7 @@ class Maze:
         )
 
     def read_file(self):
-        with open(self.filename) as f:
-            maze_str = f.read().rstrip()
+        maze_str = read_text(path=self.filename).rstrip()
         self.preprocess_maze(maze_str)
 
     def preprocess_maze(self, maze_str):
@@ -307,9 +290,9 @@ class Maze:
         # print(self._distance_2.cache_info())
         return min(distances)
 
-    @functools.cache
+    @memoize
     def _distance_2(self, positions, end_key):
-        print(positions, end_key)
+        # print(positions, end_key)
         if len(positions) == 1:
             assert positions == frozenset(end_key)
             key_pair_info = self.key_pairs[frozenset(list(positions) + ["@"])]
@@ -508,7 +491,7 @@ class Maze:
                     open_list.append(next_path)
                     details[next_path.position].append(next_path)
                     self.times_passed += 1
-        print(self.times_passed)
+        print(self.times_passed, file=sys.stderr)
         return current_position.distance_from_start
 
     times_passed = 0
@@ -0,0 +1,3 @@
+from advent_of_code.puzzles.year_2019.intcode.vm import *  # noqa: F403
+from advent_of_code.puzzles.year_2019.intcode.compiler import *  # noqa: F403
+from advent_of_code.puzzles.year_2019.intcode.network import *  # noqa: F403
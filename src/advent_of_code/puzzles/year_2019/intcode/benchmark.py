@@ -0,0 +1,56 @@
+"""
+Intcode instruction throughput benchmark.
+
+Runs a countdown loop whose executed instruction count is known exactly, and
+reports instructions per second. Usage:
+
+    python -m advent_of_code.puzzles.year_2019.intcode.benchmark [loops]
+"""
+
+import sys
+import time
+
+from advent_of_code.puzzles.year_2019.intcode.compiler import CompiledIntCodeVM
+from advent_of_code.puzzles.year_2019.intcode.vm import END, IntCodeVM
+
+# 0: rb = 200
+# 2: [rb] = loops
+# 6: [rb] = -1 + [rb]           (loop start)
+# 10: [151] = [150] * 1
+# 14: [152] = [rb] < 1
+# 18: if [152] == 0 goto 6
+# 21: halt
+# Memory is only 22 long, so the first accesses at 150+ also exercise growth.
+COUNTDOWN_PROGRAM = (
+    "109,200,21101,0,{loops},0,22101,-1,0,0,1002,150,1,151,1207,0,1,152,1006,152,6,99"
+)
+SETUP_INSTRUCTIONS = 2
+LOOP_INSTRUCTIONS = 4
+HALT_INSTRUCTIONS = 1
+
+
+def countdown_instruction_count(loops: int) -> int:
+    return SETUP_INSTRUCTIONS + LOOP_INSTRUCTIONS * loops + HALT_INSTRUCTIONS
+
+
+def instruction_throughput(loops: int = 1_000_000, vm_cls=IntCodeVM) -> float:
+    vm = vm_cls(COUNTDOWN_PROGRAM.format(loops=loops))
+    start = time.perf_counter()
+    state = vm.process()
+    elapsed = time.perf_counter() - start
+    assert state == END
+    return countdown_instruction_count(loops) / elapsed
+
+
+def main() -> None:
+    loops = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for vm_cls in (IntCodeVM, CompiledIntCodeVM):
+        throughput = instruction_throughput(loops, vm_cls)
+        print(
+            f"{vm_cls.__name__}: {countdown_instruction_count(loops):,} instructions: "
+            f"{throughput:,.0f} instructions/second"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from typing import Self
+
+from advent_of_code.puzzles.year_2019.intcode.vm import (
+    ADD,
+    ADJUST_RELATIVE_BASE,
+    ARITY,
+    END,
+    EQUALS,
+    HALT,
+    IMMEDIATE_MODE,
+    INPUT,
+    JUMP_IF_FALSE,
+    JUMP_IF_TRUE,
+    LESS_THAN,
+    MUL,
+    OUTPUT,
+    POSITION_MODE,
+    WAITING_FOR_INPUT,
+    IntCodeSnapshot,
+    IntCodeVM,
+)
+
+__all__ = ["CompiledIntCodeVM"]
+
+# block exit statuses
+CONTINUE = 0
+HALTED = 1
+WAITING = 2
+GROW = 3
+MODIFIED = 4
+
+BINARY_OPS = {ADD: "{a} + {b}", MUL: "{a} * {b}"}
+COMPARISON_OPS = {LESS_THAN: "<", EQUALS: "=="}
+
+# Longest run of instructions translated into a single block.
+MAX_BLOCK_INSTRUCTIONS = 64
+# Translated blocks invalidated by self-modifying writes more than this many
+# times make the VM give up translating and fall back to the interpreter.
+MAX_INVALIDATIONS = 16
+
+
+def _read_expr(mode: int, val: int) -> str:
+    if mode == POSITION_MODE:
+        return f"mem[{val}]"
+    if mode == IMMEDIATE_MODE:
+        return str(val)
+    return f"mem[rb + {val}]"
+
+
+def _write_addr_expr(mode: int, val: int) -> str:
+    if mode == POSITION_MODE:
+        return str(val)
+    return f"rb + {val}"
+
+
+class CompiledIntCodeVM(IntCodeVM):
+    """
+    Intcode VM that translates straight-line basic blocks into generated Python
+    functions and caches them by start address, so each instruction's decoding
+    and mode dispatch happens once at translation rather than on every execution.
+
+    A block runs until a jump, input or halt (or MAX_BLOCK_INSTRUCTIONS). Every
+    write checks whether it landed on translated code; if so, the affected blocks
+    are dropped and retranslated when next reached. A program that keeps doing
+    this is handed over to the plain interpreter for the rest of the run.
+
+    It keeps the same `process` protocol as IntCodeVM. Writes to memory from
+    outside the VM should go through `change_memory` so stale blocks are dropped.
+    """
+
+    def __init__(self, program: str | Sequence[int], initial: int | None = None):
+        super().__init__(program, initial)
+        self._blocks: dict[int, Callable] = {}
+        self._block_ranges: dict[int, range] = {}
+        self._code: set[int] = set()
+        self._invalidations = 0
+        self._interpret = False
+
+    def change_memory(self, address: int, value: int) -> None:
+        super().change_memory(address, value)
+        if address in self._code:
+            self._invalidate(address)
+
+    def restore(self, snapshot: IntCodeSnapshot) -> None:
+        # only blocks whose code differs in the snapshot need dropping
+        changed = [
+            address
+            for address in self._code
+            if address >= len(snapshot.memory)
+            or snapshot.memory[address] != self.memory[address]
+        ]
+        super().restore(snapshot)
+        self._drop_blocks(changed)
+
+    def fork(self) -> Self:
+        # Translated blocks are pure functions of the code they were built
+        # from, so forks can reuse them, but each fork needs its own cache
+        # in case it goes on to modify its code.
+        forked = super().fork()
+        forked._blocks = self._blocks.copy()
+        forked._block_ranges = self._block_ranges.copy()
+        forked._code = self._code.copy()
+        return forked
+
+    def footprint(self) -> int:
+        return (
+            super().footprint()
+            + sys.getsizeof(self._blocks)
+            + sys.getsizeof(self._block_ranges)
+            + sys.getsizeof(self._code)
+        )
+
+    def _drop_blocks(self, addresses: Iterable[int]) -> None:
+        addresses = set(addresses)
+        if not addresses:
+            return
+        stale = [
+            start
+            for start, block_range in self._block_ranges.items()
+            if not addresses.isdisjoint(block_range)
+        ]
+        for start in stale:
+            del self._blocks[start]
+            del self._block_ranges[start]
+        self._code = {
+            address
+            for block_range in self._block_ranges.values()
+            for address in block_range
+        }
+
+    def _invalidate(self, address: int) -> None:
+        self._drop_blocks([address])
+        self._invalidations += 1
+        if self._invalidations > MAX_INVALIDATIONS:
+            self._interpret = True
+
+    def _translate(self, start: int) -> Callable:
+        mem = self.memory
+        self._ensure_size(start + 1)
+        lines = []
+        static_addresses = [0]
+        end = start
+        ip = start
+        for _ in range(MAX_BLOCK_INSTRUCTIONS):
+            try:
+                opcode, *modes = self._decode(ip)
+            except ValueError:
+                if ip == start:
+                    raise
+                # possibly data, or code still to be patched by this block
+                lines.append(f"return {ip}, rb, {CONTINUE}")
+                break
+            arity = ARITY[opcode]
+            self._ensure_size(ip + arity + 1)
+            params = mem[ip + 1 : ip + arity + 1]
+            static_addresses.extend(
+                val for mode, val in zip(modes, params) if mode == POSITION_MODE
+            )
+            args = [_read_expr(mode, val) for mode, val in zip(modes, params)]
+            next_ip = end = ip + arity + 1
+            # marks the instruction to retry if a relative access needs more memory
+            lines.append(f"i = {ip}")
+
+            if opcode in BINARY_OPS or opcode in COMPARISON_OPS:
+                if opcode in BINARY_OPS:
+                    value = BINARY_OPS[opcode].format(a=args[0], b=args[1])
+                else:
+                    value = f"1 if {args[0]} {COMPARISON_OPS[opcode]} {args[1]} else 0"
+                lines.append(f"c = {_write_addr_expr(modes[2], params[2])}")
+                lines.append(f"mem[c] = {value}")
+                lines.append("if c in code:")
+                lines.append("    modified(c)")
+                lines.append(f"    return {next_ip}, rb, {MODIFIED}")
+            elif opcode == OUTPUT:
+                lines.append(f"outputs.append({args[0]})")
+            elif opcode == ADJUST_RELATIVE_BASE:
+                lines.append(f"rb += {args[0]}")
+            elif opcode in (JUMP_IF_TRUE, JUMP_IF_FALSE):
+                comparison = "!=" if opcode == JUMP_IF_TRUE else "=="
+                lines.append(f"if {args[0]} {comparison} 0:")
+                if modes[1] == IMMEDIATE_MODE and params[1] == start:
+                    # a tight loop back to this block's start stays in the block
+                    lines.append("    continue")
+                else:
+                    lines.append(f"    return {args[1]}, rb, {CONTINUE}")
+                lines.append(f"return {next_ip}, rb, {CONTINUE}")
+                break
+            elif opcode == INPUT:
+                lines.append("if not inputs:")
+                lines.append(f"    return {ip}, rb, {WAITING}")
+                lines.append(f"c = {_write_addr_expr(modes[0], params[0])}")
+                lines.append("mem[c] = inputs[0]")
+                lines.append("inputs.popleft()")
+                lines.append("if c in code:")
+                lines.append("    modified(c)")
+                lines.append(f"    return {next_ip}, rb, {MODIFIED}")
+                lines.append(f"return {next_ip}, rb, {CONTINUE}")
+                break
+            elif opcode == HALT:
+                lines.append(f"return {ip}, rb, {HALTED}")
+                break
+            ip = next_ip
+            if ip >= len(mem):
+                lines.append(f"return {ip}, rb, {CONTINUE}")
+                break
+        else:
+            lines.append(f"return {ip}, rb, {CONTINUE}")
+
+        # static addresses can be sized now, so only relative accesses can fail
+        self._ensure_size(max(static_addresses) + 1)
+        body = "\n".join(f"            {line}" for line in lines)
+        source = (
+            "def block(mem, rb, inputs, outputs, code, modified):\n"
+            "    i = 0\n"
+            "    try:\n"
+            "        while True:\n"
+            f"{body}\n"
+            "    except IndexError:\n"
+            f"        return i, rb, {GROW}\n"
+        )
+        namespace: dict = {}
+        exec(compile(source, f"<intcode block {start}>", "exec"), namespace)
+        block = namespace["block"]
+        self._blocks[start] = block
+        self._block_ranges[start] = range(start, end)
+        self._code.update(range(start, end))
+        return block
+
+    def process(self, input_val: int | None = None) -> str:
+        if self._interpret:
+            return super().process(input_val)
+        if input_val is not None:
+            self.input.append(input_val)
+        mem = self.memory
+        inputs = self.input
+        outputs = self.output
+        blocks = self._blocks
+        modified = self._invalidate
+        ip = self.instruction_pointer
+        rb = self.relative_base
+        try:
+            while True:
+                block = blocks.get(ip)
+                if block is None:
+                    block = self._translate(ip)
+                ip, rb, status = block(mem, rb, inputs, outputs, self._code, modified)
+                if status == CONTINUE:
+                    continue
+                if status == HALTED:
+                    return END
+                if status == WAITING:
+                    return WAITING_FOR_INPUT
+                if status == GROW:
+                    self._grow_for_instruction(ip, rb)
+                elif self._interpret:
+                    break
+        finally:
+            self.instruction_pointer = ip
+            self.relative_base = rb
+        return super().process()
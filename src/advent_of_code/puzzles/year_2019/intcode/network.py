@@ -0,0 +1,84 @@
+import asyncio
+from collections.abc import Iterable, Sequence
+
+from advent_of_code.puzzles.year_2019.intcode.vm import END, IntCodeVM
+
+__all__ = ["IntCodeNetwork", "NetworkDeadlock", "chain_links"]
+
+
+class NetworkDeadlock(Exception):
+    pass
+
+
+def chain_links(node_no: int, feedback_loop: bool = False) -> list[tuple[int, int]]:
+    """
+    Links for nodes wired output-to-input in series, optionally with the last
+    node's output fed back into the first.
+    """
+    links = [(node, node + 1) for node in range(node_no - 1)]
+    if feedback_loop:
+        links.append((node_no - 1, 0))
+    return links
+
+
+class IntCodeNetwork:
+    """
+    Runs Intcode VMs as coroutines connected by asyncio queues. Each (source,
+    target) link forwards every output of the source VM to the target's input.
+
+    Raises NetworkDeadlock if every running VM is waiting on an empty queue.
+    """
+
+    def __init__(
+        self, vms: Sequence[IntCodeVM], links: Iterable[tuple[int, int]]
+    ) -> None:
+        self.vms = vms
+        self.targets: list[list[int]] = [[] for _ in vms]
+        for source, target in links:
+            self.targets[source].append(target)
+        self.inboxes: list[asyncio.Queue[int]] = [asyncio.Queue() for _ in vms]
+        self.outputs: list[list[int]] = [[] for _ in vms]
+        self._running = len(vms)
+        self._blocked: set[int] = set()
+
+    def send(self, node: int, val: int) -> None:
+        self.inboxes[node].put_nowait(val)
+
+    def _check_deadlock(self) -> None:
+        if (
+            self._running
+            and len(self._blocked) == self._running
+            and all(self.inboxes[node].empty() for node in self._blocked)
+        ):
+            raise NetworkDeadlock(f"nodes {sorted(self._blocked)} are all waiting")
+
+    async def _run_node(self, node: int) -> None:
+        vm = self.vms[node]
+        inbox = self.inboxes[node]
+        while True:
+            state = vm.process()
+            while vm.output:
+                val = vm.output.popleft()
+                self.outputs[node].append(val)
+                for target in self.targets[node]:
+                    self.inboxes[target].put_nowait(val)
+            if state == END:
+                self._running -= 1
+                self._check_deadlock()
+                return
+            if inbox.empty():
+                self._blocked.add(node)
+                self._check_deadlock()
+                try:
+                    vm.input.append(await inbox.get())
+                finally:
+                    self._blocked.discard(node)
+            while not inbox.empty():
+                vm.input.append(inbox.get_nowait())
+
+    async def run(self) -> list[list[int]]:
+        """
+        Run every VM until it halts, returning the outputs of each node.
+        """
+        await asyncio.gather(*(self._run_node(node) for node in range(len(self.vms))))
+        return self.outputs
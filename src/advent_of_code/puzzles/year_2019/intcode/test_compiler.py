@@ -0,0 +1,90 @@
+import pytest
+
+from advent_of_code.puzzles.year_2019.intcode import benchmark, vm
+from advent_of_code.puzzles.year_2019.intcode.compiler import CompiledIntCodeVM
+from advent_of_code.puzzles.year_2019.intcode.test_vm import LARGER_EXAMPLE
+
+# increments the immediate operand of the next instruction until it reaches 30
+SELF_MODIFYING_LOOP = "101,1,5,5,1107,0,30,14,1005,14,0,4,5,99,0"
+
+
+@pytest.mark.parametrize("input_val, expected", [(7, 999), (8, 1000), (9, 1001)])
+def test_matches_interpreter(input_val, expected):
+    computer = CompiledIntCodeVM(LARGER_EXAMPLE, initial=input_val)
+    assert computer.process() == vm.END
+    assert list(computer.output) == [expected]
+
+
+def test_quine_with_relative_mode():
+    program = "109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99"
+    computer = CompiledIntCodeVM(program)
+    assert computer.process() == vm.END
+    assert ",".join(str(x) for x in computer.output) == program
+
+
+def test_jump_target_read_grows_memory():
+    computer = CompiledIntCodeVM("1007,30,1,30,5,30,1000,4,30,99")
+    assert computer.process() == vm.END
+    assert list(computer.output) == [0]
+
+
+def test_waits_for_input_and_resumes():
+    computer = CompiledIntCodeVM("3,0,4,0,3,0,4,0,99")
+    assert computer.process(5) == vm.WAITING_FOR_INPUT
+    assert computer.get() == 5
+    assert computer.process(6) == vm.END
+    assert computer.get() == 6
+
+
+def test_self_modifying_write_retranslates():
+    computer = CompiledIntCodeVM("1,9,10,3,2,3,11,0,99,30,40,50")
+    assert computer.process() == vm.END
+    assert computer.memory[0] == 3500
+
+
+def test_falls_back_to_interpreter_on_repeated_self_modification():
+    computer = CompiledIntCodeVM(SELF_MODIFYING_LOOP)
+    assert computer.process() == vm.END
+    assert list(computer.output) == [30]
+    assert computer._interpret
+
+
+def test_change_memory_drops_stale_blocks():
+    computer = CompiledIntCodeVM("3,7,104,1,3,7,99,0")
+    assert computer.process(0) == vm.WAITING_FOR_INPUT
+    computer.change_memory(address=3, value=2)
+    assert computer.process(0) == vm.END
+    assert list(computer.output) == [1]
+    computer.instruction_pointer = 0
+    assert computer.process(0) == vm.WAITING_FOR_INPUT
+    assert list(computer.output) == [1, 2]
+
+
+def test_benchmark_program():
+    computer = CompiledIntCodeVM(benchmark.COUNTDOWN_PROGRAM.format(loops=10))
+    assert computer.process() == vm.END
+    assert computer.memory[200] == 0
+
+
+def test_fork_keeps_own_block_cache():
+    computer = CompiledIntCodeVM("3,7,104,1,3,7,99,0")
+    computer.process(0)
+    forked = computer.fork()
+    forked.change_memory(address=3, value=2)
+    forked.instruction_pointer = 0
+    forked.process(0)
+    computer.instruction_pointer = 0
+    computer.process(0)
+    assert list(forked.output) == [1, 2]
+    assert list(computer.output) == [1, 1]
+
+
+def test_restore_drops_blocks_for_changed_code():
+    computer = CompiledIntCodeVM("3,7,104,1,3,7,99,0")
+    patched = computer.fork()
+    patched.change_memory(address=3, value=2)
+    snapshot = patched.snapshot()
+    computer.process(0)
+    computer.restore(snapshot)
+    computer.process(0)
+    assert list(computer.output) == [2]
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from advent_of_code.puzzles.year_2019.intcode import network, vm
+
+# adds one to each input it receives and outputs it, forever
+ADD_ONE_FOREVER = "3,100,1001,100,1,100,4,100,1105,1,0"
+# adds one to the single input it receives, outputs it and halts
+ADD_ONE_ONCE = "3,100,1001,100,1,100,4,100,99"
+
+
+def test_chain_links():
+    assert network.chain_links(3) == [(0, 1), (1, 2)]
+    assert network.chain_links(3, feedback_loop=True) == [(0, 1), (1, 2), (2, 0)]
+
+
+def test_long_chain():
+    vms = [vm.IntCodeVM(ADD_ONE_ONCE) for _ in range(50)]
+    net = network.IntCodeNetwork(vms, network.chain_links(len(vms)))
+    net.send(0, 0)
+    outputs = asyncio.run(net.run())
+    assert outputs[-1] == [50]
+
+
+def test_fan_out():
+    vms = [vm.IntCodeVM(ADD_ONE_ONCE) for _ in range(3)]
+    net = network.IntCodeNetwork(vms, [(0, 1), (0, 2)])
+    net.send(0, 10)
+    outputs = asyncio.run(net.run())
+    assert outputs == [[11], [12], [12]]
+
+
+def test_deadlock_detected():
+    vms = [vm.IntCodeVM(ADD_ONE_FOREVER) for _ in range(2)]
+    net = network.IntCodeNetwork(vms, network.chain_links(2))
+    net.send(0, 0)
+    with pytest.raises(network.NetworkDeadlock):
+        asyncio.run(net.run())
@@ -0,0 +1,95 @@
+import pytest
+
+from advent_of_code.puzzles.year_2019.intcode import vm
+from advent_of_code.puzzles.year_2019.intcode import benchmark
+
+LARGER_EXAMPLE = (
+    "3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,"
+    "1106,0,36,98,0,0,1002,21,125,20,4,20,1105,1,46,104,"
+    "999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99"
+)
+
+
+def test_decode_table():
+    assert vm.DECODE_TABLE[1002] == (vm.MUL, 0, 1, 0)
+    assert vm.DECODE_TABLE[21101] == (vm.ADD, 1, 1, 2)
+    assert vm.DECODE_TABLE[99] == (vm.HALT, 0, 0, 0)
+    assert vm.DECODE_TABLE[10] is None
+
+
+@pytest.mark.parametrize("input_val, expected", [(7, 999), (8, 1000), (9, 1001)])
+def test_comparisons_and_jumps(input_val, expected):
+    computer = vm.IntCodeVM(LARGER_EXAMPLE, initial=input_val)
+    assert computer.process() == vm.END
+    assert list(computer.output) == [expected]
+
+
+def test_waits_for_input_and_resumes():
+    computer = vm.IntCodeVM("3,0,4,0,3,0,4,0,99")
+    assert computer.process(5) == vm.WAITING_FOR_INPUT
+    assert computer.get() == 5
+    assert computer.process(6) == vm.END
+    assert computer.get() == 6
+
+
+def test_memory_grows_on_relative_write():
+    computer = vm.IntCodeVM("109,1000,21101,2,3,5,204,5,99")
+    assert computer.process() == vm.END
+    assert computer.get() == 5
+    assert len(computer.memory) >= 1006
+
+
+def test_input_not_lost_when_write_grows_memory():
+    computer = vm.IntCodeVM("3,500,4,500,99", initial=42)
+    computer.process()
+    assert list(computer.output) == [42]
+    assert not computer.input
+
+
+def test_jump_target_read_grows_memory():
+    # the jump target is read from address 1000, past the end of memory
+    computer = vm.IntCodeVM("1007,30,1,30,5,30,1000,4,30,99")
+    assert computer.process() == vm.END
+    assert list(computer.output) == [0]
+
+
+def test_invalid_instruction():
+    with pytest.raises(ValueError, match="Invalid instruction 42 at 0"):
+        vm.IntCodeVM("42,0,0,0").process()
+
+
+def test_benchmark_program_halts():
+    computer = vm.IntCodeVM(benchmark.COUNTDOWN_PROGRAM.format(loops=10))
+    assert computer.process() == vm.END
+    assert computer.memory[200] == 0
+    assert benchmark.countdown_instruction_count(10) == 43
+
+
+def test_fork_is_independent():
+    computer = vm.IntCodeVM("3,100,4,100,3,100,4,100,99")
+    computer.process(1)
+    forked = computer.fork()
+    assert forked.process(2) == vm.END
+    assert computer.process(3) == vm.END
+    assert list(forked.output) == [1, 2]
+    assert list(computer.output) == [1, 3]
+    assert forked.memory[100] == 2
+    assert computer.memory[100] == 3
+
+
+def test_snapshot_and_restore():
+    computer = vm.IntCodeVM("3,100,4,100,3,100,4,100,99")
+    computer.process(1)
+    snapshot = computer.snapshot()
+    computer.process(2)
+    computer.restore(snapshot)
+    assert computer.process(3) == vm.END
+    assert list(computer.output) == [1, 3]
+    # the snapshot is unaffected by running on from it
+    computer.restore(snapshot)
+    assert computer.memory[100] == 1
+
+
+def test_footprint():
+    computer = vm.IntCodeVM("1,0,0,0,99")
+    assert computer.footprint() > 0
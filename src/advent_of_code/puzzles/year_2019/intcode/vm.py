@@ -0,0 +1,291 @@
+import copy
+import itertools
+import sys
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Self
+
+__all__ = ["END", "WAITING_FOR_INPUT", "IntCodeSnapshot", "IntCodeVM", "parse_program"]
+
+END = "end"
+WAITING_FOR_INPUT = "waiting for input"
+
+ADD = 1
+MUL = 2
+INPUT = 3
+OUTPUT = 4
+JUMP_IF_TRUE = 5
+JUMP_IF_FALSE = 6
+LESS_THAN = 7
+EQUALS = 8
+ADJUST_RELATIVE_BASE = 9
+HALT = 99
+
+POSITION_MODE = 0
+IMMEDIATE_MODE = 1
+RELATIVE_MODE = 2
+
+# number of parameters following each opcode
+ARITY = {
+    ADD: 3,
+    MUL: 3,
+    INPUT: 1,
+    OUTPUT: 1,
+    JUMP_IF_TRUE: 2,
+    JUMP_IF_FALSE: 2,
+    LESS_THAN: 3,
+    EQUALS: 3,
+    ADJUST_RELATIVE_BASE: 1,
+    HALT: 0,
+}
+
+
+def _build_decode_table() -> list[tuple[int, int, int, int] | None]:
+    # Indexed by the raw instruction value, e.g. 1002 -> (MUL, 0, 1, 0), so the
+    # interpreter never has to split an instruction into digits at runtime.
+    table: list[tuple[int, int, int, int] | None] = [None] * 22300
+    for opcode in ARITY:
+        for mode_1, mode_2, mode_3 in itertools.product(range(3), repeat=3):
+            raw = mode_3 * 10000 + mode_2 * 1000 + mode_1 * 100 + opcode
+            table[raw] = (opcode, mode_1, mode_2, mode_3)
+    return table
+
+
+DECODE_TABLE = _build_decode_table()
+
+
+def parse_program(program: str) -> list[int]:
+    return [int(instruction) for instruction in program.strip().split(",")]
+
+
+@dataclass(frozen=True)
+class IntCodeSnapshot:
+    memory: tuple[int, ...]
+    instruction_pointer: int
+    relative_base: int
+    input: tuple[int, ...]
+    output: tuple[int, ...]
+
+
+class IntCodeVM:
+    """
+    Intcode interpreter with flat, geometrically grown memory and deque I/O.
+
+    `process` runs until the program halts ("end") or needs input it does not
+    have ("waiting for input"); it can then be resumed with more input.
+    """
+
+    def __init__(self, program: str | Sequence[int], initial: int | None = None):
+        if isinstance(program, str):
+            program = parse_program(program)
+        self.memory = list(program)
+        self.instruction_pointer = 0
+        self.relative_base = 0
+        self.input: deque[int] = deque() if initial is None else deque([initial])
+        self.output: deque[int] = deque()
+
+    def put(self, input_vals: Iterable[int]) -> None:
+        self.input.extend(input_vals)
+
+    def get(self) -> int:
+        return self.output.popleft()
+
+    def get_next_output(self) -> int:
+        return self.get()
+
+    def change_memory(self, address: int, value: int) -> None:
+        self._ensure_size(address + 1)
+        self.memory[address] = value
+
+    def snapshot(self) -> IntCodeSnapshot:
+        return IntCodeSnapshot(
+            memory=tuple(self.memory),
+            instruction_pointer=self.instruction_pointer,
+            relative_base=self.relative_base,
+            input=tuple(self.input),
+            output=tuple(self.output),
+        )
+
+    def restore(self, snapshot: IntCodeSnapshot) -> None:
+        self.memory = list(snapshot.memory)
+        self.instruction_pointer = snapshot.instruction_pointer
+        self.relative_base = snapshot.relative_base
+        self.input = deque(snapshot.input)
+        self.output = deque(snapshot.output)
+
+    def fork(self) -> Self:
+        """
+        An independent copy of this VM that can be run on from the current state.
+
+        Memory is a flat list of ints, which are immutable, so copying it only
+        copies an array of pointers (8 bytes per address) and is far cheaper
+        than a deep copy.
+        """
+        forked = copy.copy(self)
+        forked.memory = self.memory.copy()
+        forked.input = self.input.copy()
+        forked.output = self.output.copy()
+        return forked
+
+    def footprint(self) -> int:
+        """
+        Bytes held by this VM's own containers, i.e. the cost of one fork.
+        Int objects shared with other forks are not counted.
+        """
+        return (
+            sys.getsizeof(self.memory)
+            + sys.getsizeof(self.input)
+            + sys.getsizeof(self.output)
+        )
+
+    def _ensure_size(self, size: int) -> None:
+        memory = self.memory
+        if size > len(memory):
+            # grow in place so the interpreter's local reference stays valid
+            memory.extend([0] * (max(size, 2 * len(memory)) - len(memory)))
+
+    def _decode(self, ip: int) -> tuple[int, int, int, int]:
+        raw = self.memory[ip]
+        decoded = DECODE_TABLE[raw] if 0 <= raw < len(DECODE_TABLE) else None
+        if decoded is None:
+            raise ValueError(f"Invalid instruction {raw} at {ip}")
+        return decoded
+
+    def _grow_for_instruction(self, ip: int, rb: int) -> None:
+        """
+        Called when the instruction at ip touched memory beyond the end: work out
+        the highest address it needs and grow to fit.
+        """
+        memory = self.memory
+        size_before = len(memory)
+        self._ensure_size(ip + 1)
+        opcode, *modes = self._decode(ip)
+        arity = ARITY[opcode]
+        self._ensure_size(ip + arity + 1)
+        required = 0
+        for offset, mode in enumerate(modes[:arity], start=1):
+            if mode == POSITION_MODE:
+                required = max(required, memory[ip + offset] + 1)
+            elif mode == RELATIVE_MODE:
+                required = max(required, rb + memory[ip + offset] + 1)
+        self._ensure_size(required)
+        if len(memory) == size_before:
+            raise IndexError(f"Invalid memory access by instruction at {ip}")
+
+    def process(self, input_val: int | None = None) -> str:
+        if input_val is not None:
+            self.input.append(input_val)
+        mem = self.memory
+        decode_table = DECODE_TABLE
+        inputs = self.input
+        outputs = self.output
+        ip = self.instruction_pointer
+        rb = self.relative_base
+        try:
+            while True:
+                try:
+                    opcode, m1, m2, m3 = decode_table[mem[ip]]  # ty: ignore[not-iterable]
+
+                    # Opcodes and modes are spelled as literals here, since
+                    # comparing against module constants costs a global lookup
+                    # per instruction. Modes: 0 position, 1 immediate, 2 relative.
+                    if opcode == 1 or opcode == 2:  # ADD, MUL
+                        a = mem[ip + 1]
+                        if m1 == 0:
+                            a = mem[a]
+                        elif m1 == 2:
+                            a = mem[rb + a]
+                        b = mem[ip + 2]
+                        if m2 == 0:
+                            b = mem[b]
+                        elif m2 == 2:
+                            b = mem[rb + b]
+                        c = mem[ip + 3]
+                        if m3 == 2:
+                            c += rb
+                        mem[c] = a + b if opcode == 1 else a * b
+                        ip += 4
+
+                    elif opcode == 5 or opcode == 6:  # JUMP_IF_TRUE, JUMP_IF_FALSE
+                        a = mem[ip + 1]
+                        if m1 == 0:
+                            a = mem[a]
+                        elif m1 == 2:
+                            a = mem[rb + a]
+                        if (a != 0) is (opcode == 5):
+                            # ip is only moved once the target is read, so a
+                            # read past the end is retried from this jump
+                            b = mem[ip + 2]
+                            if m2 == 0:
+                                b = mem[b]
+                            elif m2 == 2:
+                                b = mem[rb + b]
+                            ip = b
+                        else:
+                            ip += 3
+
+                    elif opcode == 7 or opcode == 8:  # LESS_THAN, EQUALS
+                        a = mem[ip + 1]
+                        if m1 == 0:
+                            a = mem[a]
+                        elif m1 == 2:
+                            a = mem[rb + a]
+                        b = mem[ip + 2]
+                        if m2 == 0:
+                            b = mem[b]
+                        elif m2 == 2:
+                            b = mem[rb + b]
+                        c = mem[ip + 3]
+                        if m3 == 2:
+                            c += rb
+                        if opcode == 7:
+                            mem[c] = 1 if a < b else 0
+                        else:
+                            mem[c] = 1 if a == b else 0
+                        ip += 4
+
+                    elif opcode == 9:  # ADJUST_RELATIVE_BASE
+                        a = mem[ip + 1]
+                        if m1 == 0:
+                            a = mem[a]
+                        elif m1 == 2:
+                            a = mem[rb + a]
+                        rb += a
+                        ip += 2
+
+                    elif opcode == 3:  # INPUT
+                        if not inputs:
+                            return WAITING_FOR_INPUT
+                        c = mem[ip + 1]
+                        if m1 == 2:
+                            c += rb
+                        # write before consuming so a retry after growing
+                        # memory does not lose the input
+                        mem[c] = inputs[0]
+                        inputs.popleft()
+                        ip += 2
+
+                    elif opcode == 4:  # OUTPUT
+                        a = mem[ip + 1]
+                        if m1 == 0:
+                            a = mem[a]
+                        elif m1 == 2:
+                            a = mem[rb + a]
+                        outputs.append(a)
+                        ip += 2
+
+                    else:  # HALT
+                        return END
+
+                except IndexError:
+                    # every instruction only mutates state once all its memory
+                    # accesses have succeeded, so it can simply be retried
+                    self._grow_for_instruction(ip, rb)
+                except TypeError:
+                    # raises a clearer error if the instruction could not be decoded
+                    self._decode(ip)
+                    raise
+        finally:
+            self.instruction_pointer = ip
+            self.relative_base = rb
@@ -3,12 +3,13 @@ import math
 import functools
 import timeit
 
+from advent_of_code.common import stream_lines
+
 
 def read():
     input_list = []
-    with open("input.txt") as f:
-        for line in f:
-            input_list.append(int(line))
+    for line in stream_lines():
+        input_list.append(int(line))
     return input_list
 
 
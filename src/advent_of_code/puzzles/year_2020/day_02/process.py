@@ -1,9 +1,10 @@
 import timeit
 
+from advent_of_code.common import read_text
+
 
 def read():
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def sled_rental_rule(password, char, lower_bound, upper_bound):
@@ -1,6 +1,8 @@
 import timeit
 import math
 
+from advent_of_code.common import read_text
+
 TREE = "#"
 
 
@@ -13,8 +15,7 @@ class TobogganTrajectory:
         self.grid_cols = len(self.grid[0])
 
     def read_input(self):
-        with open("input.txt") as f:
-            return f.read().strip()
+        return read_text().strip()
 
     def generate_tree_coords(self, grid):
         tree_coords = set()
@@ -1,5 +1,6 @@
 import timeit
 
+from advent_of_code.common import read_text
 from advent_of_code.puzzles.year_2020.day_04 import passport_validation
 
 
@@ -20,8 +21,7 @@ class PassportProcessing:
 
     @staticmethod
     def read_file():
-        with open("input.txt") as f:
-            return f.read().strip()
+        return read_text().strip()
 
     @staticmethod
     def preprocess(data):
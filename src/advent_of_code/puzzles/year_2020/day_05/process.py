@@ -1,14 +1,15 @@
 import collections
 import timeit
 
+from advent_of_code.common import stream_lines
+
 
 class BinaryBoarding:
     def __init__(self, rows, cols):
         self.seats = []
-        with open("input.txt") as f:
-            for boarding_pass in f:
-                seat = self.process_pass(boarding_pass.rstrip())
-                self.seats.append(seat)
+        for boarding_pass in stream_lines():
+            seat = self.process_pass(boarding_pass.rstrip())
+            self.seats.append(seat)
         self.rows = rows
         self.cols = cols
 
@@ -1,5 +1,7 @@
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class CustomCustoms:
     def __init__(self, form_data=None):
@@ -8,8 +10,7 @@ class CustomCustoms:
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read().strip()
+        return read_text().strip()
 
     @staticmethod
     def _preprocess(form_data):
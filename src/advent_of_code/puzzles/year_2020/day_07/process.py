@@ -4,6 +4,8 @@ import timeit
 
 import networkx as nx
 
+from advent_of_code.common import read_text
+
 
 class HandyHaversacks:
     def __init__(self, bag_input=None):
@@ -13,8 +15,7 @@ class HandyHaversacks:
         print()
 
     def _read_file(self):
-        with open("input.txt") as f:
-            return f.read()
+        return read_text()
 
     def _preprocess(self, bag_input):
         bags = collections.defaultdict(dict)
@@ -1,5 +1,7 @@
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class HandheldHalting:
     def __init__(self, code_input=None):
@@ -8,8 +10,7 @@ class HandheldHalting:
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read()
+        return read_text()
 
     @staticmethod
     def _preprocess(code_input):
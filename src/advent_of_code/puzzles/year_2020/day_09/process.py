@@ -2,6 +2,8 @@ import timeit
 
 import more_itertools
 
+from advent_of_code.common import read_text
+
 
 class EncodingError:
     def __init__(self, cypher_input=None):
@@ -10,8 +12,7 @@ class EncodingError:
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read()
+        return read_text()
 
     @staticmethod
     def _first_number_not_total_of_previous_two(previous_numbers, total):
@@ -4,6 +4,8 @@ import timeit
 import more_itertools
 import networkx as nx
 
+from advent_of_code.common import read_text
+
 
 class AdapterArray:
     def __init__(self, joltage_input=None):
@@ -17,8 +19,7 @@ class AdapterArray:
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read()
+        return read_text()
 
     def jolts(self):
         one_jolts = 0
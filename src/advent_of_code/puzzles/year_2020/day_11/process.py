@@ -1,12 +1,21 @@
 import collections
+import functools
 import timeit
 
-import more_itertools
+import numpy as np
 
+from advent_of_code.common import GridAutomaton, format_cells, parse_cells, read_text
 
+
+FLOOR = "."
 EMPTY = "L"
 OCCUPIED = "#"
 
+FLOOR_STATE = 0
+EMPTY_STATE = 1
+OCCUPIED_STATE = 2
+SEAT_STATES = {FLOOR: FLOOR_STATE, EMPTY: EMPTY_STATE, OCCUPIED: OCCUPIED_STATE}
+
 Coords = collections.namedtuple("Coords", "x y")
 
 
@@ -25,12 +34,11 @@ DIRECTIONS = {
 class SeatingSystem:
     def __init__(self, grid_str=None):
         grid_str = grid_str if grid_str is not None else self._read_file()
-        grid = [list(line) for line in grid_str.splitlines()]
-        self.row_no = len(grid[0])
-        self.col_no = len(grid)
+        self.cells = parse_cells(grid_str, SEAT_STATES)
+        self.col_no, self.row_no = self.cells.shape
         self.grid = set()
         self.seats = {}
-        for y, row in enumerate(grid):
+        for y, row in enumerate(grid_str.splitlines()):
             for x, space in enumerate(row):
                 space_position = Coords(x, y)
                 self.grid.add(space_position)
@@ -39,47 +47,37 @@ class SeatingSystem:
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read()
+        return read_text()
 
-    def output_grid(self, seats):
-        grid = [["." for _ in range(self.row_no)] for _ in range(self.col_no)]
-        for seat_coords, seat in seats.items():
-            grid[seat_coords.y][seat_coords.x] = seat
-        return SeatingSystem._to_str(grid)
-
-    @staticmethod
-    def _to_str(input_list):
-        return "\n".join(["".join(row) for row in input_list])
+    def output_grid(self, cells):
+        return format_cells(cells, SEAT_STATES)
 
 
 class AbstractSeatingSystemModel:
     def __init__(self, seating_system):
         self.grid = seating_system.grid
         self.seats = seating_system.seats.copy()
-        self.adj_seats = {seat: self.surrounding_seats(seat) for seat in self.seats}
+        self.automaton = GridAutomaton(seating_system.cells, self._rule)
+
+    @functools.cached_property
+    def adj_seats(self):
+        return {seat: self.surrounding_seats(seat) for seat in self.seats}
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        current_seats = self.seats
-        self.seats = {}
-        for seat_coords, seat in current_seats.items():
-            adj_seat_coords = self.adj_seats[seat_coords]
-            adj_seats = collections.Counter(
-                current_seats[adj_seat] for adj_seat in adj_seat_coords
-            )
-            if seat == EMPTY and not adj_seats.get(OCCUPIED, 0):
-                self.seats[seat_coords] = OCCUPIED
-            elif (
-                seat == OCCUPIED
-                and adj_seats.get(OCCUPIED, 0) >= self.unacceptable_occupied_seats
-            ):
-                self.seats[seat_coords] = EMPTY
-            else:
-                self.seats[seat_coords] = seat
-        return self.seats
+        return self.automaton.step()
+
+    def _rule(self, automaton, cells):
+        occupied = cells == OCCUPIED_STATE
+        occupied_neighbours = self.count_occupied_neighbours(automaton, occupied)
+        next_cells = cells.copy()
+        next_cells[(cells == EMPTY_STATE) & (occupied_neighbours == 0)] = OCCUPIED_STATE
+        next_cells[
+            occupied & (occupied_neighbours >= self.unacceptable_occupied_seats)
+        ] = EMPTY_STATE
+        return next_cells
 
     @property
     def unacceptable_occupied_seats(self):
@@ -90,6 +88,10 @@ class AbstractSeatingSystemModel:
         """Override to specify the surrounding seats that are considered from one seat"""
         raise NotImplementedError
 
+    def count_occupied_neighbours(self, automaton, occupied):
+        """Override to count the occupied surrounding seats of every space at once"""
+        raise NotImplementedError
+
 
 class TheoreticalSeatingSystemModel(AbstractSeatingSystemModel):
     @property
@@ -104,6 +106,9 @@ class TheoreticalSeatingSystemModel(AbstractSeatingSystemModel):
                 next_coords.append(next_coord)
         return next_coords
 
+    def count_occupied_neighbours(self, automaton, occupied):
+        return automaton.count_neighbours(occupied)
+
 
 class RealSeatingSystemModel(AbstractSeatingSystemModel):
     @property
@@ -126,19 +131,28 @@ class RealSeatingSystemModel(AbstractSeatingSystemModel):
                 start_coords = next_coord
         return next_coords
 
+    @functools.cached_property
+    def _visible_seat_indices(self):
+        # flat index of each seat visible from each space in each direction,
+        # or one past the end of the grid (always unoccupied) if there is none
+        height, width = self.automaton.cells.shape
+        no_seat = height * width
+        indices = np.full((height, width, len(DIRECTIONS)), no_seat, dtype=np.intp)
+        for seat, adj_seats in self.adj_seats.items():
+            for direction_no, adj_seat in enumerate(adj_seats):
+                indices[seat.y, seat.x, direction_no] = adj_seat.y * width + adj_seat.x
+        return indices
 
-def _run_model(model):
-    for current_seats, next_seats in more_itertools.windowed(model, 2):
-        if current_seats == next_seats:
-            return current_seats
+    def count_occupied_neighbours(self, automaton, occupied):
+        occupied_with_no_seat = np.append(occupied.ravel(), False)
+        return occupied_with_no_seat[self._visible_seat_indices].sum(axis=2)
 
 
 def run_model(model, grid_str=None):
     seating_system = SeatingSystem(grid_str)
     primed_model = model(seating_system)
-    current_seats = _run_model(primed_model)
-    results = collections.Counter(current_seats.values())
-    return results[OCCUPIED]
+    primed_model.automaton.run_until_stable()
+    return int(np.count_nonzero(primed_model.automaton.cells == OCCUPIED_STATE))
 
 
 def main():
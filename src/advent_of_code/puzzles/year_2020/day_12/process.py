@@ -1,6 +1,8 @@
 import dataclasses
 import timeit
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Instr:
@@ -38,8 +40,7 @@ class Ship:
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read()
+        return read_text()
 
     @staticmethod
     def _preprocess(line):
@@ -1,6 +1,8 @@
 import math
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class ShuttleSearch:
     def __init__(self, bus_input=None):
@@ -19,8 +21,7 @@ class ShuttleSearch:
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read()
+        return read_text()
 
     def earliest_bus(self):
         valid_bus_ids = [bus_id for bus_id in self.bus_ids if bus_id != "x"]
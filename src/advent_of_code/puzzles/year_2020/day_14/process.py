@@ -2,6 +2,8 @@ import itertools
 import re
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class AbstractDecoder:
     def __init__(self, program=None):
@@ -17,8 +19,7 @@ class AbstractDecoder:
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read()
+        return read_text()
 
     @staticmethod
     def apply_bit_mask(bit_input, mask):
@@ -3,6 +3,8 @@ import itertools
 import math
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class TicketTranslation:
     def __init__(self, ticket_data=None):
@@ -14,8 +16,7 @@ class TicketTranslation:
 
     @staticmethod
     def _read_file():
-        with open("input.txt") as f:
-            return f.read().strip()
+        return read_text().strip()
 
     def _preprocess(self, ticket_data):
         rule_data, your_ticket_data, nearby_ticket_data = ticket_data.split("\n\n")
@@ -3,6 +3,8 @@ import itertools
 
 import timeit
 
+from advent_of_code.common import read_text
+
 ACTIVE = "#"
 INACTIVE = "."
 
@@ -35,9 +37,8 @@ class PocketDimension:
 
     @classmethod
     def from_file(cls):
-        with open("input.txt") as f:
-            state_input = {(0, 0): f.read().strip()}
-            return cls.from_input(state_input)
+        state_input = {(0, 0): read_text().strip()}
+        return cls.from_input(state_input)
 
     def __eq__(self, other):
         active_cubes = {coord for coord, cube in self.cubes.items() if cube == ACTIVE}
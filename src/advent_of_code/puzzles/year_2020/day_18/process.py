@@ -3,6 +3,8 @@ import string
 import operator
 import timeit
 
+from advent_of_code.common import read_text
+
 
 def parse(expr):
     def _parse(iter):
@@ -94,8 +96,7 @@ def process(input_str, mode):
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read().splitlines()
+    return read_text().splitlines()
 
 
 def main():
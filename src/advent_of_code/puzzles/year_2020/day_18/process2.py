@@ -3,6 +3,8 @@ import operator
 import string
 import timeit
 
+from advent_of_code.common import stream_lines
+
 
 class OperationOrder:
     def __init__(self, expressions):
@@ -11,10 +13,9 @@ class OperationOrder:
     @classmethod
     def read_file(cls):
         expressions = []
-        with open("input.txt") as f:
-            for raw_line in f:
-                line = raw_line.rstrip()
-                expressions.append(MathExpression.parse(line))
+        for raw_line in stream_lines():
+            line = raw_line.rstrip()
+            expressions.append(MathExpression.parse(line))
         return cls(expressions)
 
     @property
@@ -4,6 +4,8 @@ from typing import cast
 
 import lark
 
+from advent_of_code.common import stream_lines
+
 
 calc_grammar_template = """
     ?start: expr
@@ -72,10 +74,9 @@ class OperationOrder:
     @classmethod
     def read_file(cls):
         expressions = []
-        with open("input.txt") as f:
-            for raw_line in f:
-                line = raw_line.rstrip()
-                expressions.append(line)
+        for raw_line in stream_lines():
+            line = raw_line.rstrip()
+            expressions.append(line)
         return cls(expressions)
 
     @property
@@ -4,6 +4,8 @@ import timeit
 
 import regex
 
+from advent_of_code.common import read_text
+
 
 def parse(input_str):
     output = {}
@@ -99,8 +101,7 @@ class MonsterMessages:
 
     @classmethod
     def from_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
 
 def main():
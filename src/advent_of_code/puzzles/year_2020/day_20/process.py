@@ -8,6 +8,8 @@ import timeit
 import more_itertools
 import numpy as np
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -99,8 +101,7 @@ class JurassicJigsaw:
 
     @classmethod
     def from_file(cls):
-        with open("input.txt") as f:
-            return cls.from_text(f.read().strip())
+        return cls.from_text(read_text().strip())
 
     @property
     def grid(self):
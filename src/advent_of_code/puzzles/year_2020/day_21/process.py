@@ -4,6 +4,8 @@ import itertools
 import re
 import timeit
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass
 class Food:
@@ -35,8 +37,7 @@ class AllergenAssessment:
 
     @classmethod
     def from_file(cls):
-        with open("input.txt") as f:
-            return cls.from_string(f.read().strip())
+        return cls.from_string(read_text().strip())
 
     def _extract_allergenic_ingredients(self):
         possible_allergenic_ingredients = {}
@@ -1,6 +1,8 @@
 import collections
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class Player:
     def __init__(self, deck):
@@ -62,8 +64,7 @@ class Combat:
 
     @classmethod
     def from_file(cls, mode="normal"):
-        with open("input.txt") as f:
-            return cls.from_text(f.read().strip(), mode)
+        return cls.from_text(read_text().strip(), mode)
 
     def _check_previous_decks(self):
         immutable_deck_state = (self.player_1.deck, self.player_2.deck)
@@ -1,5 +1,7 @@
 import timeit
 
+from advent_of_code.common import read_text
+
 
 def _get_destination_cup(cups, start):
     destination = start - 1
@@ -45,8 +47,7 @@ def calculate_final_labels(cups):
 
 
 def main():
-    with open("input.txt") as f:
-        puzzle_input = f.read().strip()
+    puzzle_input = read_text().strip()
     crab_cups_iter = crab_cups(puzzle_input, move_no=100)
     cups = None
     while True:
@@ -1,6 +1,8 @@
 import timeit
 import itertools
 
+from advent_of_code.common import read_text
+
 
 class CrabCups:
     def __init__(
@@ -69,8 +71,7 @@ class CrabCups:
 
 
 def main():
-    with open("input.txt") as f:
-        puzzle_input = f.read().strip()
+    puzzle_input = read_text().strip()
     crab_cups = CrabCups(puzzle_input)
     result_cups = crab_cups.process()
     print("Result cups:", result_cups)
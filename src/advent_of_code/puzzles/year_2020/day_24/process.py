@@ -2,6 +2,8 @@ import collections
 import dataclasses
 import timeit
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -30,8 +32,7 @@ class LobbyLayout:
 
     @classmethod
     def from_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     @staticmethod
     def parse_step(raw_step):
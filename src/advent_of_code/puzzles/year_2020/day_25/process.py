@@ -1,5 +1,7 @@
 import timeit
 
+from advent_of_code.common import read_text
+
 
 class ComboBreaker:
     def __init__(self, card_pk: int, door_pk: int):
@@ -11,9 +13,8 @@ class ComboBreaker:
 
     @classmethod
     def from_file(cls):
-        with open("input.txt") as f:
-            card_pk, door_pk = f.read().splitlines()
-            return cls(int(card_pk), int(door_pk))
+        card_pk, door_pk = read_text().splitlines()
+        return cls(int(card_pk), int(door_pk))
 
     def brute_force_loop_size(self):
         self.card_loop_size = self._brute_force_loop_size(self.card_pk)
@@ -5,6 +5,8 @@ from typing import cast
 
 import more_itertools
 
+from advent_of_code.common import read_text
+
 
 def count_depth(depths, window=None):
     assert len(depths) >= 3
@@ -22,10 +24,9 @@ def count_depth(depths, window=None):
 
 
 def main():
-    with open("input.txt") as f:
-        depths = f.read()
-        print("Increasing depths:", count_depth(depths))
-        print("Increasing depths with window 3:", count_depth(depths, window=3))
+    depths = read_text()
+    print("Increasing depths:", count_depth(depths))
+    print("Increasing depths with window 3:", count_depth(depths, window=3))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 import dataclasses
 import timeit
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass
 class Coords:
@@ -52,12 +54,11 @@ def course_calc_part_2(course_text):
 
 
 def main():
-    with open("input.txt") as f:
-        course_text = f.read()
-        position_1 = course_calc_part_1(course_text)
-        print("Course part 1:", position_1.x * position_1.y)
-        position_2 = course_calc_part_2(course_text)
-        print("Course part 2:", position_2.x * position_2.y)
+    course_text = read_text()
+    position_1 = course_calc_part_1(course_text)
+    print("Course part 1:", position_1.x * position_1.y)
+    position_2 = course_calc_part_2(course_text)
+    print("Course part 2:", position_2.x * position_2.y)
 
 
 if __name__ == "__main__":
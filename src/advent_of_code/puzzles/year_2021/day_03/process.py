@@ -2,6 +2,8 @@ import enum
 import statistics
 import timeit
 
+from advent_of_code.common import read_text
+
 
 def twos_complement(x, num_bits):
     if x < 0:
@@ -60,12 +62,11 @@ def life_support_rating(report):
 
 
 def main():
-    with open("input.txt") as f:
-        report = f.read()
-        power = power_rating(report)
-        print(f"{power=}")
-        life_support = life_support_rating(report)
-        print(f"{life_support=}")
+    report = read_text()
+    power = power_rating(report)
+    print(f"{power=}")
+    life_support = life_support_rating(report)
+    print(f"{life_support=}")
 
 
 if __name__ == "__main__":
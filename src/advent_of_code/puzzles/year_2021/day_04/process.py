@@ -2,6 +2,8 @@ import timeit
 
 import numpy as np
 
+from advent_of_code.common import read_text
+
 
 class BingoBoard:
     def __init__(self, board_data, height, width):
@@ -35,8 +37,7 @@ class BingoSubsystem:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def _process_data(self, bingo_data):
         raw_numbers, *raw_boards = bingo_data.split("\n\n")
@@ -1,5 +1,7 @@
 import collections
 
+from advent_of_code.common import read_text
+
 
 Coords = collections.namedtuple("Coords", "x y")
 
@@ -10,8 +12,7 @@ class HydrothermalVenture:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def _process_vent_data(self, vent_data):
         vents = []
@@ -1,5 +1,7 @@
 import collections
 
+from advent_of_code.common import read_text
+
 
 class LanternfishSimulator:
     def __init__(self, lanternfish):
@@ -7,8 +9,7 @@ class LanternfishSimulator:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls([int(fish) for fish in f.read().strip().split(",")])
+        return cls([int(fish) for fish in read_text().strip().split(",")])
 
     def __iter__(self):
         return self
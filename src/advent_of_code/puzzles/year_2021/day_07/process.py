@@ -1,8 +1,9 @@
-import functools
 import statistics
 
+from advent_of_code.common import read_text, memoize
 
-@functools.cache
+
+@memoize
 def triangle(num):
     return (num * (num + 1)) // 2
 
@@ -20,8 +21,7 @@ def crab_alignment_triangular(positions):
 
 
 def main():
-    with open("input.txt") as f:
-        raw_positions = f.read().strip()
+    raw_positions = read_text().strip()
     positions = [int(pos) for pos in raw_positions.split(",")]
     print(f"{crab_alignment_linear(positions)}")
     print(f"{crab_alignment_triangular(positions)}")
@@ -1,5 +1,7 @@
 import itertools
 
+from advent_of_code.common import read_text
+
 
 PATTERN_LENGTHS = {
     1: 2,
@@ -104,8 +106,7 @@ class SevenSegmentSearch:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def unique_patterns(self):
         return sum(display.unique_patterns() for display in self.segment_info)
@@ -2,6 +2,8 @@ import collections
 import dataclasses
 import math
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -30,8 +32,7 @@ class SmokeBasin:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def _get_neighbours(self, coord):
         neighbour_coords = []
@@ -3,6 +3,8 @@ import dataclasses
 import statistics
 import typing
 
+from advent_of_code.common import read_text
+
 
 START_BRACKETS = {"(", "[", "{", "<"}
 BRACKET_PAIRS = {
@@ -41,8 +43,7 @@ class NavigationSubsystem:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def _is_valid(self, chunk):
         input_ = collections.deque(chunk)
@@ -1,6 +1,8 @@
 import dataclasses
 import typing
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -48,8 +50,7 @@ class OctopusEnergyModel:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def _get_neighbours(self, coord):
         neighbour_coords = []
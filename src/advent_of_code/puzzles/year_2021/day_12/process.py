@@ -1,5 +1,7 @@
 import collections
 
+from advent_of_code.common import read_text
+
 
 class PassagePathing:
     def __init__(self, cave_map):
@@ -11,8 +13,7 @@ class PassagePathing:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def all_paths(self, start="start", end="end", visit_small_cave_twice=False):
         all_paths = set()
@@ -1,5 +1,7 @@
 import dataclasses
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -44,8 +46,7 @@ class TransparentOrigami:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def __iter__(self):
         for fold in self.folds:
@@ -3,6 +3,8 @@ import fractions
 
 import more_itertools
 
+from advent_of_code.common import read_text
+
 
 class ExtendedPolymerisation:
     def __init__(self, formula):
@@ -19,8 +21,7 @@ class ExtendedPolymerisation:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def __iter__(self):
         return self
@@ -1,28 +1,4 @@
-import dataclasses
-import heapq
-
-
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
-
-    def __add__(self, other):
-        return Coords(self.x + other.x, self.y + other.y)
-
-
-@dataclasses.dataclass(frozen=True, order=True)
-class PrioritisedItem:
-    total_risk: int
-    location: Coords = dataclasses.field(compare=False)
-
-
-OFFSETS = [
-    Coords(0, 1),
-    Coords(1, 0),
-    Coords(0, -1),
-    Coords(-1, 0),
-]
+from advent_of_code.common import astar, read_text
 
 
 class Chiton:
@@ -37,15 +13,11 @@ class Chiton:
         self._height = len(self._chiton_map)
         self._width = len(self._chiton_map[0])
 
-        self._chiton_graph = {}
-
-        for y, row in enumerate(self._chiton_map):
-            for x, risk in enumerate(row):
-                coord = Coords(x, y)
-                self._chiton_graph[coord] = risk
+        # locations are indexed y * width + x
+        self._risks = [risk for row in self._chiton_map for risk in row]
 
-        self.source = Coords(0, 0)
-        self.target = Coords(self._width - 1, self._height - 1)
+        self.source = 0
+        self.target = len(self._risks) - 1
 
     def _add_risks(self, num1, num2):
         val = num1 + num2
@@ -72,45 +44,36 @@ class Chiton:
 
     @classmethod
     def read_file(cls, let_the_expansion_begin=False):
-        with open("input.txt") as f:
-            return cls(f.read().strip(), let_the_expansion_begin)
-
-    def _get_neighbours(self, coord):
-        neighbour_coords = []
-        for offset in OFFSETS:
-            neighbour_coord = coord + offset
-            if (
-                0 <= neighbour_coord.x < self._width
-                and 0 <= neighbour_coord.y < self._height
-            ):
-                neighbour_coords.append(neighbour_coord)
-        return neighbour_coords
+        return cls(read_text().strip(), let_the_expansion_begin)
+
+    def _get_neighbours(self, location):
+        width = self._width
+        x = location % width
+        neighbours = []
+        if x > 0:
+            neighbours.append(location - 1)
+        if x < width - 1:
+            neighbours.append(location + 1)
+        if location >= width:
+            neighbours.append(location - width)
+        if location + width < len(self._risks):
+            neighbours.append(location + width)
+        return [(neighbour, self._risks[neighbour]) for neighbour in neighbours]
+
+    def _distance_to_target(self, location):
+        # every risk is at least 1, so the Manhattan distance never overestimates
+        y, x = divmod(location, self._width)
+        return (self._width - 1 - x) + (self._height - 1 - y)
 
     def shortest_path_length(self):
-        visited: set[Coords] = set()
-        costs: dict[Coords, int] = {self.source: 0}
-        q: list[PrioritisedItem] = []
-
-        heapq.heappush(q, PrioritisedItem(0, self.source))
-
-        while q:
-            item = heapq.heappop(q)
-            if (location := item.location) in visited:
-                continue
-            visited.add(location)
-            if location == self.target:
-                break
-            for neighbour in self._get_neighbours(location):
-                if neighbour in visited:
-                    continue
-                risk_level = self._chiton_graph[neighbour]
-                old_cost = costs.get(neighbour)
-                new_cost = costs[location] + risk_level
-                if old_cost is None or new_cost < old_cost:
-                    heapq.heappush(q, PrioritisedItem(new_cost, neighbour))
-                    costs[neighbour] = new_cost
-
-        return costs[self.target]
+        path = astar(
+            self.source,
+            self._get_neighbours,
+            is_goal=lambda location: location == self.target,
+            heuristic=self._distance_to_target,
+            queue="bucket",
+        )
+        return path.cost
 
 
 def main():
@@ -4,6 +4,8 @@ import itertools
 import math
 import operator
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass
 class Packet:
@@ -77,8 +79,7 @@ class PacketDecoder:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls.from_hex(f.read().strip())
+        return cls.from_hex(read_text().strip())
 
     def _get_raw_bits(self, num):
         result = []
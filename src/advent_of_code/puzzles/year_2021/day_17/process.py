@@ -2,6 +2,8 @@ import dataclasses
 import math
 import parse
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass
 class TargetArea:
@@ -25,8 +27,7 @@ class TrickShot:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def y_peak(self):
         # probe must shoot upwards to get height
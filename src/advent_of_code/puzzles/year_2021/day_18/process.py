@@ -6,6 +6,8 @@ from typing import Self
 
 import lark
 
+from advent_of_code.common import read_text
+
 
 SNAILFISH_NO_GRAMMAR = r"""
     ?start : list
@@ -181,8 +183,7 @@ def sf_homework_part_2(homework):
 
 
 def main():
-    with open("input.txt") as f:
-        homework = f.read().strip()
+    homework = read_text().strip()
     sf_homework_gen = sf_homework_part_1(homework)
     while True:
         try:
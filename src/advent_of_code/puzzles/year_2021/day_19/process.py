@@ -3,6 +3,8 @@ import collections
 import dataclasses
 import itertools
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords3D:
@@ -66,8 +68,7 @@ class BeaconScanner:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def _calculate_beacon_pairs(self, scanner_no, datatype="absolute"):
         if datatype == "absolute":
@@ -5,6 +5,8 @@ import itertools
 import more_itertools
 import numpy as np
 
+from advent_of_code.common import read_text
+
 
 class Pixel(enum.Enum):
     DARK = "."
@@ -58,8 +60,7 @@ class ImageEnhancer:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def __iter__(self):
         return self
@@ -3,6 +3,8 @@ import itertools
 import more_itertools
 import parse
 
+from advent_of_code.common import read_text
+
 
 class DiracDice:
     def __init__(self, p1_start, p2_start):
@@ -19,8 +21,7 @@ Player 2 starting position: {p2:d}"""
 
     @classmethod
     def from_file(cls):
-        with open("input.txt") as f:
-            return cls.from_str(f.read().strip())
+        return cls.from_str(read_text().strip())
 
     def play(self):
         p1_pos = self.p1_start
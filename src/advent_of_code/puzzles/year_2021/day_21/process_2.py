@@ -1,10 +1,11 @@
 import collections
 import dataclasses
-import functools
 import itertools
 
 import parse
 
+from advent_of_code.common import read_text, memoize
+
 
 @dataclasses.dataclass(frozen=True)
 class PlayerState:
@@ -18,19 +19,19 @@ class GameState:
     p2: PlayerState
 
 
-@functools.cache
+@memoize
 def dice_rolls():
     return collections.Counter(
         sum(die_no) for die_no in itertools.product(range(1, 4), repeat=3)
     )
 
 
-@functools.cache
+@memoize
 def board_move(start, roll):
     return (start - 1 + roll) % 10 + 1
 
 
-@functools.cache
+@memoize
 def board_moves(start):
     rolls = dice_rolls()
     return collections.Counter(
@@ -38,7 +39,7 @@ def board_moves(start):
     )
 
 
-@functools.cache
+@memoize
 def simulate_states(state: PlayerState):
     moves = board_moves(state.square)
     return collections.Counter(
@@ -49,7 +50,7 @@ def simulate_states(state: PlayerState):
     )
 
 
-@functools.cache
+@memoize
 def generate_state(p1, p2):
     return GameState(p1, p2)
 
@@ -90,8 +91,7 @@ Player 2 starting position: {p2:d}"""
 
 
 def dirac_dice_from_file():
-    with open("input.txt") as f:
-        wins = dirac_dice_from_str(f.read().strip())
+    wins = dirac_dice_from_str(read_text().strip())
     print("Player with more wins - number of wins:", max(wins.values()))
 
 
@@ -56,10 +56,11 @@ making a map of four rows of amphipods to be solved:
 import collections
 import dataclasses
 import enum
-import functools
 import typing
 import itertools
 
+from advent_of_code.common import read_text, memoize
+
 AMPHIPODS_PER_ROW = 4
 
 
@@ -212,7 +213,7 @@ class BurrowMap:
             if node.this == BurrowHallwayType.AWAY_FROM_ROOM
         ]
 
-    @functools.cache
+    @memoize
     def _path_coords(self, start: Coords, end: Coords):
         def dfs(space=start, path=None):
             if path is None:
@@ -231,7 +232,7 @@ class BurrowMap:
         d = dfs()
         return d
 
-    @functools.cache
+    @memoize
     def path_coords(self, start: Coords, end: Coords, exclude_start=False):
         path = self._path_coords(start, end)
         return path[1:] if exclude_start else path
@@ -346,8 +347,7 @@ class AmphipodOrganiser:
 
     @classmethod
     def read_file(cls, unfolded):
-        with open("input.txt") as f:
-            return cls(f.read().strip(), unfolded)
+        return cls(read_text().strip(), unfolded)
 
     def _find_amphipods(self, burrow_start):
         amphipods: dict[Coords, Amphipod] = {}
@@ -11,7 +11,19 @@ How many steps until no more sea cucumbers move?
 
 from enum import StrEnum
 from typing import Self
-from advent_of_code.common import read_file, timed_run, Coords
+
+import numpy as np
+import numpy.typing as npt
+
+from advent_of_code.common import (
+    Coords,
+    GridAutomaton,
+    Topology,
+    format_cells,
+    parse_cells,
+    read_file,
+    timed_run,
+)
 
 
 EMPTY = "."
@@ -27,77 +39,51 @@ OFFSETS = {
     SeaCucumber.EAST_FACING: Coords(1, 0),
 }
 
+TILE_STATES = {EMPTY: 0, SeaCucumber.EAST_FACING: 1, SeaCucumber.SOUTH_FACING: 2}
+EMPTY_STATE = TILE_STATES[EMPTY]
+
 
 class Map:
-    def __init__(self, tiles: dict[Coords, SeaCucumber], length: int, width: int):
+    def __init__(self, tiles: npt.NDArray[np.uint8]):
         self.tiles = tiles
-        self.length = length
-        self.width = width
+        self.length, self.width = tiles.shape
 
     def __str__(self) -> str:
-        grid = []
-        for y in range(self.length):
-            row = []
-            for x in range(self.width):
-                space = self.tiles.get(Coords(x, y))
-                row.append(space if space is not None else EMPTY)
-            grid.append("".join(row))
-        return "\n".join(grid)
+        return format_cells(self.tiles, TILE_STATES)
 
     @classmethod
     def from_text(cls, grid: str) -> Self:
-        grid_list = grid.splitlines()
-        map_ = {}
-        for y, row in enumerate(grid_list):
-            for x, point in enumerate(row):
-                if point == EMPTY:
-                    continue
-                map_[Coords(x, y)] = SeaCucumber(point)
-        return cls(map_, length=len(grid_list), width=len(grid_list[0]))
-
-
-def move(map_instance: Map, location: Coords, offset: Coords) -> Coords:
-    new_location = location + offset
-    return Coords(
-        x=new_location.x % map_instance.width, y=new_location.y % map_instance.length
-    )
-
+        return cls(parse_cells(grid, TILE_STATES))
 
-def _simulate_herd_movement(current_map: Map, cucumber_type: SeaCucumber) -> Map:
-    moved_map = {}
 
-    for coord, cucumber in current_map.tiles.items():
-        if cucumber == cucumber_type:
-            next_location = move(current_map, coord, OFFSETS[cucumber])
+def _move_herd(
+    automaton: GridAutomaton,
+    tiles: npt.NDArray[np.uint8],
+    cucumber_type: SeaCucumber,
+) -> npt.NDArray[np.uint8]:
+    state = TILE_STATES[cucumber_type]
+    offset = OFFSETS[cucumber_type]
+    free = automaton.shifted(tiles == EMPTY_STATE, offset)
+    moving = (tiles == state) & free
+    moved_tiles = tiles.copy()
+    moved_tiles[moving] = EMPTY_STATE
+    moved_tiles[automaton.shifted(moving, Coords(-offset.x, -offset.y))] = state
+    return moved_tiles
 
-            if next_location not in current_map.tiles:
-                moved_map[next_location] = cucumber
-            else:
-                moved_map[coord] = cucumber
-        else:
-            moved_map[coord] = cucumber
 
-    return Map(moved_map, current_map.length, current_map.width)
+def sea_cucumber_rule(
+    automaton: GridAutomaton, tiles: npt.NDArray[np.uint8]
+) -> npt.NDArray[np.uint8]:
+    # the east-facing herd moves first, then the south-facing herd
+    tiles = _move_herd(automaton, tiles, SeaCucumber.EAST_FACING)
+    return _move_herd(automaton, tiles, SeaCucumber.SOUTH_FACING)
 
 
 def simulate_movement(map_instance: Map) -> int:
-    initial_map = map_instance
-    current_map = initial_map
-    count = 0
-    while True:
-        count += 1
-        east_facing_move_map = _simulate_herd_movement(
-            current_map, SeaCucumber.EAST_FACING
-        )
-        all_moved_map = _simulate_herd_movement(
-            east_facing_move_map, SeaCucumber.SOUTH_FACING
-        )
-
-        if initial_map.tiles == all_moved_map.tiles:
-            return count
-
-        current_map = all_moved_map
-        initial_map = all_moved_map
+    automaton = GridAutomaton(
+        map_instance.tiles, sea_cucumber_rule, topology=Topology.TOROIDAL
+    )
+    return automaton.run_until_stable()
 
 
 def run() -> None:
@@ -1,3 +1,6 @@
+from advent_of_code.common import read_text
+
+
 class CalorieCounting:
     def __init__(self, inventory_input: str):
         raw_inventory = [
@@ -10,8 +13,7 @@ class CalorieCounting:
 
     @classmethod
     def read_file(cls) -> "CalorieCounting":
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def calculate_calories_of_elf_carrying_most_calories(self) -> int:
         return self._inventory[0]
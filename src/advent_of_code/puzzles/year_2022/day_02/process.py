@@ -3,6 +3,8 @@ import dataclasses
 import itertools
 from typing import Literal
 
+from advent_of_code.common import read_text
+
 
 class RPSShapes(enum.Enum):
     ROCK = 1
@@ -105,8 +107,7 @@ class RockPaperScissors:
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def main() -> None:
@@ -3,6 +3,8 @@ import string
 
 import more_itertools
 
+from advent_of_code.common import read_text
+
 
 PRIORITIES = [None] + list(string.ascii_letters)
 
@@ -40,8 +42,7 @@ class RucksackReorganisation:
 
     @classmethod
     def read_file(cls) -> "RucksackReorganisation":
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     @staticmethod
     def _sum_priorities(contents_groups: list[list[str]]) -> int:
@@ -1,5 +1,7 @@
 from typing import Callable
 
+from advent_of_code.common import read_text
+
 
 class ElfRange(set[int]):
     def __init__(self, start: int, end: int):
@@ -30,8 +32,7 @@ class CampCleanup:
 
     @classmethod
     def read_file(cls) -> "CampCleanup":
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def _two_way_contains(self, range1: ElfRange, range2: ElfRange) -> bool:
         return range1.contains(range2) or range2.contains(range1)
@@ -3,10 +3,11 @@ from typing import Optional, Literal, Iterator
 
 import parse  # type: ignore
 
+from advent_of_code.common import read_text
+
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 class CrateStacks(list[Optional[list[str]]]):
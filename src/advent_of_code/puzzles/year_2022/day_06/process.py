@@ -3,10 +3,11 @@ from typing import Optional
 
 import more_itertools
 
+from advent_of_code.common import read_text
+
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read().strip()
+    return read_text().strip()
 
 
 def _detect_marker_idx(datastream: str, n: int) -> Optional[int]:
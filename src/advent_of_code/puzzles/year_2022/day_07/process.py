@@ -5,10 +5,11 @@ from typing import Optional, Union
 
 import more_itertools
 
+from advent_of_code.common import read_text
+
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read().strip()
+    return read_text().strip()
 
 
 @dataclasses.dataclass
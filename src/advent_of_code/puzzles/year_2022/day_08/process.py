@@ -7,6 +7,8 @@ from typing import Callable, Iterator
 import numpy as np
 import numpy.typing as npt
 
+from advent_of_code.common import read_text
+
 
 class Direction(enum.Enum):
     LEFT = enum.auto()
@@ -51,8 +53,7 @@ class TreetopTreeHouse:
 
     @classmethod
     def read_file(cls) -> "TreetopTreeHouse":
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def _create_tree_map(self, tree_height_map: str) -> npt.NDArray[np.int32]:
         f = io.StringIO(tree_height_map)
@@ -4,19 +4,11 @@ import functools
 import itertools
 from collections.abc import Iterator, Callable
 
-
-def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+from advent_of_code.common import Coords, read_text
 
 
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
-
-    def __add__(self, other: "Coords") -> "Coords":
-        return Coords(self.x + other.x, self.y + other.y)
+def read_file() -> str:
+    return read_text()
 
 
 class GridSpace:
@@ -5,6 +5,8 @@ import itertools
 from collections.abc import Iterator, Container
 from typing import Type
 
+from advent_of_code.common import read_text
+
 
 class CycleState(enum.Enum):
     START = enum.auto()
@@ -65,8 +67,7 @@ class CathodeRayTube:
     def read_file(
         cls, watch_cycles: Container[Cycle] = (), high_contrast: bool = False
     ) -> "CathodeRayTube":
-        with open("input.txt") as f:
-            return cls(f.read(), watch_cycles, high_contrast)
+        return cls(read_text(), watch_cycles, high_contrast)
 
     @staticmethod
     def _cycle_gen_fn() -> Iterator[Cycle]:
@@ -7,6 +7,8 @@ from typing import Callable, Iterable, NoReturn, Any, Iterator
 
 import parse  # type: ignore
 
+from advent_of_code.common import read_text
+
 
 OP_FNS = {
     "+": operator.add,
@@ -146,8 +148,7 @@ def monkey_insp(monkeys: Monkeys, is_worry_manageable: bool = True) -> Iterator[
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read().strip()
+    return read_text().strip()
 
 
 def main() -> None:
@@ -2,6 +2,8 @@ import dataclasses
 
 import networkx as nx
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -91,8 +93,7 @@ class HillClimbing:
 
     @classmethod
     def read_file(cls) -> "HillClimbing":
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def shortest_path_length(self) -> int:
         shortest_length: int = nx.shortest_path_length(
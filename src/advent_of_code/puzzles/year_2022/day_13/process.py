@@ -2,6 +2,8 @@ import itertools
 import operator
 import lark
 
+from advent_of_code.common import read_text
+
 
 DIVIDER_PACKET_1 = "[[2]]"
 DIVIDER_PACKET_2 = "[[6]]"
@@ -116,8 +118,7 @@ class DistressSignal:
 
     @classmethod
     def read_file(cls) -> "DistressSignal":
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def valid_pkt_pair_idxs(self):
         return [
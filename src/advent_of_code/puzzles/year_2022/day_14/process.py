@@ -3,6 +3,8 @@ import enum
 import itertools
 import timeit
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -35,8 +37,7 @@ COORD_DIRECTIONS = {
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read().strip()
+    return read_text().strip()
 
 
 class RegolithReservoir:
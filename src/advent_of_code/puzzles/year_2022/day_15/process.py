@@ -3,7 +3,7 @@ import operator
 import parse  # type: ignore
 from typing import Callable
 
-from advent_of_code.common import Coords, read_file, timed_run, merge_intervals
+from advent_of_code.common import Coords, IntervalIndex, read_file, timed_run
 
 
 @dataclasses.dataclass
@@ -51,30 +51,23 @@ def _get_sensor_x_range(reading: Reading, y_axis: int) -> tuple[int, int] | None
     return x_range
 
 
-def _get_sensor_x_ranges(readings: list[Reading], y_axis: int) -> list[tuple[int, int]]:
+def _get_sensor_x_ranges(readings: list[Reading], y_axis: int) -> IntervalIndex:
     x_ranges = []
     for reading in readings:
         x_range = _get_sensor_x_range(reading, y_axis)
         if x_range is None:
             continue
         x_ranges.append(x_range)
-    merged_x_ranges = merge_intervals(x_ranges)
-    return merged_x_ranges
+    return IntervalIndex(x_ranges)
 
 
 def sum_positions_without_beacon(readings: list[Reading], y_axis: int) -> int:
     beacon_xs_on_y_axis = {
         reading.beacon.x for reading in readings if reading.beacon.y == y_axis
     }
-    positions_with_beacons = 0
-    known_beacons = 0
-    for range_start, range_end in _get_sensor_x_ranges(readings, y_axis):
-        for x in beacon_xs_on_y_axis:
-            if range_start <= x <= range_end:
-                known_beacons += 1
-                break
-        positions_with_beacons += range_end - range_start + 1
-    return positions_with_beacons - known_beacons
+    sensor_x_ranges = _get_sensor_x_ranges(readings, y_axis)
+    known_beacons = sum(x in sensor_x_ranges for x in beacon_xs_on_y_axis)
+    return sensor_x_ranges.total_length() - known_beacons
 
 
 def _do_missing_beacon_search_for_row(
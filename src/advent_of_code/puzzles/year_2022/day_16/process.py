@@ -1,8 +1,9 @@
 import collections
 import dataclasses
-import functools
 import re
 
+from advent_of_code.common import read_text, memoize
+
 
 @dataclasses.dataclass(frozen=True)
 class Valve:
@@ -43,8 +44,7 @@ class ProboscideaVolcanium:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def _node(self, valve):
         cache = {}
@@ -74,11 +74,11 @@ class ProboscideaVolcanium:
             )
         return graph
 
-    @functools.cache
+    @memoize
     def _get_valves_left(self, valves: frozenset[str], valve: str):
         return valves.difference([valve])
 
-    @functools.cache
+    @memoize
     def _get_valve_pressure(self, valve: str, dist):
         if dist >= self.time:
             return None
@@ -95,7 +95,7 @@ class ProboscideaVolcanium:
             return None, None
         return next_pressure, total_dist
 
-    @functools.cache
+    @memoize
     def _get_valves_pressure(self, curr_valve: str, valves: frozenset[str], dist=0):
         total_pressures = []
         for next_valve in valves:
@@ -1,9 +1,10 @@
 import collections
 import dataclasses
-import functools
 import itertools
 import re
 
+from advent_of_code.common import counted, read_text, memoize
+
 
 @dataclasses.dataclass(frozen=True)
 class Valve:
@@ -44,8 +45,7 @@ class ProboscideaVolcanium:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def _node(self, valve):
         cache = {}
@@ -83,6 +83,7 @@ class ProboscideaVolcanium:
             )
         )
 
+    @counted
     def _search(self, valves: tuple[str, ...], dist=(0, 0), pressure=0):
         neighbours = self.key_valves.difference(valves)
         if not neighbours:
@@ -130,13 +131,13 @@ class ProboscideaVolcanium:
             pressures.append(total_pressure)
         return max(pressures) if pressures else 0
 
-    @functools.cache
+    @memoize
     def _get_valves_left(
         self, valves: frozenset[str], valves_visited: frozenset[str]
     ) -> frozenset[str]:
         return valves - valves_visited
 
-    @functools.cache
+    @memoize
     def _get_valve_pressure(self, valve: str, dist):
         if dist >= self.time:
             return None
@@ -144,7 +145,7 @@ class ProboscideaVolcanium:
         pressure = (self.time - dist) * valve_details.flow_rate
         return pressure
 
-    @functools.cache
+    @memoize
     def _get_valve_pair_pressure(self, curr_valve, next_valve, dist):
         valve_details = self.graph[curr_valve]
         next_dist = valve_details.neighbours[next_valve]
@@ -154,7 +155,7 @@ class ProboscideaVolcanium:
             return None, self.time
         return next_pressure, total_dist
 
-    @functools.cache
+    @memoize
     def _get_valves_pressure(
         self,
         your_valve: str,
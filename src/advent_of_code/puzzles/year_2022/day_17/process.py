@@ -1,17 +1,7 @@
-import dataclasses
 import enum
 import itertools
 
-import more_itertools
-
-
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
-
-    def __add__(self, other: "Coords") -> "Coords":
-        return Coords(self.x + other.x, self.y + other.y)
+from advent_of_code.common import Coords, CycleDetector, read_text
 
 
 class Jet(enum.Enum):
@@ -54,6 +44,10 @@ ROCK_COORDS = {
 
 ROCK_FALL_COORD = Coords(0, -1)
 
+# rows from the top of the tower compared when looking for a repeating state;
+# in practice rocks never come to rest further below the highest rock
+SURFACE_DEPTH = 32
+
 
 class SettledRocks:
     def __init__(self):
@@ -84,25 +78,12 @@ class SettledRocks:
         for rock in rocks:
             self.add(rock)
 
-    def check_for_repeating_groups(self, group_no):
-        for start, _ in enumerate(self._rocks_positional):
-            sublist = self._rocks_positional[start:]
-            if len(sublist) < 10:
-                # we are looking for large repeating groups
-                # use as quick and dirty way of ditching tiny repeating groups
-                return False, None, None
-            if len(sublist) % group_no != 0:
-                # looking for exact repeating groups so need a sublist divisible into equal parts
-                continue
-            groups = more_itertools.divide(group_no, sublist)
-            groups = iter(groups)
-            first = list(next(groups))
-            if all(first == list(x) for x in groups):
-                # found
-                group_len = len(first)
-                offset_len = len(self._rocks_positional) - group_len * group_no
-                return True, group_len, offset_len
-        return False, None, None
+    def surface(self, depth: int) -> tuple[int, ...]:
+        """
+        The top `depth` rows of settled rocks, each as a bitmask of x positions.
+        """
+        top_rows = self._rocks_positional[-depth:]
+        return tuple(sum(1 << x for x in row) for row in reversed(top_rows))
 
 
 class ChamberRocks:
@@ -203,8 +184,8 @@ class ChamberRocks:
             self.falling_rocks = []
         return did_rocks_fall
 
-    def check_for_repeating_groups(self, group_no):
-        return self.settled_rocks.check_for_repeating_groups(group_no)
+    def surface(self, depth: int) -> tuple[int, ...]:
+        return self.settled_rocks.surface(depth)
 
 
 class PyroclasticFlow:
@@ -213,14 +194,13 @@ class PyroclasticFlow:
         self.show_intermediate_states = show_intermediate_states
         self.chamber_rocks = ChamberRocks()
         self.yield_on_jet = yield_on_jet
+        self.jet_index = 0
 
     @classmethod
     def read_file(cls, show_intermediate_states=False, yield_on_jet=False):
-        with open("input.txt") as f:
-            return cls(f.read().strip(), show_intermediate_states, yield_on_jet)
+        return cls(read_text().strip(), show_intermediate_states, yield_on_jet)
 
     def __iter__(self):
-        jet_cycle = itertools.cycle(self.jet_pattern)
         rock_cycle = itertools.cycle(Rock)
         beginning_cycle = True
         curr_rock = None
@@ -232,7 +212,8 @@ class PyroclasticFlow:
                     yield
                 if beginning_cycle:
                     beginning_cycle = False
-            jet = next(jet_cycle)
+            jet = self.jet_pattern[self.jet_index]
+            self.jet_index = (self.jet_index + 1) % len(self.jet_pattern)
             self.chamber_rocks.move_rocks(jet)
             if self.show_intermediate_states:
                 yield
@@ -248,67 +229,26 @@ class PyroclasticFlow:
     def tower_height(self):
         return self.chamber_rocks.tower_height
 
-    def get_tower_height_after_large_value(self, large_value):
-        found_two_groups = False
-        found_three_groups = False
-        tower_height_after_two_groups = None
-        it = iter(self)
-        for count in itertools.count(start=1):
-            next(it)
-            found_two_groups, group_len, offset_len = (
-                self.chamber_rocks.check_for_repeating_groups(group_no=2)
-            )
-            if found_two_groups:
-                assert offset_len + group_len * 2 == self.tower_height
-                number_of_rocks_after_two_groups = count
-                tower_height_after_two_groups = self.tower_height
-                break
-        for count in itertools.count(start=number_of_rocks_after_two_groups + 1):
-            next(it)
-            if self.tower_height == (tower_height_after_two_groups + group_len):
-                found_three_groups, group_len_double_check, offset_len_double_check = (
-                    self.chamber_rocks.check_for_repeating_groups(group_no=3)
-                )
-                if not found_three_groups:
-                    continue
-                assert group_len == group_len_double_check
-                assert offset_len == offset_len_double_check
-
-                number_of_rocks_after_three_groups = count
-                tower_height_after_three_groups = self.tower_height
-
-                break
-            if self.tower_height > (tower_height_after_two_groups + group_len):
-                raise Exception("something badly went wrong")
-        rock_no_per_repeating_group = (
-            number_of_rocks_after_three_groups - number_of_rocks_after_two_groups
-        )
-        rock_no_for_offset = (
-            number_of_rocks_after_three_groups - rock_no_per_repeating_group * 3
-        )
-
-        large_value_minus_beginning_offset = large_value - rock_no_for_offset
-
-        repeating_group_no = (
-            large_value_minus_beginning_offset // rock_no_per_repeating_group
-        )
-        repeating_group_total_height = repeating_group_no * group_len
-
-        if large_value_minus_beginning_offset % rock_no_per_repeating_group == 0:
-            return repeating_group_total_height + offset_len
-
-        rock_no_ending_offset = large_value_minus_beginning_offset - (
-            repeating_group_no * rock_no_per_repeating_group
+    def _state_key(self, rock_no):
+        # the next rock, the next jet and the shape of the top of the tower
+        # determine everything that happens from here, apart from the height
+        return (
+            rock_no % len(Rock),
+            self.jet_index,
+            self.chamber_rocks.surface(SURFACE_DEPTH),
         )
 
-        for _ in range(rock_no_ending_offset):
+    def get_tower_height_after_large_value(self, large_value):
+        it = iter(self)
+        detector = CycleDetector()
+        detector.add(self._state_key(0))
+        heights = [self.tower_height]
+        for rock_no in range(1, large_value + 1):
             next(it)
-
-        rock_no_ending_offset_height = (
-            self.tower_height - tower_height_after_three_groups
-        )
-
-        return repeating_group_total_height + offset_len + rock_no_ending_offset_height
+            heights.append(self.tower_height)
+            if (rock_cycle := detector.add(self._state_key(rock_no))) is not None:
+                return rock_cycle.extrapolate(large_value, heights.__getitem__)
+        return self.tower_height
 
 
 def main() -> None:
@@ -1,6 +1,8 @@
 import collections
 import dataclasses
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -31,8 +33,7 @@ class BoilingBoulders:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def calculate_surface_area(self):
         area = 0
@@ -1,11 +1,12 @@
 import collections
 import dataclasses
 import math
-import functools
 
 import parse
 import sortedcontainers
 
+from advent_of_code.common import read_text, memoize
+
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class BaseRobot:
@@ -95,10 +96,9 @@ class NotEnoughMaterials:
 
     @classmethod
     def read_file(cls, line_wrapped=False):
-        with open("input.txt") as f:
-            return cls(f.read(), line_wrapped)
+        return cls(read_text(), line_wrapped)
 
-    @functools.cache
+    @memoize
     def _get_robot_choices(self, blueprint, ore, clay, obsidian) -> list[str]:
         valid_robot_types = []
         for robot_type in ("ore", "clay", "obsidian", "geode"):
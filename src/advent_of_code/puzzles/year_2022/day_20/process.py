@@ -1,6 +1,8 @@
 import collections
 import dataclasses
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(eq=False)
 class Node:
@@ -29,8 +31,7 @@ class GrovePositioningSystem:
 
     @classmethod
     def read_file(cls, apply_decryption_key=False, mix_number=1):
-        with open("input.txt") as f:
-            return cls(f.read(), apply_decryption_key, mix_number)
+        return cls(read_text(), apply_decryption_key, mix_number)
 
     def locate(self, node):
         while True:
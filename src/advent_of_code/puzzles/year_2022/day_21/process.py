@@ -6,6 +6,8 @@ from typing import Callable
 
 import parse
 
+from advent_of_code.common import read_text
+
 
 class HumanError(ValueError):
     """Raise when we encounter humn in our monkey maths dependency chain"""
@@ -57,8 +59,7 @@ class MonkeyMath:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def _process_line(self, line) -> tuple[str, Operation | int]:
         if match := parse.parse(
@@ -2,6 +2,8 @@ import dataclasses
 import enum
 import re
 
+from advent_of_code.common import read_text
+
 
 class Space(enum.Enum):
     TILE = "."
@@ -154,8 +156,7 @@ class MonkeyMap:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def __iter__(self):
         self.curr_pos = self.start_pos
@@ -7,6 +7,8 @@ import re
 
 import more_itertools
 
+from advent_of_code.common import read_text
+
 
 class Space(enum.Enum):
     TILE = "."
@@ -405,8 +407,7 @@ class MonkeyMap:
 
     @classmethod
     def read_file(cls, face_size: int):
-        with open("input.txt") as f:
-            return cls(f.read(), face_size)
+        return cls(read_text(), face_size)
 
     def __str__(self):
         grid = []
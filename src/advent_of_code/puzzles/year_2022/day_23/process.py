@@ -1,7 +1,17 @@
 import collections
 import dataclasses
 import enum
-from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from advent_of_code.common import (
+    GridAutomaton,
+    Topology,
+    format_cells,
+    parse_cells,
+    read_text,
+)
 
 
 class Space(enum.Enum):
@@ -9,6 +19,9 @@ class Space(enum.Enum):
     EMPTY_GROUND = "."
 
 
+SPACE_STATES = {Space.EMPTY_GROUND.value: 0, Space.ELF.value: 1}
+
+
 class Direction(enum.Enum):
     NORTH = "N"
     NORTH_EAST = "NE"
@@ -66,96 +79,82 @@ DIR_PROPOSALS = {
 
 class UnstableDiffusion:
     def __init__(self, grove):
-        self.elves: set[Coords] = set()
-
-        for y, row in enumerate(grove.splitlines()):
-            for x, raw_space in enumerate(row):
-                space = Space(raw_space)
-                if space == Space.EMPTY_GROUND:
-                    continue
-                self.elves.add(Coords(x, y))
+        self.automaton = GridAutomaton(
+            parse_cells(grove, SPACE_STATES),
+            self._rule,
+            topology=Topology.INFINITE,
+        )
+        self._dirs = collections.deque(DIR_PROPOSALS)
+        self._any_moved = False
 
     @classmethod
     def read_file(cls) -> "UnstableDiffusion":
-        with open("input.txt") as f:
-            return cls(f.read())
-
-    def _get_boundary_val(self, fn, axis):
-        return getattr(fn(self.elves, key=lambda coord: getattr(coord, axis)), axis)
-
-    @property
-    def min_x(self):
-        return self._get_boundary_val(min, "x")
+        return cls(read_text())
 
     @property
-    def max_x(self):
-        return self._get_boundary_val(max, "x")
+    def elves(self) -> set[Coords]:
+        origin = self.automaton.origin
+        ys, xs = np.nonzero(self.automaton.cells)
+        return {
+            Coords(x + origin.x, y + origin.y) for x, y in zip(xs.tolist(), ys.tolist())
+        }
 
-    @property
-    def min_y(self):
-        return self._get_boundary_val(min, "y")
-
-    @property
-    def max_y(self):
-        return self._get_boundary_val(max, "y")
-
-    def grid(self):
-        return [
-            [
-                Space.ELF if Coords(x, y) in self.elves else Space.EMPTY_GROUND
-                for x in range(self.min_x, self.max_x + 1)
-            ]
-            for y in range(self.min_y, self.max_y + 1)
-        ]
+    def grid(self) -> npt.NDArray[np.uint8]:
+        rows, cols = self.automaton.bounding_box()
+        return self.automaton.cells[rows, cols]
 
     def __str__(self):
-        return "\n".join("".join([space.value for space in row]) for row in self.grid())
-
-    def _propose(self, elf: Coords, dirs: Sequence[Direction]) -> Direction | None:
-        if not any(
-            (elf + coord_dir) in self.elves for coord_dir in COORD_DIRS.values()
-        ):
-            return None
-        for dir_ in dirs:
-            offset_coords = DIR_PROPOSALS[dir_]
-            neighbour_coords = [elf + offset_coord for offset_coord in offset_coords]
-            if not any(
-                neighbour_coord in self.elves for neighbour_coord in neighbour_coords
-            ):
-                return dir_
-        return None
+        return format_cells(self.grid(), SPACE_STATES)
+
+    def _rule(self, automaton, cells):
+        elves = cells.astype(np.bool_)
+        neighbours = {
+            coord_dir: automaton.shifted(elves, coord_dir)
+            for coord_dir in COORD_DIRS.values()
+        }
+        unsettled = elves & np.logical_or.reduce(list(neighbours.values()))
+
+        # each elf proposes the first direction with no elves in the way
+        proposals = {}
+        for dir_ in self._dirs:
+            blocked = np.logical_or.reduce(
+                [neighbours[offset_coord] for offset_coord in DIR_PROPOSALS[dir_]]
+            )
+            proposals[dir_] = unsettled & ~blocked
+            unsettled &= blocked
+
+        proposal_counts = np.zeros(cells.shape, dtype=np.uint8)
+        for dir_, proposing in proposals.items():
+            coord_dir = COORD_DIRS[dir_]
+            proposal_counts += automaton.shifted(
+                proposing.view(np.uint8), Coords(-coord_dir.x, -coord_dir.y)
+            )
+
+        # elves only move if no other elf proposed the same destination
+        moved = np.zeros(cells.shape, dtype=np.bool_)
+        arrived = np.zeros(cells.shape, dtype=np.bool_)
+        for dir_, proposing in proposals.items():
+            coord_dir = COORD_DIRS[dir_]
+            moving = proposing & (automaton.shifted(proposal_counts, coord_dir) == 1)
+            moved |= moving
+            arrived |= automaton.shifted(moving, Coords(-coord_dir.x, -coord_dir.y))
+
+        self._any_moved = bool(moved.any())
+        return ((elves & ~moved) | arrived).view(np.uint8)
 
     def __iter__(self):
-        dirs = collections.deque(DIR_PROPOSALS)
         round_no = 0
         while True:
             round_no += 1
-            elf_proposals = {}
-            proposal_counts = collections.Counter()
-            for elf in self.elves:
-                dir_proposal = self._propose(elf, dirs)
-                if dir_proposal is None:
-                    elf_proposals[elf] = dir_proposal
-                    continue
-                coord_proposal = elf + COORD_DIRS[dir_proposal]
-                elf_proposals[elf] = coord_proposal
-                proposal_counts[coord_proposal] += 1
-
-            next_elves = set()
-            for elf in self.elves:
-                elf_proposal = elf_proposals[elf]
-                elf_dest = elf_proposal if proposal_counts[elf_proposal] == 1 else elf
-                next_elves.add(elf_dest)
-
-            if self.elves == next_elves:
+            self.automaton.step()
+            if not self._any_moved:
                 return round_no
-            self.elves = next_elves
             yield
-            dirs.rotate(-1)
+            self._dirs.rotate(-1)
 
     def sum_empty_ground_tiles(self):
-        return sum(
-            [sum(tile == Space.EMPTY_GROUND for tile in row) for row in self.grid()]
+        return int(
+            np.count_nonzero(self.grid() == SPACE_STATES[Space.EMPTY_GROUND.value])
         )
 
 
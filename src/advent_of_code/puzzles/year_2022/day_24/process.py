@@ -1,6 +1,9 @@
 import collections
 import dataclasses
 import enum
+import math
+
+from advent_of_code.common import StatePacker, bfs, read_text
 
 
 class Valley(enum.Enum):
@@ -140,6 +143,17 @@ class BlizzardBasin:
 
         self.round_trip = round_trip
 
+        # for each direction, whether each inner space starts with a blizzard
+        # heading that way, indexed [y][x] from the top left inner space
+        self._initial_blizzards = {
+            direction: [[False] * self.width for _ in range(self.height)]
+            for direction in Direction
+        }
+        for blizzard in init_blizzard_state:
+            self._initial_blizzards[blizzard.dir][blizzard.pos.y - self.min_y - 1][
+                blizzard.pos.x - self.min_x - 1
+            ] = True
+
         # todo confirm that all blizzards under start and dest are horizontal
 
     def _get_boundary_val(self, fn, axis):
@@ -155,8 +169,7 @@ class BlizzardBasin:
 
     @classmethod
     def read_file(cls, round_trip=False) -> "BlizzardBasin":
-        with open("input.txt") as f:
-            return cls(f.read(), round_trip)
+        return cls(read_text(), round_trip)
 
     def gen_map(self, minute, exp_pos: ExpeditionState | None = None):
         blizzard_state = self.blizzard_states.get_states(minute)
@@ -240,32 +253,84 @@ class BlizzardBasin:
                         next_states.append(exp_state)
                         seen[minute].add(exp_state)
             yield next_states, minute
-            print(minute)
             states = next_states
 
+    def _has_blizzard(self, x: int, y: int, minute: int) -> bool:
+        # a blizzard in an inner space got there by moving in a straight line
+        # from where it started, wrapping round the valley
+        inner_x = x - self.min_x - 1
+        inner_y = y - self.min_y - 1
+        width = self.width
+        height = self.height
+        blizzards = self._initial_blizzards
+        return (
+            blizzards[Direction.RIGHT][inner_y][(inner_x - minute) % width]
+            or blizzards[Direction.LEFT][inner_y][(inner_x + minute) % width]
+            or blizzards[Direction.DOWN][(inner_y - minute) % height][inner_x]
+            or blizzards[Direction.UP][(inner_y + minute) % height][inner_x]
+        )
+
+    def fewest_minutes(self) -> int:
+        """
+        The fewest minutes needed to reach the goal (and, on a round trip, get
+        back to the start and then to the goal again).
+
+        Blizzards return to their starting positions every lcm(width, height)
+        minutes, so a search state is the leg of the trip, the minute within
+        that period and the position, packed into an int.
+        """
+        period = math.lcm(self.width, self.height)
+        grid_width = self.max_x - self.min_x + 1
+        grid_height = self.max_y - self.min_y + 1
+        packer = StatePacker(3, period, grid_width * grid_height)
+        start = (self.start.y - self.min_y) * grid_width + self.start.x - self.min_x
+        dest = (self.dest.y - self.min_y) * grid_width + self.dest.x - self.min_x
+        final_leg = 2 if self.round_trip else 0
+        offsets = [coord.y * grid_width + coord.x for coord in DECISION_COORDS]
+
+        def next_states(state: int) -> list[int]:
+            leg, minute, pos = packer.unpack(state)
+            next_minute = (minute + 1) % period
+            states = []
+            for offset in offsets:
+                next_pos = pos + offset
+                next_leg = leg
+                if next_pos == dest:
+                    if leg == 0 and self.round_trip:
+                        next_leg = 1
+                elif next_pos == start:
+                    if leg == 1:
+                        next_leg = 2
+                else:
+                    y, x = divmod(next_pos, grid_width)
+                    x += self.min_x
+                    y += self.min_y
+                    if not (
+                        self.min_x < x < self.max_x and self.min_y < y < self.max_y
+                    ) or self._has_blizzard(x, y, next_minute):
+                        continue
+                states.append(packer.pack(next_leg, next_minute, next_pos))
+            return states
+
+        def is_goal(state: int) -> bool:
+            leg, _, pos = packer.unpack(state)
+            return leg == final_leg and pos == dest
+
+        trip = bfs(packer.pack(0, 0, start), next_states, is_goal)
+        if trip.cost is None:
+            raise ValueError("goal is unreachable")
+        return trip.cost
+
 
 def main() -> None:
     bb = BlizzardBasin.read_file(round_trip=False)
-    bb_it = iter(bb)
-    while True:
-        try:
-            next(bb_it)
-        except StopIteration as exc:
-            _, minute = exc.value
-            break
-
-    print("Fewest number of minutes needed to reach goal:", minute)
+    print("Fewest number of minutes needed to reach goal:", bb.fewest_minutes())
 
     bb_2 = BlizzardBasin.read_file(round_trip=True)
-    bb_2_it = iter(bb_2)
-    while True:
-        try:
-            next(bb_2_it)
-        except StopIteration as exc:
-            _, minute = exc.value
-            break
-
-    print("Fewest number of minutes needed to reach goal with round trip:", minute)
+    print(
+        "Fewest number of minutes needed to reach goal with round trip:",
+        bb_2.fewest_minutes(),
+    )
 
 
 if __name__ == "__main__":
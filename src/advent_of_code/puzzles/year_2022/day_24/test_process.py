@@ -361,3 +361,16 @@ def test_blizzard_basin_waiting_at_start():
 
 
 # todo waiting at end
+
+
+def test_blizzard_basin_fewest_minutes():
+    basin = """\
+#.######
+#>>.<^<#
+#.<..<<#
+#>v.><>#
+#<^v^^>#
+######.#
+"""
+    assert process.BlizzardBasin(basin).fewest_minutes() == 18
+    assert process.BlizzardBasin(basin, round_trip=True).fewest_minutes() == 54
@@ -1,3 +1,6 @@
+from advent_of_code.common import read_text
+
+
 def snaf_to_dec(snafu: str) -> int:
     dec_digits: list[int] = []
     for snafu_digit in snafu[::-1]:
@@ -38,8 +41,7 @@ def calc_fuel_requirement(reqs: str) -> str:
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def main() -> None:
@@ -1,6 +1,8 @@
 from collections.abc import Sequence
 import regex
 
+from advent_of_code.common import read_text
+
 WORD_LETTERS = {
     "one": "1",
     "two": "2",
@@ -15,8 +17,7 @@ WORD_LETTERS = {
 
 
 def read_file() -> list[str]:
-    with open("input.txt") as f:
-        return f.read().splitlines()
+    return read_text().splitlines()
 
 
 def _get_cal_val(line: str, include_word_numbers: bool) -> int:
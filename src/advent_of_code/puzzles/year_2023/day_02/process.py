@@ -3,6 +3,8 @@ from typing import Self, Collection
 
 import parse
 
+from advent_of_code.common import read_text
+
 
 @dataclass(frozen=True)
 class CubeSelection:
@@ -26,8 +28,7 @@ ELF_QUESTION_CUBE_SELECTION = CubeSelection(red=12, green=13, blue=14)
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def generate_games_record(record_str: str) -> dict[int, list[CubeSelection]]:
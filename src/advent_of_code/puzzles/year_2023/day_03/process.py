@@ -3,6 +3,8 @@ import re
 from dataclasses import dataclass
 from typing import Self
 
+from advent_of_code.common import read_text
+
 
 @dataclass(frozen=True)
 class Coords:
@@ -79,8 +81,7 @@ class EngineSchematic:
 
     @classmethod
     def read_file(cls) -> Self:
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
 
 def calculate_gear_ratios(gear_parts):
@@ -2,6 +2,8 @@ import collections
 from dataclasses import dataclass
 from typing import Any, Self
 
+from advent_of_code.common import read_text
+
 
 @dataclass
 class Card:
@@ -28,8 +30,7 @@ class Scratchcards:
 
     @classmethod
     def read_file(cls) -> Self:
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
     def points(self) -> dict[int, int]:
         your_points = {}
@@ -4,6 +4,8 @@ from typing import Self
 
 import parse
 
+from advent_of_code.common import read_text
+
 
 @dataclass(frozen=True)
 class Map:
@@ -82,8 +84,7 @@ class Almanac:
 
     @classmethod
     def read_file(cls) -> Self:
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
 
 def _calculate_dest_val(category_map, source_val):
@@ -1,6 +1,8 @@
 import math
 from dataclasses import dataclass
 
+from advent_of_code.common import read_text
+
 
 @dataclass(frozen=True)
 class Race:
@@ -77,8 +79,7 @@ class Races:
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read().strip()
+    return read_text().strip()
 
 
 def num_of_winning_distances(races: Races) -> list[int]:
@@ -3,6 +3,8 @@ import enum
 import operator
 from dataclasses import dataclass
 
+from advent_of_code.common import read_text
+
 
 class OrderedEnum(enum.Enum):
     """
@@ -174,8 +176,7 @@ class CamelCardGame:
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def total_winnings(ranked_hand_bids):
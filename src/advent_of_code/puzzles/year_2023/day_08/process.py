@@ -5,6 +5,8 @@ import math
 
 import parse
 
+from advent_of_code.common import read_text
+
 START_ELEMENT = "AAA"
 END_ELEMENT = "ZZZ"
 START_NODES_LETTER = "A"
@@ -35,8 +37,7 @@ class Navigation:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
 
 def navigate(nav: Navigation, ele=START_ELEMENT, end=True):
@@ -1,5 +1,7 @@
 import itertools
 
+from advent_of_code.common import read_text
+
 
 def history_from_str(seq_str):
     return [int(num) for num in seq_str.strip().split()]
@@ -81,8 +83,7 @@ def sum_prev_extrapolated_vals(extrapolated_report):
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def main() -> None:
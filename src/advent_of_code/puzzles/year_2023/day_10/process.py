@@ -2,6 +2,8 @@ import dataclasses
 import enum
 import itertools
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -106,8 +108,7 @@ class Field:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def _get_next_dir(self, prev_dir, pos_coord):
         pos_tile = self.grid[pos_coord]
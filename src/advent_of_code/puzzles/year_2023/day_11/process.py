@@ -1,6 +1,8 @@
 import dataclasses
 import itertools
 
+from advent_of_code.common import read_text
+
 GALAXY = "#"
 
 
@@ -37,8 +39,7 @@ class Universe:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def _manhatten_distance_single_axis(
         self, coords_1, coords_2, expansion_factor, axis
@@ -1,7 +1,8 @@
-import functools
 import dataclasses
 import re
 
+from advent_of_code.common import counted, read_text, memoize
+
 # spring patterns
 OPERATIONAL = r"\."
 DAMAGED = "#"
@@ -11,7 +12,8 @@ MAYBE_OPERATIONAL = f"[{OPERATIONAL}{UNKNOWN}]"
 MAYBE_DAMAGED = f"[{DAMAGED}{UNKNOWN}]"
 
 
-@functools.cache
+@counted
+@memoize
 def arrangements(condition_record: str, damaged_springs: tuple[int, ...]) -> int:
     end_of_condition_record = len(damaged_springs) == 1
 
@@ -73,8 +75,7 @@ class Field:
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def main() -> None:
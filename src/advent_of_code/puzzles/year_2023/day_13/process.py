@@ -94,7 +94,7 @@ import enum
 from collections.abc import Iterator
 from typing import Optional
 
-FILENAME = "input.txt"
+from advent_of_code.common import read_text
 
 OFF_PX = "."
 ON_PX = "#"
@@ -118,8 +118,7 @@ class SymmetryLine:
 
 
 def read_file() -> str:
-    with open(FILENAME) as f:
-        return f.read().strip()
+    return read_text().strip()
 
 
 def parse(grid_input: str) -> list[list[list[str]]]:
@@ -1,5 +1,6 @@
 import enum
-import itertools
+
+from advent_of_code.common import CycleDetector, fingerprint, read_text
 
 ROUNDED_ROCKS = "O"
 CUBE_ROCKS = "#"
@@ -47,20 +48,26 @@ def tilt(platform, direction=Direction.NORTH):
     return tilted_platform
 
 
+def spin_cycle(platform):
+    for direction in CYCLE_DIRECTIONS:
+        platform = tilt(platform, direction)
+    return platform
+
+
 def cycle(platform, total_cycles=1):
-    platforms = [platform]
-    for cycle_no in itertools.count():
-        for direction in CYCLE_DIRECTIONS:
-            platform = tilt(platform, direction)
+    detector = CycleDetector()
+    detector.add(fingerprint(platform))
+    for cycle_no in range(1, total_cycles + 1):
+        platform = spin_cycle(platform)
         if cycle_no == total_cycles:
             return platform
-        if platform in platforms:
-            offset = platforms.index(platform)
-            cycle_length = len(platforms) - offset
-            result_platform = platforms[(total_cycles - offset) % cycle_length + offset]
-            return result_platform
-        platforms.append(platform)
+        if (platform_cycle := detector.add(fingerprint(platform))) is not None:
+            # the platform has been seen before, so skip all the full cycles
+            for _ in range((total_cycles - cycle_no) % platform_cycle.length):
+                platform = spin_cycle(platform)
+            return platform
         yield platform
+    return platform
 
 
 def calculate_load(platform):
@@ -74,8 +81,7 @@ def calculate_load(platform):
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def main() -> None:
@@ -3,6 +3,8 @@ import dataclasses
 import itertools
 import re
 
+from advent_of_code.common import read_text
+
 
 _LABEL_PATTERN = r"(?P<label>[A-Za-z]+)"
 BOX_ADD_PATTERN = rf"{_LABEL_PATTERN}=(?P<focal_length>[1-9])"
@@ -132,8 +134,7 @@ def focusing_power(boxes):
 
 
 def read_file():
-    with open("input.txt") as f:
-        return f.read().strip()
+    return read_text().strip()
 
 
 def main() -> None:
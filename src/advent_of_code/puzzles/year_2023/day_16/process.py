@@ -1,9 +1,10 @@
 import collections
 import dataclasses
 import enum
-import functools
 from typing import Self
 
+from advent_of_code.common import read_text, memoize
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -70,13 +71,12 @@ class Contraption:
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
     def _is_valid_coord(self, coord):
         return (0 <= coord.x < self.width) and (0 <= coord.y < self.height)
 
-    @functools.cache
+    @memoize
     def _get_next_beam_states(self, beam_state):
         direction = beam_state.direction
         location = beam_state.location + OFFSET_COORDS[direction]
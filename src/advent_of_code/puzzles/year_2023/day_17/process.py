@@ -1,19 +1,10 @@
-import dataclasses
 import enum
-import heapq
-from typing import Self
+from typing import Literal
 
+import numpy as np
+import numpy.typing as npt
 
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
-
-    def __add__(self, other: Self) -> Self:
-        return type(self)(self.x + other.x, self.y + other.y)
-
-    def __mul__(self, other: int) -> Self:
-        return type(self)(self.x * other, self.y * other)
+from advent_of_code.common import Coords, StatePacker, astar, parse_cells, read_text
 
 
 class Direction(enum.Enum):
@@ -47,35 +38,29 @@ OFFSETS = {
 }
 
 
-@dataclasses.dataclass(frozen=True)
-class LocationState:
-    location: Coords
-    direction: Direction | None
-    straight_steps: int
+DIRECTIONS = list(Direction)
+DIRECTION_NOS = {direction: no for no, direction in enumerate(DIRECTIONS)}
+# stands in for the direction in the start state, before the crucible has moved
+NO_DIRECTION = len(DIRECTIONS)
 
 
-@dataclasses.dataclass(frozen=True, order=True)
-class LocationStateWithHeatLoss:
-    heat_loss: int
-    location: Coords = dataclasses.field(compare=False)
-    direction: Direction | None = dataclasses.field(compare=False)
-    straight_steps: int = dataclasses.field(compare=False)
+HEAT_LOSSES = {str(heat_loss): heat_loss for heat_loss in range(10)}
+
+# the axis of the run of blocks a crucible has just moved along in a dense
+# search state; its next run must be along the other axis
+HORIZONTAL = 0
+VERTICAL = 1
 
 
 class City:
     def __init__(self, city_input):
-        self.city = {}
-        city_lines = city_input.splitlines()
-        self.width = len(city_lines[0])
-        self.height = len(city_lines)
-        for y, row in enumerate(city_lines):
-            for x, heat_loss in enumerate(row):
-                self.city[Coords(x, y)] = int(heat_loss)
+        # the heat loss of each block, indexed [y, x]
+        self.heat_losses = parse_cells(city_input, HEAT_LOSSES)
+        self.height, self.width = self.heat_losses.shape
 
     @classmethod
     def read_file(cls):
-        with open("input.txt") as f:
-            return cls(f.read().strip())
+        return cls(read_text().strip())
 
 
 class _HeatLossMinimiser:
@@ -86,141 +71,239 @@ class _HeatLossMinimiser:
         self.min_consec_steps = min_consec_steps
         self.max_consec_steps = max_consec_steps
 
-        self.start = Coords(0, 0)
-        self.end = Coords(self.city.width - 1, self.city.height - 1)
-
-        self.visited: set[LocationState] = set()
-        self.costs: dict[LocationState, int] = {
-            LocationState(location=self.start, direction=None, straight_steps=0): 0
-        }
-        self.q: list[LocationStateWithHeatLoss] = []
-        heapq.heappush(
-            self.q,
-            LocationStateWithHeatLoss(
-                heat_loss=0, location=self.start, direction=None, straight_steps=0
-            ),
-        )
+        # locations are indexed y * width + x
+        self.heat_losses = self.city.heat_losses.ravel().tolist()
+        self.start = 0
+        self.end = len(self.heat_losses) - 1
 
-    def _is_valid_coord(self, coord: Coords):
-        return (0 <= coord.x < self.city.width) and (0 <= coord.y < self.city.height)
+        # a state is a location, the direction the crucible is moving in and
+        # how many steps it has moved in that direction
+        self.states = StatePacker(
+            len(self.heat_losses), len(DIRECTIONS) + 1, max_consec_steps + 1
+        )
 
     def _traverse_city(
-        self, start: Coords, offset: Coords, step_change: int
-    ) -> tuple[Coords, int] | None:
-        destination = start
+        self, start: int, offset: Coords, step_change: int
+    ) -> tuple[int, int] | None:
+        y, x = divmod(start, self.city.width)
         heat_loss = 0
         for _ in range(step_change):
-            destination += offset
-            if not self._is_valid_coord(destination):
+            x += offset.x
+            y += offset.y
+            if not ((0 <= x < self.city.width) and (0 <= y < self.city.height)):
                 return None
-            heat_loss += self.city.city[destination]
-        return destination, heat_loss
+            heat_loss += self.heat_losses[y * self.city.width + x]
+        return y * self.city.width + x, heat_loss
 
-    def _get_neighbours(self, item) -> list[LocationStateWithHeatLoss]:
+    def _get_neighbours(self, state: int) -> list[tuple[int, int]]:
         neighbours = []
-        direction = item.direction
+        location, direction_no, straight_steps = self.states.unpack(state)
 
-        if direction is None:
-            # currently at start - pretend direction is down (down or right would work)
+        if direction_no == NO_DIRECTION:
+            # currently at start - pretend direction is right (down or right would work)
             direction = Direction.RIGHTWARDS
+        else:
+            direction = DIRECTIONS[direction_no]
 
         offsets = OFFSETS[direction]
 
         for offset_coord, offset_dir in offsets:
-            if direction == offset_dir:
-                if item.straight_steps == self.max_consec_steps:
+            # moving off from the start counts as a turn, so needs the minimum
+            # steps in a straight line too
+            if direction == offset_dir and direction_no != NO_DIRECTION:
+                if straight_steps == self.max_consec_steps:
                     continue
                 step_change = 1
-                offset_straight_steps = item.straight_steps + step_change
+                offset_straight_steps = straight_steps + step_change
             else:
                 step_change = self.min_consec_steps
                 offset_straight_steps = step_change
 
             traversal_results = self._traverse_city(
-                start=item.location, offset=offset_coord, step_change=step_change
+                start=location, offset=offset_coord, step_change=step_change
             )
             if traversal_results is None:
                 continue
-            neighbour_coord, heat_loss = traversal_results
+            neighbour_location, heat_loss = traversal_results
 
             neighbours.append(
-                LocationStateWithHeatLoss(
-                    heat_loss=heat_loss,
-                    location=neighbour_coord,
-                    direction=offset_dir,
-                    straight_steps=offset_straight_steps,
+                (
+                    self.states.pack(
+                        neighbour_location,
+                        DIRECTION_NOS[offset_dir],
+                        offset_straight_steps,
+                    ),
+                    heat_loss,
                 )
             )
         return neighbours
 
-    def _process_next_state(self) -> int | None:
-        item: LocationStateWithHeatLoss = heapq.heappop(self.q)
-        if item.location == self.end:
-            return item.heat_loss
+    def _distance_to_end(self, state: int) -> int:
+        # every block loses at least 1 heat, so this never overestimates
+        location, _, _ = self.states.unpack(state)
+        y, x = divmod(location, self.city.width)
+        return (self.city.width - 1 - x) + (self.city.height - 1 - y)
 
-        current_visited_state = LocationState(
-            location=item.location,
-            direction=item.direction,
-            straight_steps=item.straight_steps,
+    def minimise_heat_loss(self):
+        route = astar(
+            self.states.pack(self.start, NO_DIRECTION, 0),
+            self._get_neighbours,
+            is_goal=lambda state: self.states.unpack(state)[0] == self.end,
+            heuristic=self._distance_to_end,
+            queue="bucket",
         )
-        if current_visited_state in self.visited:
-            return None
-
-        for steps in range(item.straight_steps, self.max_consec_steps + 1):
-            self.visited.add(
-                LocationState(
-                    location=item.location,
-                    direction=item.direction,
-                    straight_steps=steps,
-                )
-            )
+        if route.cost is None:
+            raise ValueError("End is unreachable")
+        return route.cost
 
-        for neighbour_visited_state in self._get_neighbours(item):
-            if neighbour_visited_state in self.visited:
-                continue
 
-            state = LocationState(
-                location=neighbour_visited_state.location,
-                direction=neighbour_visited_state.direction,
-                straight_steps=neighbour_visited_state.straight_steps,
-            )
+def _prefix_sums(grid: npt.NDArray[np.uint8]) -> npt.NDArray[np.int64]:
+    # sums[y, x] is the total of grid[y, :x]
+    sums = np.zeros((grid.shape[0], grid.shape[1] + 1), dtype=np.int64)
+    np.cumsum(grid, axis=1, out=sums[:, 1:])
+    return sums
 
-            old_cost = self.costs.get(state)
-            new_cost = (
-                self.costs[current_visited_state] + neighbour_visited_state.heat_loss
-            )
-            if old_cost is not None and new_cost >= old_cost:
-                continue
 
-            heapq.heappush(
-                self.q,
-                LocationStateWithHeatLoss(
-                    heat_loss=new_cost,
-                    location=neighbour_visited_state.location,
-                    direction=neighbour_visited_state.direction,
-                    straight_steps=neighbour_visited_state.straight_steps,
-                ),
-            )
-            self.costs[state] = new_cost
+class _DenseHeatLossMinimiser:
+    """
+    Dijkstra over flat NumPy arrays, expanding every state of the same heat
+    loss at once.
 
-        return None
+    Each move is a whole run of min to max blocks in a straight line followed
+    by a turn, so a state only needs the location and the axis of the last run:
+    states are indexed (y * width + x) * 2 + axis, and their heat losses kept
+    in one preallocated array. The heat lost along a run comes from prefix
+    sums of the rows and columns.
+    """
+
+    def __init__(self, city, min_consec_steps, max_consec_steps):
+        self.city = city
+        assert min_consec_steps > 0
+        assert max_consec_steps >= min_consec_steps
+        self.run_lengths = np.arange(min_consec_steps, max_consec_steps + 1)
+
+        self.start = 0
+        self.end = city.width * city.height - 1
+
+        # both indexed [across the run, along the run]
+        self.row_sums = _prefix_sums(city.heat_losses)
+        self.column_sums = _prefix_sums(city.heat_losses.T)
+
+    def _runs(
+        self,
+        across: npt.NDArray[np.int64],
+        along: npt.NDArray[np.int64],
+        sums: npt.NDArray[np.int64],
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """
+        Every run from the given positions along one axis, as the row or column
+        each run is in, the position along it where the run ends, and the heat
+        lost on the way.
+        """
+        length = sums.shape[1] - 1
+        results = []
+        for sign in (1, -1):
+            ends = along[:, None] + sign * self.run_lengths
+            valid = (ends >= 0) & (ends < length)
+            starts, _ = np.nonzero(valid)
+            ends = ends[valid]
+            run_across = across[starts]
+            run_along = along[starts]
+            if sign > 0:
+                # the blocks after the start up to and including the end
+                heat_loss = sums[run_across, ends + 1] - sums[run_across, run_along + 1]
+            else:
+                heat_loss = sums[run_across, run_along] - sums[run_across, ends]
+            results.append((run_across, ends, heat_loss))
+        return tuple(np.concatenate(result) for result in zip(*results))
+
+    def _next_states(
+        self, states: npt.NDArray[np.int64]
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        width = self.city.width
+        locations = states >> 1
+        axes = states & 1
+        ys, xs = np.divmod(locations, width)
+
+        # after a vertical run, go horizontally along the row
+        turning = axes == VERTICAL
+        rows, row_ends, row_heat_losses = self._runs(
+            ys[turning], xs[turning], self.row_sums
+        )
+        # after a horizontal run, go vertically along the column
+        turning = axes == HORIZONTAL
+        columns, column_ends, column_heat_losses = self._runs(
+            xs[turning], ys[turning], self.column_sums
+        )
+
+        next_states = np.concatenate(
+            [
+                (rows * width + row_ends) * 2 + HORIZONTAL,
+                (column_ends * width + columns) * 2 + VERTICAL,
+            ]
+        )
+        return next_states, np.concatenate([row_heat_losses, column_heat_losses])
 
     def minimise_heat_loss(self):
-        while self.q:
-            result = self._process_next_state()
-            if result is not None:
-                return result
+        n_states = self.city.width * self.city.height * 2
+        no_heat_loss = np.iinfo(np.int64).max
+        heat_losses = np.full(n_states, no_heat_loss, dtype=np.int64)
+        # the crucible can set off along either axis
+        start_states = np.array(
+            [self.start * 2 + HORIZONTAL, self.start * 2 + VERTICAL]
+        )
+        heat_losses[start_states] = 0
+
+        # states waiting to be expanded, by heat loss, possibly including ones
+        # since reached with less heat loss or more than once
+        buckets = {0: [start_states]}
+        heat_loss = 0
+        while buckets:
+            if (bucket := buckets.pop(heat_loss, None)) is None:
+                heat_loss += 1
+                continue
+            states = np.unique(np.concatenate(bucket))
+            # every move loses some heat, so these heat losses are final
+            states = states[heat_losses[states] == heat_loss]
+            if np.any(states >> 1 == self.end):
+                return heat_loss
+
+            next_states, run_heat_losses = self._next_states(states)
+            next_heat_losses = heat_loss + run_heat_losses
+            better = next_heat_losses < heat_losses[next_states]
+            next_states = next_states[better]
+            next_heat_losses = next_heat_losses[better]
+            np.minimum.at(heat_losses, next_states, next_heat_losses)
+            # drop any beaten by a run to the same state in this batch
+            best = heat_losses[next_states] == next_heat_losses
+            next_states = next_states[best]
+            next_heat_losses = next_heat_losses[best]
+
+            order = np.argsort(next_heat_losses, kind="stable")
+            next_heat_losses, starts = np.unique(
+                next_heat_losses[order], return_index=True
+            )
+            for next_heat_loss, group in zip(
+                next_heat_losses.tolist(), np.split(next_states[order], starts[1:])
+            ):
+                buckets.setdefault(next_heat_loss, []).append(group)
+            heat_loss += 1
+
+        raise ValueError("End is unreachable")
+
+
+MINIMISERS = {"dense": _DenseHeatLossMinimiser, "search": _HeatLossMinimiser}
 
 
-def crucible_minimal_heat_loss(city):
-    heat_loss_minimiser = _HeatLossMinimiser(
+def crucible_minimal_heat_loss(city, mode: Literal["dense", "search"] = "dense"):
+    heat_loss_minimiser = MINIMISERS[mode](
         city=city, min_consec_steps=1, max_consec_steps=3
     )
     return heat_loss_minimiser.minimise_heat_loss()
 
 
-def ultra_crucible_minimal_heat_loss(city):
-    heat_loss_minimiser = _HeatLossMinimiser(
+def ultra_crucible_minimal_heat_loss(city, mode: Literal["dense", "search"] = "dense"):
+    heat_loss_minimiser = MINIMISERS[mode](
         city=city, min_consec_steps=4, max_consec_steps=10
     )
     return heat_loss_minimiser.minimise_heat_loss()
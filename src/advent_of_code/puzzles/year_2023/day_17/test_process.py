@@ -1,3 +1,5 @@
+import pytest
+
 from advent_of_code.puzzles.year_2023.day_17 import process
 
 
@@ -69,3 +71,44 @@ def test_minimal_heat_loss_minimal_input():
 24222222"""
     city = process.City(city_input)
     assert process.crucible_minimal_heat_loss(city) == 22
+
+
+@pytest.mark.parametrize("mode", ["dense", "search"])
+def test_minimal_heat_loss_modes(mode):
+    city_input = """\
+2413432311323
+3215453535623
+3255245654254
+3446585845452
+4546657867536
+1438598798454
+4457876987766
+3637877979653
+4654967986887
+4564679986453
+1224686865563
+2546548887735
+4322674655533"""
+    city = process.City(city_input)
+    assert process.crucible_minimal_heat_loss(city, mode) == 102
+    assert process.ultra_crucible_minimal_heat_loss(city, mode) == 94
+
+
+@pytest.mark.parametrize("mode", ["dense", "search"])
+def test_ultra_crucible_must_set_off_in_a_straight_line(mode):
+    # turning down one block after setting off right is not allowed
+    city_input = """\
+119999
+911111
+911111
+911111
+911111"""
+    city = process.City(city_input)
+    assert process.ultra_crucible_minimal_heat_loss(city, mode) == 41
+
+
+@pytest.mark.parametrize("mode", ["dense", "search"])
+def test_ultra_crucible_unreachable_end(mode):
+    city = process.City("111\n111")
+    with pytest.raises(ValueError):
+        process.ultra_crucible_minimal_heat_loss(city, mode)
@@ -5,6 +5,8 @@ import itertools
 import parse
 from typing import Self
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -100,8 +102,7 @@ def capacity(plan: list[DigInstruct]) -> int:
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def main():
@@ -6,6 +6,8 @@ from typing import Literal, Self
 
 import parse
 
+from advent_of_code.common import read_text
+
 
 START_NAME = "in"
 
@@ -260,8 +262,7 @@ def distinct_combinations(workflows):
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def main():
@@ -6,6 +6,8 @@ import math
 
 from typing import cast
 
+from advent_of_code.common import read_text
+
 
 BUTTON = "button"
 BROADCASTER = "broadcaster"
@@ -295,8 +297,7 @@ class PulseRunner:
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def main():
@@ -2,6 +2,8 @@ import dataclasses
 import enum
 from typing import Self
 
+from advent_of_code.common import Coords, CoordsPool, read_text
+
 
 STARTING_POSITION = "S"
 
@@ -17,15 +19,6 @@ class GardenSpace(enum.Enum):
     ROCK = "#"
 
 
-@dataclasses.dataclass(frozen=True)
-class Coords:
-    x: int
-    y: int
-
-    def __add__(self, other: Self) -> Self:
-        return type(self)(self.x + other.x, self.y + other.y)
-
-
 @dataclasses.dataclass
 class ElfStepResult:
     new_plots: set[Coords]
@@ -50,10 +43,13 @@ class Garden:
         self.max_x = self.width - 1
         self.max_y = self.height - 1
 
+        # one shared instance per location, however many steps reach it
+        self.coords = CoordsPool(self.width, self.height)
+
         self.garden = {}
         for y, row in enumerate(garden_input.splitlines()):
             for x, space_str in enumerate(row):
-                coords = Coords(x, y)
+                coords = self.coords.get(x, y)
                 if space_str == STARTING_POSITION:
                     space = GardenSpace.PLOT
                     self.start = coords
@@ -67,14 +63,13 @@ class Garden:
 
     @classmethod
     def read_file(cls) -> Self:
-        with open("input.txt") as f:
-            return cls(f.read())
+        return cls(read_text())
 
 
 def normalise_pos(garden, pos):
     norm_x = pos.x % garden.width
     norm_y = pos.y % garden.height
-    return Coords(norm_x, norm_y)
+    return garden.coords.get(norm_x, norm_y)
 
 
 class ElfStepCalculator:
@@ -89,9 +84,11 @@ class ElfStepCalculator:
             new_positions = [(pos + offset) for offset in OFFSET_COORDS]
             valid_new_positions = []
             for new_pos in new_positions:
-                normalised_pos = new_pos
                 if self.is_infinite:
                     normalised_pos = normalise_pos(self.garden, new_pos)
+                else:
+                    # keep the garden's own instance rather than a new one
+                    new_pos = normalised_pos = self.garden.coords.intern(new_pos)
                 if normalised_pos in self.garden.garden_plots:
                     valid_new_positions.append(new_pos)
             next_positions.update(valid_new_positions)
@@ -1,6 +1,8 @@
 import collections
 import dataclasses
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords3D:
@@ -36,8 +38,7 @@ class Brick:
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def parse(input_):
@@ -2,6 +2,8 @@ import collections
 import dataclasses
 import enum
 
+from advent_of_code.common import read_text
+
 
 @dataclasses.dataclass(frozen=True)
 class Coords:
@@ -229,8 +231,7 @@ def di_to_undi_graph(di_graph, start, end):
 
 
 def read_file() -> str:
-    with open("input.txt") as f:
-        return f.read()
+    return read_text()
 
 
 def main():
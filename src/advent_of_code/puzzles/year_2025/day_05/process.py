@@ -1,17 +1,20 @@
 from typing import Self
 
+import numpy as np
+import numpy.typing as npt
+
 from advent_of_code.common import (
+    IntervalIndex,
     read_file,
     timed_run,
-    merge_intervals,
 )
 
 
 class FreshIngredientSolver:
     def __init__(
         self,
-        db: list[tuple[int, int]],
-        ingredients: list[int],
+        db: IntervalIndex,
+        ingredients: npt.NDArray[np.int64],
     ):
         self.db = db
         self.ingredients = ingredients
@@ -23,23 +26,16 @@ class FreshIngredientSolver:
         for raw_range in raw_db.splitlines():
             start, end = raw_range.split("-")
             unmerged_ranges.append((int(start), int(end)))
-        merged_ranges = merge_intervals(unmerged_ranges)
 
-        ingredients = [int(i) for i in raw_ingredients.splitlines()]
+        ingredients = np.array(raw_ingredients.split(), dtype=np.int64)
 
-        return cls(db=merged_ranges, ingredients=ingredients)
+        return cls(db=IntervalIndex(unmerged_ranges), ingredients=ingredients)
 
     def find_fresh(self):
-        fresh = 0
-        for i in self.ingredients:
-            for fresh_range in self.db:
-                if fresh_range[0] <= i <= fresh_range[1]:
-                    fresh += 1
-                    break
-        return fresh
+        return self.db.count(self.ingredients)
 
     def total_fresh(self):
-        return sum(fresh_range[1] - fresh_range[0] + 1 for fresh_range in self.db)
+        return self.db.total_length()
 
 
 def run():
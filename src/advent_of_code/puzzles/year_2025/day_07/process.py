@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from functools import cache
 from typing import Self
 
 from advent_of_code.common import (
@@ -8,6 +7,7 @@ from advent_of_code.common import (
     FOUR_POINT_DIRECTION_TO_COORDS,
     read_file,
     timed_run,
+    memoize,
 )
 
 START = "S"
@@ -39,7 +39,7 @@ class TachyonManifoldSimulator:
     def __init__(self, tm: TachyonManifold):
         self.tm = tm
 
-    @cache
+    @memoize
     def _split(self, splitter: Coords) -> int:
         return self._simulate(
             splitter + FOUR_POINT_DIRECTION_TO_COORDS[Direction.LEFT]
@@ -1,85 +1,57 @@
-from itertools import combinations
+import heapq
+from collections.abc import Iterator
 from math import prod
-from operator import itemgetter
-from typing import Self, cast
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
 
 from advent_of_code.common import (
-    Coords,
+    CoordsArray,
+    DisjointSet,
     read_file,
     timed_run,
 )
 
+INT_CHUNK_SIZE = 2**16
+
 
-def resolve_distances(
-    coords: set[Coords],
-) -> list[tuple[tuple[Coords, Coords], float]]:
-    distances: list[tuple[tuple[Coords, Coords], float]] = []
-    for a, b in combinations(coords, 2):
-        distances.append(((a, b), a.distance_to(b)))
-    return distances
+def _iter_ints(array: npt.NDArray[np.int64]) -> Iterator[int]:
+    # as python ints, which are quicker to work with, without converting
+    # the whole of a large array at once
+    for start in range(0, len(array), INT_CHUNK_SIZE):
+        yield from array[start : start + INT_CHUNK_SIZE].tolist()
 
 
 class CircuitConnector:
-    def __init__(self, points: set[Coords]):
-        self.points = points
-        self._id = 0
+    def __init__(self, points: CoordsArray):
+        # junction boxes at the same place are the same box
+        self.points = points.unique()
 
     @classmethod
     def from_input(cls, raw_input: str) -> Self:
-        coords = set()
-        for raw_coord in raw_input.splitlines():
-            x, y, z = raw_coord.split(",")
-            coords.add(Coords(int(x), int(y), int(z)))
-        return cls(coords)
+        coords = np.array(raw_input.replace("\n", ",").split(","), dtype=np.int64)
+        return cls(CoordsArray(coords.reshape(-1, 3)))
 
     def resolve(self, connection_no: int) -> tuple[int, int]:
-        distance_pairs = resolve_distances(self.points)
-        distance_pairs = sorted(distance_pairs, key=itemgetter(1))
-
-        circuits: dict[int, set[Coords]] = {}
-        for n, ((a, b), distance) in enumerate(distance_pairs):
-            # part 1 check
-            if n == connection_no:
-                circuit_lengths = [len(circuit) for circuit in circuits.values()]
-                most_common = sorted(circuit_lengths, reverse=True)[:3]
-                part_1_result = prod(most_common)
-
-            # resolve circuit pair
-            circuit_id_a: int | None = None
-            circuit_id_b: int | None = None
-            for circuit_id, circuit in circuits.items():
-                if a in circuit:
-                    circuit_id_a = circuit_id
-                if b in circuit:
-                    circuit_id_b = circuit_id
-            if circuit_id_a is None and circuit_id_b is None:
-                next_circuit = {a, b}
-                circuits[self._id] = next_circuit
-                self._id += 1
-            elif circuit_id_a is None:
-                circuit_id_b = cast(
-                    int, circuit_id_b
-                )  # type checker not yet able to deduce this from previous if clause
-                circuits[circuit_id_b].add(a)
-            elif circuit_id_b is None:
-                circuits[circuit_id_a].add(b)
-            elif circuit_id_a != circuit_id_b:
-                next_circuit = circuits[circuit_id_a] | circuits[circuit_id_b]
-
-                del circuits[circuit_id_a]
-                del circuits[circuit_id_b]
-
-                circuits[self._id] = next_circuit
-                self._id += 1
-            else:
-                assert circuit_id_a == circuit_id_b
-
-            # part 2 check
-            if len(circuits) == 1 and list(circuits.values())[0] == self.points:
-                part_2_result = a.x * b.x
-                break
-
-        return (part_1_result, part_2_result)
+        circuits = DisjointSet(len(self.points))
+        part_1_result: int | None = None
+        part_2_result: int | None = None
+        n = 0
+        for _, firsts, seconds in self.points.iter_pairs_by_distance():
+            for a, b in zip(_iter_ints(firsts), _iter_ints(seconds)):
+                # part 1 check
+                if n == connection_no:
+                    part_1_result = prod(heapq.nlargest(3, circuits.set_sizes()))
+                n += 1
+
+                # part 2 check
+                if circuits.union(a, b) and circuits.sets == 1:
+                    part_2_result = int(self.points.x[a] * self.points.x[b])
+
+                if part_1_result is not None and part_2_result is not None:
+                    return (part_1_result, part_2_result)
+        raise Exception("unreachable code")
 
 
 def run():
@@ -1,9 +1,12 @@
-from collections import defaultdict
-from itertools import pairwise, combinations
-from operator import itemgetter
+from itertools import pairwise
 from typing import Self, cast
 
-from advent_of_code.common import Coords, read_file, timed_run, merge_intervals
+import numpy as np
+import numpy.typing as npt
+
+from advent_of_code.common import Coords, read_file, timed_run
+
+CANDIDATE_CHUNK_SIZE = 4096
 
 
 def area(a: Coords, b: Coords):
@@ -52,78 +55,97 @@ class Polygon:
         return cls(coords, min_x, max_x, min_y, max_y)
 
 
+class CompressedPolygon:
+    """
+    The tiles of a polygon on a grid compressed to its distinct x and y
+    values, alternating between rows (and columns) at each value and bands
+    of the rows between them, which are all inside or outside together. A
+    2D prefix sum of the tiles outside the polygon makes whether a
+    rectangle is inside a constant time query.
+    """
+
+    def __init__(self, polygon: Polygon) -> None:
+        xs = np.array([coords.x for coords in polygon.coords])
+        ys = np.array([coords.y for coords in polygon.coords])
+        self.x_values = np.unique(xs)
+        self.y_values = np.unique(ys)
+        # grid column (and row) of each vertex
+        self.cols = 2 * np.searchsorted(self.x_values, xs)
+        self.rows = 2 * np.searchsorted(self.y_values, ys)
+
+        on_edge = np.zeros(
+            (2 * len(self.y_values) - 1, 2 * len(self.x_values) - 1), dtype=bool
+        )
+        on_vertical_edge = np.zeros_like(on_edge)
+        vertices = list(zip(self.rows.tolist(), self.cols.tolist()))
+        for (row_a, col_a), (row_b, col_b) in pairwise([*vertices, vertices[0]]):
+            row_a, row_b = sorted([row_a, row_b])
+            col_a, col_b = sorted([col_a, col_b])
+            on_edge[row_a : row_b + 1, col_a : col_b + 1] = True
+            if col_a == col_b:
+                on_vertical_edge[row_a : row_b + 1, col_a] = True
+
+        # bands between rows cross vertical edges cleanly, so tiles there
+        # are inside after an odd number of crossings to their left, and
+        # tiles on rows but not edges are inside when those next to them
+        # in the band below (or above, for the last row) are
+        crossings = np.cumsum(on_vertical_edge, axis=1) - on_vertical_edge
+        inside = crossings % 2 == 1
+        inside[0:-1:2] = inside[1::2]
+        inside[-1] = inside[-2]
+        inside |= on_edge
+
+        # bands between consecutive values may have no tiles at all
+        widths = np.ones(on_edge.shape[1], dtype=np.int64)
+        widths[1::2] = np.diff(self.x_values) - 1
+        heights = np.ones(on_edge.shape[0], dtype=np.int64)
+        heights[1::2] = np.diff(self.y_values) - 1
+        outside = np.where(inside, 0, heights[:, None] * widths[None, :])
+        self.outside_sums = np.zeros(
+            (on_edge.shape[0] + 1, on_edge.shape[1] + 1), dtype=np.int64
+        )
+        self.outside_sums[1:, 1:] = outside.cumsum(axis=0).cumsum(axis=1)
+
+    def are_inside(
+        self,
+        rows: tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]],
+        cols: tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]],
+    ) -> npt.NDArray[np.bool_]:
+        """
+        Whether each rectangle between grid rows and columns, inclusive, has
+        no tiles outside the polygon.
+        """
+        top, bottom = np.minimum(*rows), np.maximum(*rows) + 1
+        left, right = np.minimum(*cols), np.maximum(*cols) + 1
+        sums = self.outside_sums
+        return (
+            sums[bottom, right]
+            - sums[top, right]
+            - sums[bottom, left]
+            + sums[top, left]
+        ) == 0
+
+
 def resolve(polygon: Polygon) -> tuple[int, int]:
-    distances = [
-        (tuple(sorted([a, b])), area(a, b)) for a, b in combinations(polygon.coords, 2)
-    ]
-    sorted_distances = sorted(distances, key=itemgetter(1), reverse=True)
-
-    max_rectangle = sorted_distances[0][1]
-
-    # largest rectangle within polygon
-    vertical_walls = defaultdict(list)
-    horizontal_walls = defaultdict(list)
-    full_coords = polygon.coords.copy()
-    full_coords.append(polygon.coords[0])
-    for a, b in pairwise(full_coords):
-        if a.y == b.y:
-            horizontal_walls[a.y].append(tuple(sorted([a.x, b.x])))
-        elif a.x == b.x:
-            vertical_walls[a.x].append(tuple(sorted([a.y, b.y])))
-    vertical_wall_xs = sorted(vertical_walls)
-
-    y_ranges = defaultdict(list)
-    for y in range(polygon.min_y, polygon.max_y + 1):
-        walls_crossed = 0
-        last_x = polygon.min_x
-        for x in vertical_wall_xs:
-            possible_wall = None
-            wall_cross = False
-
-            for vertical_wall in vertical_walls[x]:
-                if vertical_wall[0] <= y <= vertical_wall[1]:
-                    possible_wall = vertical_wall
-                    break
-
-            if possible_wall is None:
-                continue
-
-            if y in possible_wall:
-                # only count this case if other y is below y
-                other_y = (
-                    possible_wall[1] if possible_wall[0] == y else possible_wall[0]
-                )
-                if other_y > y:
-                    wall_cross = True
-            else:
-                # y between wall range
-                wall_cross = True
-
-            if wall_cross:
-                walls_crossed += 1
-                if walls_crossed != 0 and walls_crossed % 2 == 0:
-                    # gone from inside to outside
-                    y_ranges[y].append((last_x, x))
-                last_x = x
-
-    full_y_ranges = {
-        y: merge_intervals(y_ranges[y] + horizontal_walls[y])
-        for y in range(polygon.min_y, polygon.max_y + 1)
-    }
-
-    for (a, b), distance in sorted_distances:
-        fully_inside = True
-        y_start, y_end = sorted([a.y, b.y])
-        for y in range(y_start, y_end + 1):
-            if y not in full_y_ranges:
-                fully_inside = False
-                break
-            y_intervals = full_y_ranges[y]
-            if not any((a.x >= y_int[0] and b.x <= y_int[1]) for y_int in y_intervals):
-                fully_inside = False
-                break
-        if fully_inside:
-            max_rectangle_inside_polygon = distance
+    xs = np.array([coords.x for coords in polygon.coords], dtype=np.int64)
+    ys = np.array([coords.y for coords in polygon.coords], dtype=np.int64)
+    firsts, seconds = np.triu_indices(len(polygon.coords), k=1)
+    areas = (np.abs(xs[firsts] - xs[seconds]) + 1) * (
+        np.abs(ys[firsts] - ys[seconds]) + 1
+    )
+    by_area = np.argsort(areas, kind="stable")[::-1]
+    max_rectangle = int(areas[by_area[0]])
+
+    # largest rectangle within polygon, checking candidates largest first
+    # until one is inside, as a chunk at a time
+    compressed = CompressedPolygon(polygon)
+    rows, cols = compressed.rows, compressed.cols
+    for start in range(0, len(by_area), CANDIDATE_CHUNK_SIZE):
+        candidates = by_area[start : start + CANDIDATE_CHUNK_SIZE]
+        a, b = firsts[candidates], seconds[candidates]
+        inside = compressed.are_inside((rows[a], rows[b]), (cols[a], cols[b]))
+        if inside.any():
+            max_rectangle_inside_polygon = int(areas[candidates[inside.argmax()]])
             break
 
     return (max_rectangle, max_rectangle_inside_polygon)
@@ -13,3 +13,29 @@ def test_resolve_polygon():
 7,3"""
     p = process.Polygon.from_input(input_)
     assert process.resolve(p) == (50, 24)
+
+
+def test_resolve_polygon_with_notch():
+    # the notch in a U shape leaves no tiles outside when it's one wide
+    input_ = """\
+0,0
+5,0
+5,6
+3,6
+3,1
+2,1
+2,6
+0,6"""
+    p = process.Polygon.from_input(input_)
+    assert process.resolve(p) == (42, 42)
+    input_ = """\
+0,0
+6,0
+6,6
+4,6
+4,1
+2,1
+2,6
+0,6"""
+    p = process.Polygon.from_input(input_)
+    assert process.resolve(p) == (49, 21)
@@ -1,7 +1,8 @@
 import collections
 from dataclasses import dataclass
+from typing import Literal
 
-from advent_of_code.common import read_file, timed_run
+from advent_of_code.common import gf2_min_weight_solution, read_file, timed_run
 
 ON = "#"
 
@@ -16,7 +17,6 @@ class Machine:
 class LightState:
     lights: int
     pressed: int
-    visited: int
 
 
 def parse(raw_input: str) -> list[Machine]:
@@ -42,39 +42,45 @@ def parse(raw_input: str) -> list[Machine]:
     return machines
 
 
-def bit_set(bit: int):
-    return 1 << bit
-
-
 def bfs(machine: Machine) -> int:
     if machine.lights == 0:
         return 0
 
     q = collections.deque()
-    q.append(
-        LightState(lights=machine.lights, pressed=0, visited=bit_set(machine.lights))
-    )
-    while True:
+    q.append(LightState(lights=machine.lights, pressed=0))
+    visited = {machine.lights}
+    while q:
         state = q.popleft()
         for button in machine.buttons:
             next_lights = state.lights ^ button
             next_pressed = state.pressed + 1
             if next_lights == 0:
                 return next_pressed
-            if state.visited & bit_set(next_lights):
-                # already visited
+            if next_lights in visited:
                 continue
-            next_visited = state.visited | bit_set(next_lights)
-            q.append(
-                LightState(
-                    lights=next_lights, pressed=next_pressed, visited=next_visited
-                )
-            )
+            visited.add(next_lights)
+            q.append(LightState(lights=next_lights, pressed=next_pressed))
+    raise ValueError("No presses turn the lights off")
+
+
+def fewest_presses(machine: Machine, mode: Literal["gf2", "bfs"] = "gf2") -> int:
+    """
+    Pressing a button twice undoes it, so the fewest presses press each
+    button at most once: the smallest set of buttons that XOR to the lights,
+    solved over GF(2). The breadth-first search over light states is kept as
+    mode="bfs".
+    """
+    if mode == "bfs":
+        return bfs(machine)
+    solution = gf2_min_weight_solution(machine.buttons, machine.lights)
+    if solution is None:
+        raise ValueError("No presses turn the lights off")
+    return solution.bit_count()
 
 
 def run():
     machines = parse(read_file())
-    print(sum(bfs(machine) for machine in machines))
+    print(sum(fewest_presses(machine) for machine in machines))
 
 
 def main() -> None:
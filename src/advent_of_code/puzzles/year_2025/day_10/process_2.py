@@ -1,5 +1,11 @@
+import concurrent.futures
+import math
+import os
 from dataclasses import dataclass
+from fractions import Fraction
+from typing import Literal
 
+import numpy as np
 import pulp
 
 from advent_of_code.common import read_file, timed_run
@@ -76,9 +82,194 @@ def solve_int_lin_prob(machine: Machine) -> int:
     return int(pulp.value(prob.objective))
 
 
+def solve_batched_int_lin_prob(machines: list[Machine]) -> int:
+    # every machine in a single problem, solved with one run of the solver,
+    # as each machine's presses are independent of the others' the total is
+    # least when each machine's is
+    prob = pulp.LpProblem("ButtonPresses", pulp.LpMinimize)
+    presses = []
+    for machine_idx, machine in enumerate(machines):
+        x = [
+            pulp.LpVariable(f"x{machine_idx}_{idx}", lowBound=0, cat="Integer")
+            for idx, _ in enumerate(machine.buttons)
+        ]
+        presses.extend(x)
+        for target_idx, target_val in enumerate(machine.joltages):
+            prob += (
+                pulp.lpSum(
+                    x[touches_idx]
+                    for touches_idx, touches_val in enumerate(machine.buttons)
+                    if target_idx in touches_val
+                )
+                == target_val
+            )
+    prob += pulp.lpSum(presses)
+    prob.solve(pulp.PULP_CBC_CMD(msg=False))
+    return int(pulp.value(prob.objective))
+
+
+def _reduce(machine: Machine, cols: list[int]) -> tuple[list[int], list[list[int]]]:
+    # gaussian elimination over the rationals to reduced row echelon form,
+    # trying buttons as pivots in the given order, giving the pivot button of
+    # each row, and each row scaled back to integers as [coefficient for each
+    # button..., target]
+    rows = [
+        [Fraction(target_idx in button) for button in machine.buttons]
+        + [Fraction(target)]
+        for target_idx, target in enumerate(machine.joltages)
+    ]
+    pivots: list[int] = []
+    for col in cols:
+        pivot_row = next((row for row in rows[len(pivots) :] if row[col]), None)
+        if pivot_row is None:
+            continue
+        rows.remove(pivot_row)
+        pivot_row = [val / pivot_row[col] for val in pivot_row]
+        rows = [
+            [val - row[col] * pivot_val for val, pivot_val in zip(row, pivot_row)]
+            for row in rows
+        ]
+        rows.insert(len(pivots), pivot_row)
+        pivots.append(col)
+    if any(row[-1] for row in rows[len(pivots) :]):
+        raise ValueError("No presses reach the joltages")
+    int_rows = []
+    for row in rows[: len(pivots)]:
+        scale = math.lcm(*(val.denominator for val in row))
+        int_rows.append([int(val * scale) for val in row])
+    return pivots, int_rows
+
+
+def solve_exact(machine: Machine) -> int:
+    """
+    The fewest presses, found in-process. After elimination, each pivot
+    button's presses follow from the rest, the free buttons, so assignments
+    of the free buttons up to their max presses are searched, the last free
+    button's all at once, for those that make every pivot button's presses
+    a whole number that's not negative. Branches that can't keep them so,
+    or can't beat the fewest found, are cut short.
+    """
+    max_presses = calculate_max_presses(machine)
+    # buttons that can be pressed the most are made pivots where possible,
+    # leaving fewer assignments of the free buttons to try
+    pivots, rows = _reduce(
+        machine, sorted(range(len(machine.buttons)), key=lambda idx: -max_presses[idx])
+    )
+    free = sorted(
+        (idx for idx in range(len(machine.buttons)) if idx not in pivots),
+        key=lambda idx: max_presses[idx],
+    )
+    pivot_scales = [row[pivot] for row, pivot in zip(rows, pivots)]
+
+    # the total presses, times a common multiple of the pivot scales to keep
+    # it whole, as a constant plus a cost for each press of a free button
+    scale = math.lcm(*pivot_scales)
+    row_scales = [scale // pivot_scale for pivot_scale in pivot_scales]
+    base_cost = sum(row[-1] * row_scale for row, row_scale in zip(rows, row_scales))
+    costs = [
+        scale - sum(row[idx] * row_scale for row, row_scale in zip(rows, row_scales))
+        for idx in free
+    ]
+
+    # from each free button on, the most each row's target can still rise by,
+    # and the least the cost can change by
+    most_raised = [[0] * len(rows) for _ in range(len(free) + 1)]
+    least_cost = [0] * (len(free) + 1)
+    for depth in reversed(range(len(free))):
+        idx = free[depth]
+        most_raised[depth] = [
+            raised + max(0, -row[idx]) * max_presses[idx]
+            for raised, row in zip(most_raised[depth + 1], rows)
+        ]
+        least_cost[depth] = least_cost[depth + 1] + min(
+            0, costs[depth] * max_presses[idx]
+        )
+    scales = np.array(pivot_scales, dtype=np.int64)
+
+    fewest: int | None = None
+
+    def search(depth: int, targets: list[int], cost: int) -> None:
+        # the presses of each free button in turn are limited to those that
+        # could still leave every row's target reachable, and could beat the
+        # fewest found so far
+        nonlocal fewest
+        if depth == len(free):
+            if all(
+                target >= 0 and target % pivot_scale == 0
+                for target, pivot_scale in zip(targets, pivot_scales)
+            ):
+                fewest = cost
+            return
+        idx = free[depth]
+        least, most = 0, max_presses[idx]
+        for target, row, raised in zip(targets, rows, most_raised[depth + 1]):
+            if row[idx] > 0:
+                most = min(most, (target + raised) // row[idx])
+            elif row[idx] < 0:
+                least = max(least, -((target + raised) // -row[idx]))
+            elif target + raised < 0:
+                return
+        if fewest is not None:
+            slack = fewest - 1 - cost - least_cost[depth + 1]
+            if costs[depth] > 0:
+                most = min(most, slack // costs[depth])
+            elif costs[depth] < 0:
+                least = max(least, -(slack // -costs[depth]))
+            elif slack < 0:
+                return
+        if least > most:
+            return
+        if depth == len(free) - 1:
+            # the last free button's presses are all tried at once
+            presses = np.arange(least, most + 1)
+            coeffs = np.array([row[idx] for row in rows], dtype=np.int64)
+            scaled = np.array(targets, dtype=np.int64)[:, None] - np.outer(
+                coeffs, presses
+            )
+            valid = (scaled % scales[:, None] == 0).all(axis=0)
+            if valid.any():
+                fewest = cost + costs[depth] * int(
+                    presses[valid].min() if costs[depth] >= 0 else presses[valid].max()
+                )
+            return
+        for presses in range(least, most + 1):
+            search(
+                depth + 1,
+                [target - row[idx] * presses for target, row in zip(targets, rows)],
+                cost + costs[depth] * presses,
+            )
+
+    search(0, [row[-1] for row in rows], base_cost)
+    if fewest is None:
+        raise ValueError("No presses reach the joltages")
+    return fewest // scale
+
+
+def fewest_presses(
+    machines: list[Machine],
+    solver: Literal["exact", "milp"] = "exact",
+    jobs: int | None = 1,
+) -> int:
+    """
+    The fewest presses over all machines. The exact solver works in-process,
+    and with jobs other than 1 the machines are split across a pool of
+    processes (None for one per CPU). The MILP solver puts every
+    machine into a single problem for one run of the external solver.
+    """
+    if solver == "milp":
+        return solve_batched_int_lin_prob(machines)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(machines) < 2:
+        return sum(map(solve_exact, machines))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        return sum(
+            pool.map(solve_exact, machines, chunksize=math.ceil(len(machines) / jobs))
+        )
+
+
 def run():
     machines = parse(read_file())
-    print(sum(solve_int_lin_prob(machine) for machine in machines))
+    print(fewest_presses(machines))
 
 
 def main() -> None:
@@ -1,3 +1,7 @@
+import random
+
+import pytest
+
 from advent_of_code.puzzles.year_2025.day_10 import process
 
 
@@ -33,3 +37,30 @@ def test_bfs_2():
 [.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}"""
     (machine,) = process.parse(input_)
     assert process.bfs(machine) == 2
+
+
+@pytest.mark.parametrize("mode", ["gf2", "bfs"])
+def test_fewest_presses(mode):
+    input_ = """\
+[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
+[...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}
+[.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}"""
+    machines = process.parse(input_)
+    assert [process.fewest_presses(machine, mode) for machine in machines] == [2, 3, 2]
+
+
+def test_fewest_presses_matches_bfs():
+    rng = random.Random(0)
+    for _ in range(50):
+        buttons = [rng.getrandbits(8) for _ in range(rng.randrange(1, 12))]
+        lights = rng.choice(buttons) ^ rng.choice(buttons)
+        machine = process.Machine(lights, buttons)
+        assert process.fewest_presses(machine) == process.bfs(machine)
+
+
+def test_fewest_presses_many_lights():
+    # a unit button per light, and one for all of them
+    machine = process.Machine(
+        lights=2**40 - 2, buttons=[1 << bit for bit in range(40)] + [2**40 - 1]
+    )
+    assert process.fewest_presses(machine) == 2
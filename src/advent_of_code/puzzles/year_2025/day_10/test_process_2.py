@@ -1,3 +1,7 @@
+import random
+
+import pytest
+
 from advent_of_code.puzzles.year_2025.day_10 import process_2
 
 
@@ -78,3 +82,41 @@ def test_solve_2():
 [.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}"""
     (machine,) = process_2.parse(input_)
     assert process_2.solve_int_lin_prob(machine) == 11
+
+
+@pytest.mark.parametrize(
+    "input_, expected",
+    [
+        ("[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}", 10),
+        ("[...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}", 12),
+        ("[.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}", 11),
+    ],
+)
+def test_solve_exact(input_, expected):
+    (machine,) = process_2.parse(input_)
+    assert process_2.solve_exact(machine) == expected
+
+
+def test_solve_exact_matches_int_lin_prob():
+    rng = random.Random(0)
+    for _ in range(20):
+        buttons = [sorted(rng.sample(range(6), rng.randrange(1, 6))) for _ in range(8)]
+        for idx in set(range(6)).difference(*buttons):
+            buttons.append([idx])
+        presses = [rng.randrange(20) for _ in buttons]
+        joltages = [
+            sum(n for button, n in zip(buttons, presses) if idx in button)
+            for idx in range(6)
+        ]
+        machine = process_2.Machine(buttons, joltages)
+        assert process_2.solve_exact(machine) == process_2.solve_int_lin_prob(machine)
+
+
+@pytest.mark.parametrize("solver, jobs", [("exact", 1), ("exact", 2), ("milp", 1)])
+def test_fewest_presses(solver, jobs):
+    input_ = """\
+[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
+[...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}
+[.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}"""
+    machines = process_2.parse(input_)
+    assert process_2.fewest_presses(machines, solver=solver, jobs=jobs) == 33
@@ -1,6 +1,4 @@
-import functools
-
-from advent_of_code.common import read_file, timed_run
+from advent_of_code.common import read_file, timed_run, memoize
 
 YOU = "you"
 SERVER = "svr"
@@ -23,7 +21,7 @@ class DeviceMapSolver:
         self._device_map = device_map
         self._check_dac_and_fft = check_dac_and_fft
 
-    @functools.cache
+    @memoize
     def sum_total_paths(self, start=YOU, dac_found=False, fft_found=False):
         if start == TARGET:
             return 1 if not self._check_dac_and_fft or (dac_found and fft_found) else 0
@@ -0,0 +1,99 @@
+import numpy as np
+
+from advent_of_code import common
+from advent_of_code.common import Coords, GridAutomaton, Topology
+
+STATES = {".": 0, "#": 1}
+CONWAY = common.life_rule(born={3}, survive={2, 3})
+
+GLIDER = """\
+.#....
+..#...
+###...
+......
+......
+......"""
+
+
+def test_parse_and_format_cells() -> None:
+    cells = common.parse_cells(GLIDER, STATES)
+    assert cells.shape == (6, 6)
+    assert cells.dtype == np.uint8
+    assert cells[0, 1] == 1 and cells[0, 0] == 0
+    assert common.format_cells(cells, STATES) == GLIDER
+
+
+def test_blinker() -> None:
+    automaton = GridAutomaton.from_text(
+        ".....\n..#..\n..#..\n..#..\n.....", STATES, CONWAY
+    )
+    automaton.step()
+    assert automaton.to_text(STATES) == ".....\n.....\n.###.\n.....\n....."
+    automaton.step()
+    assert automaton.to_text(STATES) == ".....\n..#..\n..#..\n..#..\n....."
+    assert automaton.generation == 2
+
+
+def test_glider_wraps_on_torus() -> None:
+    automaton = GridAutomaton.from_text(
+        GLIDER, STATES, CONWAY, topology=Topology.TOROIDAL
+    )
+    # a glider moves one cell diagonally every 4 generations
+    automaton.run(4 * 6)
+    assert automaton.to_text(STATES) == GLIDER
+
+
+def test_glider_dies_at_bounded_edge() -> None:
+    automaton = GridAutomaton.from_text(GLIDER, STATES, CONWAY)
+    automaton.run(40)
+    # it ends up as a 2x2 block stuck in the corner
+    assert automaton.cells.sum() == 4
+
+
+def test_glider_grows_infinite_grid() -> None:
+    automaton = GridAutomaton.from_text(
+        GLIDER, STATES, CONWAY, topology=Topology.INFINITE
+    )
+    automaton.run(4 * 20)
+    assert automaton.cells.sum() == 5
+    rows, cols = automaton.bounding_box()
+    top_left = Coords(cols.start + automaton.origin.x, rows.start + automaton.origin.y)
+    assert top_left == Coords(20, 20)
+
+
+def test_count_neighbours() -> None:
+    automaton = GridAutomaton(np.ones((3, 3), dtype=np.uint8), CONWAY)
+    mask = automaton.cells.astype(np.bool_)
+    assert automaton.count_neighbours(mask).tolist() == [
+        [3, 5, 3],
+        [5, 8, 5],
+        [3, 5, 3],
+    ]
+    assert automaton.count_neighbours(
+        mask, common.FOUR_POINT_DIRECTION_COORDS
+    ).tolist() == [[2, 3, 2], [3, 4, 3], [2, 3, 2]]
+
+    torus = GridAutomaton(automaton.cells, CONWAY, topology=Topology.TOROIDAL)
+    assert (torus.count_neighbours(mask) == 8).all()
+
+
+def test_shifted() -> None:
+    values = np.arange(9).reshape(3, 3)
+    automaton = GridAutomaton(np.zeros((3, 3)), CONWAY)
+    assert automaton.shifted(values, Coords(1, 0)).tolist() == [
+        [1, 2, 0],
+        [4, 5, 0],
+        [7, 8, 0],
+    ]
+    torus = GridAutomaton(np.zeros((3, 3)), CONWAY, topology=Topology.TOROIDAL)
+    assert torus.shifted(values, Coords(0, -1)).tolist() == [
+        [6, 7, 8],
+        [0, 1, 2],
+        [3, 4, 5],
+    ]
+
+
+def test_run_until_stable() -> None:
+    # a block is a still life from the start
+    automaton = GridAutomaton.from_text("....\n.##.\n.##.\n....", STATES, CONWAY)
+    assert automaton.run_until_stable() == 1
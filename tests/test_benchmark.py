@@ -0,0 +1,71 @@
+from advent_of_code.common import benchmark
+from advent_of_code.common.runners import Solver
+
+SOLVER = Solver(2015, 1, "process")
+
+
+def test_benchmark_result_stats() -> None:
+    result = benchmark.BenchmarkResult(SOLVER, samples=[3.0, 1.0, 2.0, 10.0, 4.0])
+    assert result.median == 3.0
+    assert result.p95 is not None and 4.0 < result.p95 <= 10.0
+
+
+def test_history_flags_regressions_against_other_commits() -> None:
+    history = benchmark.BenchmarkHistory(":memory:")
+    history.record("aaa", [benchmark.BenchmarkResult(SOLVER, samples=[1.0])])
+
+    slower = [benchmark.BenchmarkResult(SOLVER, samples=[1.5])]
+    regressions = history.find_regressions("bbb", slower, threshold=0.1)
+    assert [(r.solver_id, r.baseline_sha) for r in regressions] == [
+        ("2015/01/process", "aaa")
+    ]
+    assert history.find_regressions("bbb", slower, threshold=0.6) == []
+    # a commit is never compared against its own earlier runs
+    assert history.find_regressions("aaa", slower, threshold=0.1) == []
+
+
+def test_history_skips_failed_results() -> None:
+    history = benchmark.BenchmarkHistory(":memory:")
+    history.record("aaa", [benchmark.BenchmarkResult(SOLVER, status="no input")])
+    assert history.baseline(SOLVER.id, "bbb") is None
+
+
+def test_scaling_exponent() -> None:
+    scaling = benchmark.ScalingResult(
+        SOLVER,
+        points=[
+            (size, benchmark.BenchmarkResult(SOLVER, samples=[size**2 / 1000]))
+            for size in (10, 100, 1000)
+        ],
+    )
+    assert scaling.exponent is not None
+    assert abs(scaling.exponent - 2) < 1e-9
+
+
+def test_scaling_exponent_needs_two_sizes() -> None:
+    scaling = benchmark.ScalingResult(
+        SOLVER, points=[(10, benchmark.BenchmarkResult(SOLVER, samples=[1.0]))]
+    )
+    assert scaling.exponent is None
+
+
+def test_benchmark_scaling_runs_generated_inputs() -> None:
+    solver = Solver(2025, 1, "process")
+    sizes = []
+
+    def generate(size: int) -> str:
+        sizes.append(size)
+        return "\n".join(["R50", "L10"] * size)
+
+    scaling = benchmark.benchmark_scaling(solver, generate, [20, 10], repeat=1)
+    assert sizes == [10, 20]
+    assert [size for size, _ in scaling.points] == [10, 20]
+    assert all(result.status == "ok" for _, result in scaling.points)
+
+
+def test_benchmark_scaling_stops_after_failure() -> None:
+    solver = Solver(2025, 1, "process")
+    scaling = benchmark.benchmark_scaling(
+        solver, lambda size: "not a rotation", [1, 2, 3], repeat=1
+    )
+    assert [(size, result.status) for size, result in scaling.points] == [(1, "error")]
@@ -0,0 +1,50 @@
+import random
+from functools import reduce
+from operator import xor
+
+from advent_of_code import common
+
+
+def combine(vectors: list[int], solution: int) -> int:
+    return reduce(
+        xor, (vectors[idx] for idx in range(len(vectors)) if solution >> idx & 1), 0
+    )
+
+
+def test_gf2_solve() -> None:
+    vectors = [0b011, 0b110, 0b101, 0b100]
+    result = common.gf2_solve(vectors, 0b010)
+    assert result is not None
+    solution, null_space = result
+    assert combine(vectors, solution) == 0b010
+    # the first three make nothing together
+    assert len(null_space) == 1
+    assert all(combine(vectors, vector) == 0 for vector in null_space)
+    assert common.gf2_solve([0b01, 0b01], 0b10) is None
+    assert common.gf2_solve([], 0) == (0, [])
+
+
+def test_gf2_min_weight_solution() -> None:
+    rng = random.Random(0)
+    for _ in range(50):
+        vectors = [rng.getrandbits(6) for _ in range(rng.randrange(1, 9))]
+        target = rng.getrandbits(6)
+        solutions = [
+            solution
+            for solution in range(1 << len(vectors))
+            if combine(vectors, solution) == target
+        ]
+        best = common.gf2_min_weight_solution(vectors, target)
+        if not solutions:
+            assert best is None
+        else:
+            assert best is not None
+            assert combine(vectors, best) == target
+            assert best.bit_count() == min(s.bit_count() for s in solutions)
+
+
+def test_gf2_min_weight_solution_wide() -> None:
+    vectors = [1 << bit for bit in range(64)] + [(1 << 64) - 1]
+    target = (1 << 64) - 1 - 1
+    # everything but the first bit, or all bits and then the first bit
+    assert common.gf2_min_weight_solution(vectors, target) == 1 << 64 | 1
@@ -1,6 +1,56 @@
+import random
+
+import numpy as np
+
 from advent_of_code import common
 
 
 def test_merge_intervals_equal() -> None:
     input_ = [(2, 6), (1, 3), (8, 10), (10, 12), (10, 13)]
     assert common.merge_intervals(input_) == [(1, 6), (8, 13)]
+
+
+def random_intervals(rng: random.Random) -> list[tuple[int, int]]:
+    intervals = []
+    for _ in range(rng.randrange(6)):
+        start = rng.randrange(50)
+        intervals.append((start, start + rng.randrange(8)))
+    return intervals
+
+
+def as_set(intervals) -> set[int]:
+    return {point for start, end in intervals for point in range(start, end + 1)}
+
+
+def test_interval_index() -> None:
+    index = common.IntervalIndex([(2, 6), (1, 3), (8, 10), (11, 13)])
+    assert list(index) == [(1, 6), (8, 13)]
+    assert [point in index for point in range(15)] == [
+        point in as_set(index) for point in range(15)
+    ]
+    assert index.contains([0, 1, 7, 13, 14]).tolist() == [
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert index.count(np.arange(15)) == 12
+    assert index.total_length() == 12
+    assert common.IntervalIndex().count([1, 2]) == 0
+
+
+def test_interval_index_set_operations() -> None:
+    rng = random.Random(0)
+    for _ in range(200):
+        a = random_intervals(rng)
+        b = random_intervals(rng)
+        a_index, b_index = common.IntervalIndex(a), common.IntervalIndex(b)
+        for combined, expected in [
+            (a_index | b_index, as_set(a) | as_set(b)),
+            (a_index & b_index, as_set(a) & as_set(b)),
+            (a_index - b_index, as_set(a) - as_set(b)),
+        ]:
+            assert as_set(combined) == expected
+            # results stay sorted and merged
+            assert combined == common.IntervalIndex(combined)
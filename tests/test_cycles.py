@@ -0,0 +1,67 @@
+import pytest
+
+from advent_of_code import common
+
+
+def step(n: int) -> int:
+    # 0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 3: a tail of 3 then a cycle of 4
+    return n + 1 if n < 6 else 3
+
+
+@pytest.mark.parametrize("method", ["hash", "brent"])
+def test_find_cycle(method) -> None:
+    assert common.find_cycle(0, step, method=method) == common.Cycle(3, 4)
+
+
+@pytest.mark.parametrize("method", ["hash", "brent"])
+def test_find_cycle_pure_loop(method) -> None:
+    assert common.find_cycle(0, lambda n: (n + 1) % 5, method=method) == (
+        common.Cycle(0, 5)
+    )
+
+
+@pytest.mark.parametrize("method", ["hash", "brent"])
+def test_fast_forward(method) -> None:
+    for steps in [0, 1, 2, 3, 6, 7, 8, 1_000_000_000, 10**12 + 1]:
+        # before the cycle repeats, the state is the step number
+        expected = common.Cycle(3, 4).equivalent_step(steps)
+        assert common.fast_forward(0, step, steps, method=method) == expected
+
+
+def test_fast_forward_with_key() -> None:
+    # states are (step count, value) but only the value matters for the cycle
+    result = common.fast_forward(
+        (0, 0), lambda s: (s[0] + 1, step(s[1])), 10**9, key=lambda s: s[1]
+    )
+    assert result[1] == common.fast_forward(0, step, 10**9)
+
+
+def test_equivalent_step() -> None:
+    cycle = common.Cycle(3, 4)
+    assert [cycle.equivalent_step(n) for n in range(10)] == [
+        0, 1, 2, 3, 4, 5, 6, 3, 4, 5
+    ]  # fmt: skip
+
+
+def test_extrapolate() -> None:
+    # a value that grows by 10 every time round a cycle of 4 starting at step 3
+    values = [0, 1, 2, 3, 5, 8, 9, 13]
+    cycle = common.Cycle(3, 4)
+    assert cycle.extrapolate(2, values.__getitem__) == 2
+    assert cycle.extrapolate(7, values.__getitem__) == 13
+    assert cycle.extrapolate(9, values.__getitem__) == 18
+    assert cycle.extrapolate(3 + 4 * 1000 + 1, values.__getitem__) == 5 + 10 * 1000
+
+
+def test_cycle_detector() -> None:
+    detector: common.CycleDetector[str] = common.CycleDetector()
+    keys = ["a", "b", "c", "d", "b"]
+    results = [detector.add(key) for key in keys]
+    assert results == [None, None, None, None, common.Cycle(1, 3)]
+    assert detector.steps == 4
+
+
+def test_fingerprint() -> None:
+    assert common.fingerprint("abc") == common.fingerprint(b"abc")
+    assert common.fingerprint("abc") != common.fingerprint("abd")
+    assert len(common.fingerprint("x" * 10_000)) == 16
@@ -0,0 +1,34 @@
+import random
+
+from advent_of_code import common
+
+
+def test_disjoint_set() -> None:
+    sets = common.DisjointSet(6)
+    assert (len(sets), sets.sets) == (6, 6)
+    assert sets.union(0, 1)
+    assert sets.union(2, 3)
+    assert sets.union(1, 3)
+    assert not sets.union(0, 2)
+    assert sets.connected(0, 3)
+    assert not sets.connected(0, 4)
+    assert [sets.size(item) for item in range(6)] == [4, 4, 4, 4, 1, 1]
+    assert sorted(sets.set_sizes()) == [1, 1, 4]
+    assert sets.sets == 3
+
+
+def test_disjoint_set_matches_naive_sets() -> None:
+    rng = random.Random(0)
+    sets = common.DisjointSet(200)
+    naive = [{item} for item in range(200)]
+    for _ in range(150):
+        a, b = rng.randrange(200), rng.randrange(200)
+        merged = naive[a] is not naive[b]
+        assert sets.union(a, b) == merged
+        if merged:
+            union = naive[a] | naive[b]
+            for item in union:
+                naive[item] = union
+    for item in range(200):
+        assert sets.size(item) == len(naive[item])
+    assert sets.sets == len({id(set_) for set_ in naive})
@@ -0,0 +1,75 @@
+import pytest
+
+from advent_of_code import generators
+from advent_of_code.common.runners import Solver
+from advent_of_code.puzzles.year_2016.day_20 import process as process_2016_20
+from advent_of_code.puzzles.year_2021.day_14 import process as process_2021_14
+from advent_of_code.puzzles.year_2023.day_17 import process as process_2023_17
+from advent_of_code.puzzles.year_2025.day_01 import process as process_2025_01
+from advent_of_code.puzzles.year_2025.day_05 import process as process_2025_05
+from advent_of_code.puzzles.year_2025.day_08 import process as process_2025_08
+
+
+@pytest.mark.parametrize("input_generator", generators.GENERATORS.values())
+def test_generators_are_deterministic(input_generator) -> None:
+    size = max(input_generator.min_size, 10)
+    assert input_generator.generate(size, seed=1) == input_generator.generate(
+        size, seed=1
+    )
+    assert input_generator.generate(size, seed=1) != input_generator.generate(
+        size, seed=2
+    )
+
+
+def test_generator_min_size() -> None:
+    with pytest.raises(ValueError):
+        generators.GENERATORS[2025, 8].generate(10)
+
+
+def test_find_generator_covers_all_variants() -> None:
+    assert generators.find_generator(Solver(2025, 8, "process")) is not None
+    assert generators.find_generator(Solver(2025, 8, "process_2")) is not None
+    assert generators.find_generator(Solver(2015, 1, "process")) is None
+
+
+def test_write(tmp_path) -> None:
+    path = generators.GENERATORS[2025, 1].write(tmp_path, 5)
+    assert path == tmp_path / "input.txt"
+    assert len(path.read_text().splitlines()) == 5
+
+
+def test_dial_rotations() -> None:
+    text = generators.GENERATORS[2025, 1].generate(100)
+    assert len(process_2025_01.parse(text)) == 100
+
+
+def test_junction_boxes() -> None:
+    text = generators.GENERATORS[2025, 8].generate(100)
+    assert len(process_2025_08.CircuitConnector.from_input(text).points) == 100
+
+
+def test_ingredient_database() -> None:
+    text = generators.GENERATORS[2025, 5].generate(100)
+    solver = process_2025_05.FreshIngredientSolver.from_text(text)
+    assert len(solver.ingredients) == 100
+
+
+def test_city_blocks() -> None:
+    city = process_2023_17.City(generators.GENERATORS[2023, 17].generate(20))
+    assert (city.width, city.height) == (20, 20)
+
+
+def test_polymer_formula() -> None:
+    text = generators.GENERATORS[2021, 14].generate(50)
+    polymer = process_2021_14.ExtendedPolymerisation(text)
+    for _ in range(10):
+        next(polymer)
+    assert polymer.polymer_length() == 49 * 2**10 + 1
+
+
+def test_ip_blocklist() -> None:
+    text = generators.GENERATORS[2016, 20].generate(100)
+    intervals = process_2016_20.parse_intervals(text)
+    assert len(intervals) == 100
+    assert min(intervals)[0] == 0
+    assert all(0 <= start <= end <= process_2016_20.MAX_VAL for start, end in intervals)
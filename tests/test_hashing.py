@@ -0,0 +1,53 @@
+import hashlib
+import itertools
+
+import pytest
+
+from advent_of_code import common
+
+
+def hexdigest(salt: str, nonce: int, stretch: int = 0) -> str:
+    val = hashlib.md5(f"{salt}{nonce}".encode()).hexdigest()
+    for _ in range(stretch):
+        val = hashlib.md5(val.encode()).hexdigest()
+    return val
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3])
+def test_leading_zeros(count) -> None:
+    match = common.leading_zeros(count)
+    for nonce in range(2000):
+        digest = hashlib.md5(f"abc{nonce}".encode()).digest()
+        assert match(digest) == digest.hex().startswith("0" * count)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_md5_nonce_search(jobs) -> None:
+    stats = common.HashStats()
+    matches = common.md5_nonce_search(
+        "abc", common.leading_zeros(3), jobs=jobs, stats=stats, chunk_size=1000
+    )
+    found = list(itertools.islice(matches, 20))
+    matches.close()
+    nonces = [nonce for nonce, _ in found]
+    assert nonces == sorted(nonces)
+    for nonce, digest in found:
+        assert digest.hex() == hexdigest("abc", nonce)
+        assert digest.hex().startswith("000")
+    # nothing in between was missed
+    assert sum(
+        hexdigest("abc", nonce).startswith("000") for nonce in range(nonces[-1] + 1)
+    ) == len(found)
+    assert stats.hashes >= nonces[-1]
+    assert stats.rate > 0
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_md5_hexdigests(jobs) -> None:
+    hexdigests = common.md5_hexdigests(
+        "abc", start=5, stretch=2, jobs=jobs, chunk_size=7
+    )
+    assert list(itertools.islice(hexdigests, 30)) == [
+        hexdigest("abc", nonce, stretch=2) for nonce in range(5, 35)
+    ]
+    hexdigests.close()
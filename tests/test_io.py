@@ -0,0 +1,100 @@
+import pytest
+
+from advent_of_code import common
+from advent_of_code.common import io
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    common.clear_input_cache()
+    yield
+    common.clear_input_cache()
+
+
+def test_input_path_defaults_to_cwd_input() -> None:
+    assert common.input_path().name == "input.txt"
+    assert not common.input_path().is_absolute()
+
+
+def test_input_path_year_day() -> None:
+    path = common.input_path(2019, 9)
+    assert path == io.PUZZLES_DIR / "year_2019" / "day_09" / "input.txt"
+
+
+def test_input_path_needs_year_and_day() -> None:
+    with pytest.raises(ValueError):
+        common.input_path(year=2019)
+
+
+def test_read_file_strips_trailing_newlines(tmp_path, monkeypatch) -> None:
+    (tmp_path / "input.txt").write_text("1,2\n3,4\n\n")
+    monkeypatch.chdir(tmp_path)
+    assert common.read_file() == "1,2\n3,4"
+    assert common.read_text() == "1,2\n3,4\n\n"
+
+
+def test_load_input_is_cached_until_file_changes(tmp_path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("abc\n")
+    view = common.load_input(path=path)
+    assert bytes(view) == b"abc\n"
+    assert common.load_input(path=path) is view
+
+    path.write_text("abcdef\n")
+    assert bytes(common.load_input(path=path)) == b"abcdef\n"
+
+
+def test_load_input_evicts_least_recently_used(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(io, "INPUT_CACHE_SIZE", 2)
+    paths = []
+    for no in range(3):
+        path = tmp_path / f"{no}.txt"
+        path.write_text(str(no))
+        paths.append(path)
+    first = common.load_input(path=paths[0])
+    common.load_input(path=paths[1])
+    common.load_input(path=paths[0])
+    common.load_input(path=paths[2])
+    assert common.load_input(path=paths[0]) is first
+    assert len(io._cache) == 2
+
+
+def test_iter_lines(tmp_path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("ab\n\ncd\nef")
+    lines = list(common.iter_lines(path=path))
+    assert all(isinstance(line, memoryview) for line in lines)
+    assert [bytes(line) for line in lines] == [b"ab", b"", b"cd", b"ef"]
+
+
+def test_iter_lines_trailing_newline(tmp_path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("ab\ncd\n")
+    assert [bytes(line) for line in common.iter_lines(path=path)] == [b"ab", b"cd"]
+
+
+def test_crlf_line_endings(tmp_path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"ab\r\n\r\ncd\r\n")
+    assert common.read_text(path=path) == "ab\n\ncd\n"
+    assert common.read_file(path=path) == "ab\n\ncd"
+    assert [bytes(line) for line in common.iter_lines(path=path)] == [
+        b"ab",
+        b"",
+        b"cd",
+    ]
+
+
+def test_empty_input(tmp_path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("")
+    assert common.read_text(path=path) == ""
+    assert list(common.iter_lines(path=path)) == []
+    assert list(common.stream_lines(path=path)) == []
+
+
+def test_stream_lines(tmp_path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("ab\n\ncd\n")
+    assert list(common.stream_lines(path=path)) == ["ab", "", "cd"]
+    assert not io._cache
@@ -0,0 +1,186 @@
+import gc
+import weakref
+
+import pytest
+
+from advent_of_code import common
+from advent_of_code.common import memo, profiling, runners
+from advent_of_code.puzzles.year_2023.day_12 import process as day_12
+
+
+@common.memoize
+def fib(n: int) -> int:
+    return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+
+class Grid:
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+    @common.memoize
+    def paths(self, x: int, y: int) -> int:
+        # to the bottom right corner, moving right or down
+        if x == self.size or y == self.size:
+            return 1
+        return self.paths(x + 1, y) + self.paths(x, y + 1)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    common.clear_caches()
+    yield
+    common.clear_caches()
+
+
+def test_memoize() -> None:
+    assert fib(30) == 832040
+    info = fib.cache_info()
+    assert (info.misses, info.size, info.maxsize) == (31, 31, None)
+    assert info.hits == 28
+    fib.cache_clear()
+    assert fib.cache_info() == common.CacheInfo(0, 0, 0, 0, None)
+
+
+def test_memoize_method() -> None:
+    grid = Grid(10)
+    assert grid.paths(0, 0) == 184756
+    assert Grid.paths.cache_info().size == 120
+    # each instance has its own cache
+    small_grid = Grid(2)
+    assert small_grid.paths(0, 0) == 6
+    assert Grid.paths.cache_info().size == 120 + 8
+
+
+def test_memoize_method_does_not_keep_instance() -> None:
+    grid = Grid(5)
+    grid.paths(0, 0)
+    ref = weakref.ref(grid)
+    del grid
+    gc.collect()
+    assert ref() is None
+    assert Grid.paths.cache_info().size == 0
+
+
+@pytest.mark.parametrize(
+    "decorator", [common.memoize, common.memoize(maxsize=10, policy="arc")]
+)
+def test_memoize_method_of_slotted_class(decorator) -> None:
+    with pytest.raises(TypeError, match="slotted"):
+
+        class Point:
+            __slots__ = ("x",)
+
+            @decorator
+            def norm(self) -> int:
+                return abs(self.x)
+
+
+def test_memoize_key() -> None:
+    calls = []
+
+    @common.memoize(key=lambda items: len(items))
+    def count(items: list[int]) -> int:
+        calls.append(items)
+        return len(items)
+
+    assert count([1, 2]) == 2
+    assert count([3, 4]) == 2
+    assert calls == [[1, 2]]
+
+
+def test_memoize_keeps_args_distinct() -> None:
+    @common.memoize
+    def args(*args, **kwargs):
+        return args, kwargs
+
+    assert args((1, 2)) == (((1, 2),), {})
+    assert args(1, 2) == ((1, 2), {})
+    assert args(1, b=2) == ((1,), {"b": 2})
+
+
+@pytest.mark.parametrize("policy", ["lru", "arc"])
+def test_memoize_bounded(policy) -> None:
+    @common.memoize(maxsize=100, policy=policy)
+    def square(n: int) -> int:
+        return n * n
+
+    for n in range(1000):
+        assert square(n % 300) == (n % 300) ** 2
+    info = square.cache_info()
+    assert info.size <= 100
+    assert info.evictions == info.misses - info.size
+
+
+def test_lru_eviction_order() -> None:
+    cache = memo._LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    assert cache.set("c", 3) == 1
+    assert dict(cache.items()) == {"a": 1, "c": 3}
+
+
+def test_arc_resists_scans() -> None:
+    lru = memo._LRUCache(100)
+    arc = memo._ARCCache(100)
+    hits = {"lru": 0, "arc": 0}
+    # a small working set, used twice at a time, between long scans of keys
+    # used once
+    scan = iter(range(1000, 100_000))
+    for _ in range(50):
+        for key in [*range(50), *range(50), *(next(scan) for _ in range(200))]:
+            for name, cache in [("lru", lru), ("arc", arc)]:
+                if cache.get(key, memo._MISSING) is memo._MISSING:
+                    cache.set(key, key)
+                else:
+                    hits[name] += 1
+            assert len(arc) <= 100
+    # LRU only hits on the second use, while ARC keeps the working set
+    assert hits["lru"] == 50 * 50
+    assert hits["arc"] > 1.9 * 50 * 50
+
+
+def test_memoize_persist(tmp_path) -> None:
+    path = tmp_path / "square.pickle"
+    calls = []
+
+    def square(n: int) -> int:
+        calls.append(n)
+        return n * n
+
+    persisted = common.memoize(persist=path)(square)
+    assert persisted(3) == 9
+    persisted.cache_clear()
+    assert path.exists()
+    # a later run loads the saved results
+    assert common.memoize(persist=path)(square)(3) == 9
+    assert calls == [3]
+
+
+def test_memo_scope() -> None:
+    with common.memo_scope() as stats:
+        fib(10)
+        Grid(3).paths(0, 0)
+    assert set(stats) == {f"{__name__}.fib", f"{__name__}.Grid.paths"}
+    assert stats[f"{__name__}.fib"].misses == 11
+    assert fib.cache_info().size == 0
+
+
+def test_memoize_counted(monkeypatch) -> None:
+    monkeypatch.setattr(profiling, "_COUNTED", {})
+    common.counted(Grid.paths)
+    with common.count_calls() as counts:
+        Grid(2).paths(0, 0)
+    # calls that hit the cache are counted too
+    assert counts == {f"{__name__}.Grid.paths": 9}
+    assert Grid.paths.cache_info().misses == 8
+
+
+def test_run_solver_scopes_caches(tmp_path) -> None:
+    (tmp_path / "input.txt").write_text("???.### 1,1,3\n.??..??...?##. 1,1,3\n")
+    result = runners.run_solver(
+        runners.Solver(2023, 12, "process"), input_dir=tmp_path, profile="cprofile"
+    )
+    assert result.status == "ok", result.error
+    assert result.cache_stats[f"{day_12.__name__}.arrangements"].misses > 0
+    assert day_12.arrangements.cache_info().size == 0
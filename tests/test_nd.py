@@ -0,0 +1,122 @@
+import itertools
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from advent_of_code import common
+from advent_of_code.common import Coords, CoordsArray
+
+POINTS = [Coords(0, 0, 0), Coords(1, 2, 3), Coords(-4, 5, -6), Coords(7, -8, 9)]
+
+
+def test_coords_array_round_trip() -> None:
+    array = CoordsArray.from_coords(POINTS)
+    assert array.array.shape == (4, 3)
+    assert array.to_coords() == POINTS
+    assert array.to_set() == set(POINTS)
+    assert list(array) == POINTS
+    assert array[1] == Coords(1, 2, 3)
+    assert array[1:].to_coords() == POINTS[1:]
+
+
+def test_coords_array_2d_and_empty() -> None:
+    assert CoordsArray([(1, 2), (3, 4)]).to_coords() == [Coords(1, 2), Coords(3, 4)]
+    assert len(CoordsArray.from_coords([])) == 0
+
+
+def test_coords_array_arithmetic() -> None:
+    array = CoordsArray.from_coords(POINTS)
+    assert (array + Coords(1, 1, 1)).to_coords() == [
+        p + Coords(1, 1, 1) for p in POINTS
+    ]
+    assert (array + array).to_coords() == [p + p for p in POINTS]
+    assert (array * 3).to_coords() == [p * 3 for p in POINTS]
+    assert (array - array).to_set() == {Coords(0, 0, 0)}
+
+
+def test_coords_array_distance_matrices() -> None:
+    array = CoordsArray.from_coords(POINTS)
+    for chunk_rows in (None, 1, 3):
+        manhattan = array.manhattan_distance_matrix(chunk_rows=chunk_rows)
+        euclidean = array.distance_matrix(chunk_rows=chunk_rows)
+        for (i, a), (j, b) in itertools.product(enumerate(POINTS), repeat=2):
+            assert manhattan[i, j] == a.manhattan_distance_to(b)
+            assert euclidean[i, j] == a.distance_to(b)
+
+
+def test_coords_array_distance_to_other() -> None:
+    array = CoordsArray.from_coords(POINTS)
+    other = CoordsArray.from_coords([Coords(1, 1, 1)])
+    assert array.manhattan_distance_matrix(other).shape == (4, 1)
+    assert array.squared_distance_matrix(other)[:, 0].tolist() == [3, 5, 90, 181]
+
+
+def test_coords_array_neighbours() -> None:
+    array = CoordsArray.from_coords([Coords(0, 0), Coords(5, 5)])
+    four = array.neighbours()
+    assert four[:4].to_coords() == common.FOUR_POINT_DIRECTION_COORDS
+    assert four[4:].to_coords() == [
+        Coords(5, 5) + d for d in common.FOUR_POINT_DIRECTION_COORDS
+    ]
+    eight = array.neighbours(common.EIGHT_POINT_DIRECTION_COORDS)
+    assert len(eight) == 16
+    assert len(CoordsArray(np.zeros((3, 3))).neighbours().unique()) == 4
+
+
+@dataclass(frozen=True)
+class DictCoords:
+    # the shape of Coords before it was slotted
+    x: int
+    y: int
+    z: int = 0
+
+
+def test_coords_are_slotted() -> None:
+    coords = Coords(1, 2)
+    assert not hasattr(coords, "__dict__")
+    assert coords - Coords(3, 3) == Coords(-2, -1)
+
+    def make(cls):
+        return lambda n: cls(n % 256, n // 256 % 256)
+
+    slotted = common.memory_per_object(make(Coords), 20_000)
+    unslotted = common.memory_per_object(make(DictCoords), 20_000)
+    assert slotted < unslotted * 0.75
+
+
+def test_coords_pool() -> None:
+    pool = common.CoordsPool(3, 2, origin=Coords(-1, 0))
+    assert pool.get(0, 1) is pool.get(0, 1)
+    assert pool.intern(Coords(-1, 0)) is pool.get(-1, 0)
+    assert pool.get(0, 1) == Coords(0, 1)
+    assert len(pool) == 2
+    # outside the grid
+    assert pool.get(2, 0) is not pool.get(2, 0)
+    assert pool.get(-2, 0) == Coords(-2, 0)
+    assert len(pool) == 2
+
+
+@pytest.mark.parametrize("dims", [2, 3])
+def test_iter_pairs_by_distance(dims) -> None:
+    rng = np.random.default_rng(0)
+    array = CoordsArray(rng.integers(0, 40, (150, dims)))
+    batches = list(array.iter_pairs_by_distance(batch_size=100))
+    assert len(batches) > 1
+    pairs = [
+        (distance, first, second)
+        for batch in batches
+        for distance, first, second in zip(*(part.tolist() for part in batch))
+    ]
+    squared = array.squared_distance_matrix()
+    assert pairs == sorted(
+        (int(squared[a, b]), a, b) for a, b in itertools.combinations(range(150), 2)
+    )
+
+
+def test_iter_pairs_by_distance_few_points() -> None:
+    assert list(CoordsArray([(1, 2, 3)]).iter_pairs_by_distance()) == []
+    ((distances, firsts, seconds),) = CoordsArray(
+        [(1, 2, 3), (1, 2, 3)]
+    ).iter_pairs_by_distance()
+    assert (distances.tolist(), firsts.tolist(), seconds.tolist()) == ([0], [0], [1])
@@ -0,0 +1,126 @@
+import functools
+import time
+from collections import Counter
+
+import pytest
+
+from advent_of_code import common
+from advent_of_code.common import profiling, runners
+from advent_of_code.puzzles.year_2023.day_12 import process as day_12
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # keep functions registered here out of other tests' profiled runs
+    monkeypatch.setattr(profiling, "_COUNTED", dict(profiling._COUNTED))
+
+
+def fib(n: int) -> int:
+    return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+
+@functools.cache
+def cached_fib(n: int) -> int:
+    return n if n < 2 else cached_fib(n - 1) + cached_fib(n - 2)
+
+
+class Walker:
+    def walk(self, steps: int) -> int:
+        return 0 if not steps else 1 + self.walk(steps - 1)
+
+
+def test_counted_returns_the_function(registry) -> None:
+    assert common.counted(fib) is fib
+
+
+def test_count_calls(registry) -> None:
+    common.counted(fib)
+    common.counted(Walker.walk)
+    with common.count_calls() as counts:
+        fib(10)
+        Walker().walk(5)
+    assert counts == {f"{__name__}.fib": 177, f"{__name__}.Walker.walk": 6}
+    # the originals are restored afterwards
+    assert globals()["fib"] is fib
+    assert vars(Walker)["walk"] is profiling._COUNTED[f"{__name__}.Walker.walk"]
+
+
+def test_count_calls_needs_outermost_decorator(registry) -> None:
+    common.counted(cached_fib.__wrapped__)  # ty: ignore[invalid-argument-type]
+    with pytest.raises(ValueError, match="outermost"):
+        with common.count_calls():
+            pass
+    assert globals()["fib"] is fib
+
+
+def test_format_collapsed() -> None:
+    stacks = Counter({("a", "b"): 3, ("a",): 1, ("c",): 0})
+    assert common.format_collapsed(stacks) == "a 1\na;b 3\n"
+
+
+def busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_profiler_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        common.Profiler()  # ty: ignore[call-non-callable]
+
+
+def test_sampling_profiler() -> None:
+    profiler = common.SamplingProfiler(interval=0.001)
+    with profiler.profiling():
+        busy(0.2)
+    assert profiler.stacks
+    assert all(stack[0] == f"{__name__}:busy" for stack in profiler.stacks)
+    assert f"{__name__}:busy" in profiler.summary()
+
+
+def test_tracemalloc_profiler() -> None:
+    profiler = common.TracemallocProfiler()
+    with profiler.profiling():
+        data = [bytearray(1000) for _ in range(1000)]
+        profiler.checkpoint()
+        del data
+    assert profiler.snapshot is not None
+    stacks = profiler.stacks()
+    assert sum(stacks.values()) >= 1_000_000
+    assert any(stack[-1].startswith("test_profiling.py:") for stack in stacks)
+
+
+def test_cprofiler() -> None:
+    profiler = common.CProfiler()
+    with profiler.profiling():
+        fib(15)
+    assert "fib" in profiler.summary()
+
+
+@pytest.mark.parametrize("profile", sorted(common.PROFILERS))
+def test_run_solver_with_profile(tmp_path, profile) -> None:
+    (tmp_path / "input.txt").write_text("???.### 1,1,3\n.??..??...?##. 1,1,3\n")
+    result = runners.run_solver(
+        runners.Solver(2023, 12, "process"),
+        track_memory=True,
+        input_dir=tmp_path,
+        profile=profile,
+        profile_dir=tmp_path / "profiles",
+    )
+    assert result.status == "ok", result.error
+    assert result.call_counts[f"{day_12.__name__}.arrangements"] > 0
+    assert result.profile_summary is not None
+    assert result.profile_path is not None
+    assert (tmp_path / "profiles").iterdir()
+    assert (
+        vars(day_12)["arrangements"]
+        is profiling._COUNTED[f"{day_12.__name__}.arrangements"]
+    )
+
+
+def test_run_solver_without_profile(tmp_path) -> None:
+    (tmp_path / "input.txt").write_text("???.### 1,1,3\n")
+    result = runners.run_solver(runners.Solver(2023, 12, "process"), input_dir=tmp_path)
+    assert result.status == "ok"
+    assert result.call_counts == {}
+    assert result.profile_summary is None
@@ -0,0 +1,79 @@
+import sys
+
+from advent_of_code.common import runners
+
+
+def test_parse_range_spec() -> None:
+    assert runners.parse_range_spec("2019-2021") == {2019, 2020, 2021}
+    assert runners.parse_range_spec("1,3-4,25") == {1, 3, 4, 25}
+
+
+def test_discover_solvers_filters_years_and_days() -> None:
+    solvers = runners.discover_solvers(years=[2018], days=[3])
+    assert [solver.id for solver in solvers] == [
+        "2018/03/process",
+        "2018/03/process2",
+        "2018/03/process_refactored",
+    ]
+
+
+def test_discover_solvers_full_catalogue_is_sorted() -> None:
+    solvers = runners.discover_solvers()
+    assert solvers == sorted(solvers)
+    assert {solver.year for solver in solvers} >= {2015, 2019, 2025}
+
+
+def test_answer_recorder_splits_parts_on_lines() -> None:
+    recorder = runners._AnswerRecorder(track_memory=False)
+    print("part one: 1", file=recorder)
+    print(file=recorder)
+    recorder.write("part two: ")
+    recorder.write("2")
+    recorder.close()
+    assert [part.answer for part in recorder.parts] == ["part one: 1", "part two: 2"]
+    assert [part.part for part in recorder.parts] == [1, 2]
+
+
+def test_timed_run_reports_to_stderr(capsys) -> None:
+    runners.timed_run(lambda: print("answer"))
+    out, err = capsys.readouterr()
+    assert out == "answer\n"
+    assert err.startswith("Ran in ")
+
+
+def test_longest_first_schedules_unknown_timings_first() -> None:
+    solvers = runners.discover_solvers(years=[2018], days=[3])
+    timings = {"2018/03/process": 1.0, "2018/03/process2": 5.0}
+    assert [solver.id for solver in runners._longest_first(solvers, timings)] == [
+        "2018/03/process_refactored",
+        "2018/03/process2",
+        "2018/03/process",
+    ]
+
+
+def test_run_solvers_parallel_keeps_input_order() -> None:
+    solvers = runners.discover_solvers(years=[2018], days=[3])
+    results = runners.run_solvers_parallel(
+        solvers, jobs=2, timings={"2018/03/process2": 5.0}, track_memory=False
+    )
+    assert [result.solver for result in results] == solvers
+
+
+def test_run_solver_script_module(tmp_path, monkeypatch) -> None:
+    # reads its input and prints its answer as it is imported
+    solver = runners.Solver(2018, 1, "process")
+    monkeypatch.delitem(sys.modules, solver.module_name, raising=False)
+    (tmp_path / "input.txt").write_text("+1\n-2\n+3\n+1\n")
+    for _ in range(2):
+        result = runners.run_solver(solver, track_memory=False, input_dir=tmp_path)
+        assert result.status == "ok", result.error
+        assert [part.answer for part in result.parts] == ["3"]
+
+
+def test_run_solver_script_module_calling_main(tmp_path, monkeypatch) -> None:
+    # prints what main() returns, rather than main() printing it
+    solver = runners.Solver(2018, 1, "process2")
+    monkeypatch.delitem(sys.modules, solver.module_name, raising=False)
+    (tmp_path / "input.txt").write_text("+1\n-2\n+3\n+1\n")
+    result = runners.run_solver(solver, track_memory=False, input_dir=tmp_path)
+    assert [part.answer for part in result.parts] == ["freq: 2; iteration: 5"]
@@ -0,0 +1,168 @@
+import pytest
+
+from advent_of_code import common
+
+# a 5x4 grid, with locations indexed y * 5 + x
+GRID = """\
+.....
+.###.
+...#.
+.#..."""
+WIDTH = 5
+HEIGHT = 4
+
+
+def grid_neighbours(location: int) -> list[int]:
+    y, x = divmod(location, WIDTH)
+    neighbours = []
+    for next_x, next_y in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
+        if 0 <= next_x < WIDTH and 0 <= next_y < HEIGHT:
+            next_location = next_y * WIDTH + next_x
+            if GRID.replace("\n", "")[next_location] == ".":
+                neighbours.append(next_location)
+    return neighbours
+
+
+def weighted_neighbours(location: int) -> list[tuple[int, int]]:
+    # moving down the left column is expensive
+    return [
+        (neighbour, 10 if location % WIDTH == neighbour % WIDTH == 0 else 1)
+        for neighbour in grid_neighbours(location)
+    ]
+
+
+def manhattan_to_end(location: int) -> int:
+    y, x = divmod(location, WIDTH)
+    return (WIDTH - 1 - x) + (HEIGHT - 1 - y)
+
+
+END = WIDTH * HEIGHT - 1
+
+
+def test_bfs_goal() -> None:
+    result = common.bfs(0, grid_neighbours, is_goal=lambda location: location == END)
+    assert result.found
+    assert (result.goal, result.cost) == (END, 7)
+    assert result.stats.nodes_expanded > 0
+    assert result.stats.peak_frontier >= 1
+
+
+def test_bfs_distances() -> None:
+    result = common.bfs(0, grid_neighbours)
+    assert not result.found
+    assert result.cost is None
+    # every open space is reachable
+    assert len(result.distances) == GRID.count(".")
+    assert result.distances[10] == 2
+    assert result.distances[END] == 7
+
+
+def test_bfs_max_depth() -> None:
+    result = common.bfs(0, grid_neighbours, max_depth=2)
+    assert sorted(result.distances) == [0, 1, 2, 5, 10]
+
+
+@pytest.mark.parametrize("queue", ["heap", "bucket"])
+def test_dijkstra(queue) -> None:
+    result = common.dijkstra(
+        0, weighted_neighbours, is_goal=lambda location: location == END, queue=queue
+    )
+    # along the top and down the right is cheaper than the left column
+    assert result.cost == 7
+    assert common.dijkstra(0, weighted_neighbours, queue=queue).distances[15] == 22
+
+
+@pytest.mark.parametrize("queue", ["heap", "bucket"])
+def test_astar(queue) -> None:
+    dijkstra = common.dijkstra(
+        0, weighted_neighbours, is_goal=lambda location: location == END
+    )
+    astar = common.astar(
+        0,
+        weighted_neighbours,
+        is_goal=lambda location: location == END,
+        heuristic=manhattan_to_end,
+        queue=queue,
+    )
+    assert astar.cost == dijkstra.cost
+    assert astar.stats.nodes_expanded <= dijkstra.stats.nodes_expanded
+
+
+def test_astar_inconsistent_heuristic() -> None:
+    # "b" is first reached the expensive way, as the heuristic overestimates
+    # the drop from "a" to "b", and must be expanded again once "a" is
+    edges = {
+        "s": [("a", 1), ("b", 3)],
+        "a": [("b", 1)],
+        "b": [("g", 3)],
+        "g": [],
+    }
+    heuristic = {"s": 0, "a": 4, "b": 0, "g": 0}
+    result = common.astar(
+        "s",
+        edges.__getitem__,
+        is_goal=lambda state: state == "g",
+        heuristic=heuristic.__getitem__,
+    )
+    assert result.cost == 5
+
+
+def test_dijkstra_unreachable() -> None:
+    result = common.dijkstra(0, weighted_neighbours, is_goal=lambda location: False)
+    assert not result.found
+    assert result.cost is None
+
+
+def test_bidirectional_bfs() -> None:
+    result = common.bidirectional_bfs(0, END, grid_neighbours)
+    assert result.cost == 7
+    assert result.goal in common.bfs(0, grid_neighbours).distances
+    assert common.bidirectional_bfs(0, 0, grid_neighbours).cost == 0
+
+
+def test_bidirectional_bfs_directed() -> None:
+    # n -> n + 1 and n -> 2n, so going back needs the reverse moves
+    def forward(n: int) -> list[int]:
+        return [n + 1, n * 2]
+
+    def reverse(n: int) -> list[int]:
+        return [n - 1] + ([n // 2] if n % 2 == 0 else [])
+
+    result = common.bidirectional_bfs(1, 100, forward, reverse)
+    assert result.cost == common.bfs(1, forward, is_goal=lambda n: n == 100).cost
+
+
+def test_bidirectional_bfs_unreachable() -> None:
+    # two separate paths, 0 - 1 - 2 and 3 - 4
+    def neighbours(n: int) -> list[int]:
+        return [m for m in [n - 1, n + 1] if m // 3 == n // 3 and 0 <= m < 5]
+
+    result = common.bidirectional_bfs(0, 4, neighbours)
+    assert not result.found
+
+
+def test_state_packer() -> None:
+    packer = common.StatePacker(20, 5, 11)
+    assert packer.size == 20 * 5 * 11
+    states = {
+        packer.pack(location, direction, steps)
+        for location in range(20)
+        for direction in range(5)
+        for steps in range(11)
+    }
+    assert states == set(range(packer.size))
+    assert packer.unpack(packer.pack(13, 4, 7)) == (13, 4, 7)
+
+
+def test_bucket_queue() -> None:
+    queue = common.BucketQueue()
+    for priority, item in [(3, "c"), (1, "a"), (3, "d"), (2, "b")]:
+        queue.push(priority, item)
+    assert len(queue) == 4
+    assert queue.pop() == (1, "a")
+    assert queue.pop() == (2, "b")
+    with pytest.raises(ValueError):
+        queue.push(1, "too late")
+    assert sorted([queue.pop(), queue.pop()]) == [(3, "c"), (3, "d")]
+    with pytest.raises(IndexError):
+        queue.pop()